@@ -13,7 +13,7 @@ package.domain = com.fisikasmp
 source.dir = .
 
 # File utama
-source.include_exts = py,png,jpg,kv,atlas,ttf
+source.include_exts = py,png,jpg,kv,atlas,ttf,json
 
 # Versi aplikasi
 version = 1.0
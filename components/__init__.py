@@ -2,6 +2,8 @@
 Package untuk komponen UI yang dapat digunakan ulang
 """
 
+from .backgrounds import RoundedBackground
+
 from .buttons import (
     PrimaryButton,
     SecondaryButton,
@@ -13,10 +15,25 @@ from .buttons import (
 from .cards import (
     Card,
     FormulaCard,
+    FormulaCardView,
+    SectionHeaderView,
     FeatureCard,
     InfoCard
 )
 
+from .live import LiveCalculation
+
+from .lists import (
+    CardList,
+    RecycleItemBehavior
+)
+
+from .navigation import LazyScreenManager
+
+from .scroll import StableScrollView
+
+from .view_cache import ViewCache
+
 from .inputs import (
     NumberInput,
     UnitInput,
@@ -24,6 +41,7 @@ from .inputs import (
 )
 
 __all__ = [
+    'RoundedBackground',
     'PrimaryButton',
     'SecondaryButton',
     'OutlineButton',
@@ -31,8 +49,16 @@ __all__ = [
     'FloatingActionButton',
     'Card',
     'FormulaCard',
+    'FormulaCardView',
+    'SectionHeaderView',
     'FeatureCard',
     'InfoCard',
+    'LiveCalculation',
+    'CardList',
+    'RecycleItemBehavior',
+    'LazyScreenManager',
+    'StableScrollView',
+    'ViewCache',
     'NumberInput',
     'UnitInput',
     'SearchInput'
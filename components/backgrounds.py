@@ -0,0 +1,112 @@
+"""
+Helper background rounded + border untuk komponen
+
+Instruksi canvas dibuat sekali per widget lalu hanya diperbarui saat posisi,
+ukuran, warna, atau radius berubah, tanpa canvas.clear() dan tanpa
+membuat instruksi baru.
+
+Contoh:
+    self.background = RoundedBackground(
+        self.text_input,
+        bg_color=Colors.WHITE,
+        border_color=Colors.GRAY_LIGHT,
+        radius=Spacing.RADIUS_SM
+    )
+    self.background.set_colors(border_color=Colors.DANGER)
+
+Objek RoundedBackground harus disimpan (misalnya sebagai atribut widget):
+Kivy menyimpan callback bind() sebagai weak reference.
+"""
+
+from kivy.graphics import Color, InstructionGroup, Line, RoundedRectangle
+
+from app_ui import Spacing
+
+
+class RoundedBackground:
+    """
+    Background rounded dengan border opsional yang mengikuti pos/size widget
+
+    Args:
+        widget: Widget yang diberi background
+        bg_color: Warna isi (None = tanpa isi)
+        border_color: Warna border (None = tanpa border)
+        radius: Radius sudut
+        border_width: Tebal garis border
+        canvas: Canvas tujuan (default widget.canvas.before)
+        border_on_top: Taruh border di widget.canvas.after agar di atas children
+        offset: Geser (x, y) dari posisi widget, misalnya untuk bayangan
+        size: Ukuran tetap yang diletakkan di tengah widget (default ukuran widget)
+    """
+
+    def __init__(self, widget, bg_color=None, border_color=None, radius=Spacing.RADIUS_MD,
+                 border_width=1, canvas=None, border_on_top=False, offset=(0, 0), size=None):
+        self.widget = widget
+        self.radius = radius
+        self.offset = offset
+        self.fixed_size = size
+
+        canvas = widget.canvas.before if canvas is None else canvas
+
+        self.bg_color = None
+        self.rect = None
+        if bg_color is not None:
+            group = InstructionGroup()
+            self.bg_color = Color(*bg_color)
+            self.rect = RoundedRectangle(radius=[radius])
+            group.add(self.bg_color)
+            group.add(self.rect)
+            canvas.add(group)
+
+        self.border_color = None
+        self.border = None
+        if border_color is not None:
+            group = InstructionGroup()
+            self.border_color = Color(*border_color)
+            self.border = Line(width=border_width)
+            group.add(self.border_color)
+            group.add(self.border)
+            (widget.canvas.after if border_on_top else canvas).add(group)
+
+        widget.bind(pos=self.update, size=self.update)
+        self.update()
+
+    def geometry(self):
+        """(x, y, width, height) area background"""
+        widget = self.widget
+        if self.fixed_size is None:
+            width, height = widget.size
+            x, y = widget.pos
+        else:
+            width, height = self.fixed_size
+            x = widget.center_x - width / 2
+            y = widget.center_y - height / 2
+        return x + self.offset[0], y + self.offset[1], width, height
+
+    def update(self, *args):
+        """Menyesuaikan instruksi dengan pos/size widget"""
+        x, y, width, height = self.geometry()
+        if self.rect is not None:
+            self.rect.pos = (x, y)
+            self.rect.size = (width, height)
+        if self.border is not None:
+            self.border.rounded_rectangle = (x, y, width, height, self.radius)
+
+    def set_colors(self, bg_color=None, border_color=None):
+        """Mengganti warna isi dan/atau border"""
+        if bg_color is not None and self.bg_color is not None:
+            self.bg_color.rgba = bg_color
+        if border_color is not None and self.border_color is not None:
+            self.border_color.rgba = border_color
+
+    def set_radius(self, radius):
+        """Mengganti radius sudut"""
+        if radius == self.radius:
+            return
+        self.radius = radius
+        if self.rect is not None:
+            self.rect.radius = [radius]
+        self.update()
+
+
+__all__ = ['RoundedBackground']
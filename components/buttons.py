@@ -5,13 +5,12 @@ Komponen button custom dengan berbagai style
 from kivy.uix.button import Button
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.graphics import Color, RoundedRectangle, Line
 from kivy.properties import ListProperty, StringProperty, NumericProperty
 from kivy.animation import Animation
 from kivy.metrics import dp, sp
-from kivy.clock import Clock
 
 from app_ui import Colors, Fonts, Spacing, Styles
+from components.backgrounds import RoundedBackground
 
 class PrimaryButton(Button):
     """Button primary dengan style modern"""
@@ -32,10 +31,18 @@ class PrimaryButton(Button):
         self.font_size = Fonts.BODY
         self.bold = True
         
+        # Background dan border dibuat sekali, lalu hanya diperbarui
+        bg_color, border_color = self.canvas_colors()
+        self.background = RoundedBackground(
+            self,
+            bg_color=bg_color,
+            border_color=border_color,
+            radius=self.radius,
+            border_width=1.5
+        )
+        
         # Bind properties
         self.bind(
-            pos=self.update_canvas,
-            size=self.update_canvas,
             bg_color=self.update_canvas,
             radius=self.update_canvas
         )
@@ -43,29 +50,16 @@ class PrimaryButton(Button):
         # Animation for press effect
         self.bind(on_press=self.animate_press)
         self.bind(on_release=self.animate_release)
-        
-        # Initial canvas update
-        Clock.schedule_once(lambda dt: self.update_canvas(), 0.1)
+    
+    def canvas_colors(self):
+        """Warna (background, border) button"""
+        return self.bg_color, self.bg_color
     
     def update_canvas(self, *args):
-        """Update canvas dengan rounded rectangle"""
-        self.canvas.before.clear()
-        
-        with self.canvas.before:
-            # Background
-            Color(*self.bg_color)
-            RoundedRectangle(
-                pos=self.pos,
-                size=self.size,
-                radius=[self.radius]
-            )
-            
-            # Border
-            Color(*self.bg_color)
-            Line(
-                rounded_rectangle=(self.x, self.y, self.width, self.height, self.radius),
-                width=1.5
-            )
+        """Update warna dan radius background tanpa membuat instruksi baru"""
+        bg_color, border_color = self.canvas_colors()
+        self.background.set_colors(bg_color, border_color)
+        self.background.set_radius(self.radius)
     
     def animate_press(self, instance):
         """Animasi saat button ditekan"""
@@ -100,25 +94,9 @@ class OutlineButton(PrimaryButton):
         self.bg_color = Colors.WHITE
         self.text_color = Colors.PRIMARY
     
-    def update_canvas(self, *args):
-        """Override update_canvas untuk outline saja"""
-        self.canvas.before.clear()
-        
-        with self.canvas.before:
-            # Background transparan
-            Color(1, 1, 1, 1)
-            RoundedRectangle(
-                pos=self.pos,
-                size=self.size,
-                radius=[self.radius]
-            )
-            
-            # Border
-            Color(*Colors.PRIMARY)
-            Line(
-                rounded_rectangle=(self.x, self.y, self.width, self.height, self.radius),
-                width=1.5
-            )
+    def canvas_colors(self):
+        """Background putih dengan border warna primary"""
+        return Colors.WHITE, Colors.PRIMARY
 
 class IconButton(BoxLayout):
     """Button dengan ikon dan teks"""
@@ -156,27 +134,17 @@ class IconButton(BoxLayout):
         self.add_widget(text_label)
         
         # Background
-        with self.canvas.before:
-            Color(*style['bg_color'])
-            self.rect = RoundedRectangle(
-                pos=self.pos,
-                size=self.size,
-                radius=[Spacing.RADIUS_MD]
-            )
-        
-        # Binding untuk interaksi
-        self.bind(pos=self.update_rect, size=self.update_rect)
+        self.background = RoundedBackground(
+            self,
+            bg_color=style['bg_color'],
+            radius=Spacing.RADIUS_MD
+        )
         
         # Touch event
         if on_press:
             self.bind(on_touch_down=self.on_touch)
             self.callback = on_press
     
-    def update_rect(self, *args):
-        """Update background rectangle"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-    
     def on_touch(self, instance, touch):
         """Handle touch event"""
         if self.collide_point(*touch.pos):
@@ -218,32 +186,21 @@ class FloatingActionButton(Button):
         # Position (bisa diatur dari parent)
         self.pos_hint = {'right': 0.9, 'y': 0.1}
         
-        # Background circle
-        with self.canvas.before:
-            Color(*Colors.PRIMARY)
-            self.circle = RoundedRectangle(
-                pos=self.pos,
-                size=self.size,
-                radius=[dp(28)]
-            )
-        
-        # Shadow effect (simulasi)
-        with self.canvas.after:
-            Color(0, 0, 0, 0.2)
-            RoundedRectangle(
-                pos=(self.x, self.y - dp(2)),
-                size=self.size,
-                radius=[dp(28)]
-            )
-        
-        self.bind(pos=self.update_circle, size=self.update_circle)
+        # Shadow effect (simulasi) di bawah background circle
+        self.shadow = RoundedBackground(
+            self,
+            bg_color=(0, 0, 0, 0.2),
+            radius=dp(28),
+            offset=(0, -dp(2))
+        )
+        self.background = RoundedBackground(
+            self,
+            bg_color=Colors.PRIMARY,
+            radius=dp(28)
+        )
         
         if on_press:
             self.bind(on_press=on_press)
-    
-    def update_circle(self, *args):
-        """Update circle position"""
-        self.circle.pos = self.pos
 
 # Export semua button class
 __all__ = [
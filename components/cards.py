@@ -6,11 +6,14 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.graphics import Color, RoundedRectangle, Line
+from kivy.uix.widget import Widget
+from kivy.uix.behaviors import ButtonBehavior
 from kivy.properties import ListProperty, NumericProperty, StringProperty
 from kivy.metrics import dp, sp  # TAMBAHKAN INI
 
 from app_ui import Colors, Fonts, Spacing
+from components.backgrounds import RoundedBackground
+from components.lists import RecycleItemBehavior
 
 class Card(BoxLayout):
     """Card dasar dengan rounded corners dan shadow"""
@@ -26,37 +29,39 @@ class Card(BoxLayout):
         self.padding = Spacing.MD
         self.spacing = Spacing.SM
         
-        # Background dengan rounded corners
-        with self.canvas.before:
-            Color(*self.bg_color)
-            self.rect = RoundedRectangle(
-                pos=self.pos,
-                size=self.size,
-                radius=[self.radius]
+        # Shadow effect (simplified) di bawah background
+        self.shadow = None
+        if self.elevation > 0:
+            self.shadow = RoundedBackground(
+                self,
+                bg_color=(0, 0, 0, 0.1),
+                radius=self.radius,
+                offset=(0, -dp(2))
             )
-            
-            # Shadow effect (simplified)
-            if self.elevation > 0:
-                Color(0, 0, 0, 0.1)
-                self.shadow = RoundedRectangle(
-                    pos=(self.x, self.y - dp(2)),
-                    size=self.size,
-                    radius=[self.radius]
-                )
-        
-        self.bind(pos=self.update_rect, size=self.update_rect)
+        
+        # Background dengan rounded corners
+        self.background = RoundedBackground(
+            self,
+            bg_color=self.bg_color,
+            radius=self.radius
+        )
+        
+        self.bind(bg_color=self.update_background, radius=self.update_background)
     
-    def update_rect(self, *args):
-        """Update rectangle position and size"""
-        self.rect.pos = self.pos
-        self.rect.size = self.size
-        if hasattr(self, 'shadow'):
-            self.shadow.pos = (self.x, self.y - dp(2))
-            self.shadow.size = self.size
+    def update_background(self, *args):
+        """Update warna dan radius background"""
+        self.background.set_colors(bg_color=self.bg_color)
+        self.background.set_radius(self.radius)
+        if self.shadow is not None:
+            self.shadow.set_radius(self.radius)
 
 class FormulaCard(Card):
     """Card khusus untuk menampilkan rumus"""
     
+    title = StringProperty('')
+    formula = StringProperty('')
+    category = StringProperty('')
+    
     def __init__(self, title='', formula='', category='', on_press=None, **kwargs):
         super().__init__(**kwargs)
         
@@ -95,13 +100,11 @@ class FormulaCard(Card):
         )
         
         # Badge kecil untuk kategori
-        with category_layout.canvas.before:
-            Color(*Colors.PRIMARY_LIGHT)
-            RoundedRectangle(
-                pos=category_layout.pos,
-                size=category_layout.size,
-                radius=[dp(12)]
-            )
+        category_layout.background = RoundedBackground(
+            category_layout,
+            bg_color=Colors.PRIMARY_LIGHT,
+            radius=dp(12)
+        )
         
         category_label = Label(
             text=category,
@@ -112,6 +115,16 @@ class FormulaCard(Card):
         )
         category_layout.add_widget(category_label)
         
+        # Teks mengikuti property agar card bisa dipakai ulang dengan data lain
+        self.bind(
+            title=title_label.setter('text'),
+            formula=formula_label.setter('text'),
+            category=category_label.setter('text')
+        )
+        self.title = title
+        self.formula = formula
+        self.category = category
+        
         self.add_widget(title_label)
         self.add_widget(formula_label)
         self.add_widget(category_layout)
@@ -126,6 +139,57 @@ class FormulaCard(Card):
             overlay.bind(on_press=on_press)
             self.add_widget(overlay)
 
+class FormulaCardView(RecycleItemBehavior, ButtonBehavior, FormulaCard):
+    """FormulaCard untuk CardList; data baris: title, formula, category"""
+    
+    def on_release(self):
+        self.select()
+
+class SectionHeaderView(RecycleItemBehavior, BoxLayout):
+    """Judul bagian untuk CardList; data baris: title, count"""
+    
+    title = StringProperty('')
+    count = StringProperty('')
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        
+        self.size_hint_y = None
+        self.height = dp(50)
+        self.spacing = Spacing.SM
+        
+        line = Widget(size_hint_x=None, width=dp(4))
+        line.background = RoundedBackground(
+            line,
+            bg_color=Colors.PRIMARY,
+            radius=dp(2),
+            canvas=line.canvas
+        )
+        
+        label = Label(
+            text=self.title,
+            font_size=Fonts.H4,
+            bold=True,
+            color=Colors.DARK,
+            size_hint_x=1,
+            halign='left'
+        )
+        label.bind(size=label.setter('text_size'))
+        
+        count = Label(
+            text=self.count,
+            font_size=Fonts.BODY_SMALL,
+            color=Colors.GRAY,
+            size_hint_x=None,
+            width=dp(40)
+        )
+        
+        self.bind(title=label.setter('text'), count=count.setter('text'))
+        
+        self.add_widget(line)
+        self.add_widget(label)
+        self.add_widget(count)
+
 class FeatureCard(Card):
     """Card untuk menampilkan fitur aplikasi"""
     
@@ -142,13 +206,12 @@ class FeatureCard(Card):
             height=dp(60)
         )
         
-        with icon_layout.canvas.before:
-            Color(*color)
-            RoundedRectangle(
-                pos=(icon_layout.center_x - dp(25), icon_layout.center_y - dp(25)),
-                size=(dp(50), dp(50)),
-                radius=[dp(25)]
-            )
+        icon_layout.background = RoundedBackground(
+            icon_layout,
+            bg_color=color,
+            radius=dp(25),
+            size=(dp(50), dp(50))
+        )
         
         icon_label = Label(
             text=icon,
@@ -263,6 +326,8 @@ class InfoCard(Card):
 __all__ = [
     'Card',
     'FormulaCard',
+    'FormulaCardView',
+    'SectionHeaderView',
     'FeatureCard',
     'InfoCard'
 ]
\ No newline at end of file
@@ -6,16 +6,21 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.textinput import TextInput
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.graphics import Color, RoundedRectangle, Line
-from kivy.properties import ListProperty, NumericProperty, StringProperty
+from kivy.properties import ListProperty, NumericProperty, ObjectProperty, StringProperty
 from kivy.metrics import dp, sp
 
 from app_ui import Colors, Fonts, Spacing
+from components.backgrounds import RoundedBackground
+from physicalc.core.units import UnitError, conversion_table, unit_choices
+from physicalc.core.validation import PARSE_EMPTY, PARSE_ERROR_MESSAGES, PARSE_OK, parse_number_result
+from physicalc.ui import number_input_filter
 
 class NumberInput(BoxLayout):
     """Input field untuk angka dengan validasi"""
     
     value = StringProperty('0')
+    # Nilai hasil parse (float), None jika kosong/tidak valid
+    number = ObjectProperty(None, allownone=True)
     unit = StringProperty('')
     hint_text = StringProperty('Enter number')
     error = StringProperty('')
@@ -42,7 +47,7 @@ class NumberInput(BoxLayout):
             hint_text=self.hint_text,
             font_size=Fonts.BODY,
             multiline=False,
-            input_filter='float',
+            input_filter=number_input_filter,
             halign='right',
             size_hint_x=0.7,
             background_normal='',
@@ -59,29 +64,16 @@ class NumberInput(BoxLayout):
             size_hint_x=0.3
         )
         
-        # Background untuk input
-        with self.text_input.canvas.before:
-            Color(*Colors.WHITE)
-            self.input_rect = RoundedRectangle(
-                pos=self.text_input.pos,
-                size=self.text_input.size,
-                radius=[Spacing.RADIUS_SM]
-            )
-            
-            # Border di canvas yang sama
-            Color(*Colors.GRAY_LIGHT)
-            self.input_border = Line(
-                rounded_rectangle=(self.text_input.x, self.text_input.y,
-                                  self.text_input.width, self.text_input.height,
-                                  Spacing.RADIUS_SM),
-                width=1
-            )
-        
-        self.text_input.bind(
-            pos=self.update_input_bg,
-            size=self.update_input_bg,
-            text=self.on_text_change
+        # Background dan border input
+        self.input_background = RoundedBackground(
+            self.text_input,
+            bg_color=Colors.WHITE,
+            border_color=Colors.GRAY_LIGHT,
+            radius=Spacing.RADIUS_SM
         )
+        self.input_border_color = self.input_background.border_color
+        
+        self.text_input.bind(text=self.on_text_change)
         
         input_container.add_widget(self.text_input)
         input_container.add_widget(self.unit_label)
@@ -98,48 +90,43 @@ class NumberInput(BoxLayout):
         self.add_widget(input_container)
         self.add_widget(self.error_label)
     
-    def update_input_bg(self, instance, value):
-        """Update background input"""
-        self.input_rect.pos = instance.pos
-        self.input_rect.size = instance.size
-        self.input_border.rounded_rectangle = (instance.x, instance.y,
-                                              instance.width, instance.height,
-                                              Spacing.RADIUS_SM)
-    
     def on_text_change(self, instance, value):
         """Handle text change dengan validasi"""
         self.value = value
         self.error = ''
         self.error_label.text = ''
         
-        # Validasi
-        if value:
-            try:
-                float(value)
-                # Jika valid, ubah border menjadi hijau
-                self.input_border.rgba = Colors.SUCCESS
-            except ValueError:
-                self.error = 'Invalid number'
-                self.error_label.text = self.error
-                self.input_border.rgba = Colors.DANGER
+        # Validasi (satu kali parse); angka hasil parse disimpan di self.number
+        self.number, code = parse_number_result(value)
+        if code == PARSE_OK:
+            # Jika valid, ubah border menjadi hijau
+            self.input_border_color.rgba = Colors.SUCCESS
+        elif code == PARSE_EMPTY:
+            self.input_border_color.rgba = Colors.GRAY_LIGHT
         else:
-            self.input_border.rgba = Colors.GRAY_LIGHT
+            self.error = PARSE_ERROR_MESSAGES[code]
+            self.error_label.text = self.error
+            self.input_border_color.rgba = Colors.DANGER
     
     def get_value(self):
-        """Mendapatkan nilai sebagai float"""
-        try:
-            return float(self.value)
-        except ValueError:
-            return 0.0
+        """Mendapatkan nilai sebagai float (0.0 jika kosong/tidak valid)"""
+        value, code = parse_number_result(self.value)
+        return 0.0 if value is None else value
     
     def set_error(self, message):
         """Set error message"""
         self.error = message
         self.error_label.text = message
-        self.input_border.rgba = Colors.DANGER
+        self.input_border_color.rgba = Colors.DANGER
 
 class UnitInput(NumberInput):
-    """Input dengan unit yang bisa dipilih"""
+    """
+    Input dengan unit yang bisa dipilih
+    
+    Tanpa argumen units, pilihan diambil dari satuan umum yang sedimensi
+    dengan unit awal. Mengganti unit mengonversi nilai yang sudah diketik
+    memakai tabel faktor yang dihitung sekali saat widget dibuat.
+    """
     
     def __init__(self, units=None, **kwargs):
         super().__init__(**kwargs)
@@ -159,33 +146,34 @@ class UnitInput(NumberInput):
             background_normal=''
         )
         
-        with self.unit_dropdown.canvas.before:
-            Color(*Colors.GRAY_LIGHT)
-            self.unit_rect = RoundedRectangle(
-                pos=self.unit_dropdown.pos,
-                size=self.unit_dropdown.size,
-                radius=[Spacing.RADIUS_SM]
-            )
-        
-        self.unit_dropdown.bind(
-            pos=self.update_unit_bg,
-            size=self.update_unit_bg,
-            on_press=self.show_unit_dropdown
+        self.unit_background = RoundedBackground(
+            self.unit_dropdown,
+            bg_color=Colors.GRAY_LIGHT,
+            radius=Spacing.RADIUS_SM
         )
         
+        self.unit_dropdown.bind(on_press=self.show_unit_dropdown)
+        
         input_container.add_widget(self.unit_dropdown)
         self.add_widget(self.error_label)
         
-        # Daftar unit
-        self.units = units or [self.unit]
-    
-    def update_unit_bg(self, instance, value):
-        """Update background unit button"""
-        self.unit_rect.pos = instance.pos
-        self.unit_rect.size = instance.size
+        # Daftar unit dan tabel konversinya
+        self.units = list(units or unit_choices(self.unit))
+        self._dropdown = None
+        try:
+            self._factors = conversion_table(self.units)
+        except UnitError:
+            self._factors = {}
     
     def show_unit_dropdown(self, instance):
-        """Menampilkan dropdown unit"""
+        """Menampilkan dropdown unit (dibuat sekali, lalu dipakai ulang)"""
+        if self._dropdown is None:
+            self._dropdown = self.create_unit_dropdown()
+        if self._dropdown.parent is None:  # belum terbuka / sudah selesai ditutup
+            self._dropdown.open(instance)
+    
+    def create_unit_dropdown(self):
+        """Membuat dropdown berisi pilihan unit"""
         from kivy.uix.dropdown import DropDown
         
         dropdown = DropDown()
@@ -202,13 +190,27 @@ class UnitInput(NumberInput):
             btn.bind(on_release=lambda btn=btn: self.select_unit(btn.text, dropdown))
             dropdown.add_widget(btn)
         
-        dropdown.open(instance)
+        return dropdown
     
     def select_unit(self, unit, dropdown):
-        """Memilih unit"""
+        """Memilih unit dan mengonversi nilai yang sudah diketik"""
+        factor = self._factors.get((self.unit, unit))
+        value, code = parse_number_result(self.value)
+        if factor is not None and value is not None:
+            self.text_input.text = f"{value * factor:.10g}"
+        
         self.unit = unit
         self.unit_dropdown.text = unit
         dropdown.dismiss()
+    
+    def get_value_in(self, unit):
+        """Mendapatkan nilai sebagai float dalam unit tertentu"""
+        if unit == self.unit:
+            return self.get_value()
+        factor = self._factors.get((self.unit, unit))
+        if factor is None:
+            raise UnitError(f"Cannot convert {self.unit} to {unit}")
+        return self.get_value() * factor
 
 class SearchInput(BoxLayout):
     """Input field untuk pencarian"""
@@ -241,34 +243,18 @@ class SearchInput(BoxLayout):
             padding=[dp(10), dp(10)]
         )
         
-        # Background
-        with self.canvas.before:
-            Color(*Colors.WHITE)
-            self.bg_rect = RoundedRectangle(
-                pos=self.pos,
-                size=self.size,
-                radius=[Spacing.RADIUS_MD]
-            )
-        
-        # Border terpisah
-        with self.canvas.after:
-            Color(*Colors.GRAY_LIGHT)
-            self._border_line = Line(
-                rounded_rectangle=(self.x, self.y, self.width, self.height, Spacing.RADIUS_MD),
-                width=1
-            )
-        
-        self.bind(pos=self.update_bg, size=self.update_bg)
+        # Background, border di atas children
+        self.background = RoundedBackground(
+            self,
+            bg_color=Colors.WHITE,
+            border_color=Colors.GRAY_LIGHT,
+            radius=Spacing.RADIUS_MD,
+            border_on_top=True
+        )
         
         self.add_widget(icon)
         self.add_widget(self.text_input)
     
-    def update_bg(self, *args):
-        """Update background"""
-        self.bg_rect.pos = self.pos
-        self.bg_rect.size = self.size
-        self.border.rounded_rectangle = (self.x, self.y, self.width, self.height, Spacing.RADIUS_MD)
-    
     def get_text(self):
         """Mendapatkan teks pencarian"""
         return self.text_input.text
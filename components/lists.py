@@ -0,0 +1,81 @@
+"""
+Komponen daftar tervirtualisasi berbasis RecycleView
+
+Hanya widget yang terlihat di layar yang dibuat; saat di-scroll widget
+yang sama dipakai ulang dengan data baris berikutnya. Baris daftar berupa
+dictionary biasa, sehingga waktu build dan memori tidak bertambah seiring
+bertambahnya jumlah rumus.
+
+Contoh:
+    daftar = CardList(viewclass='FormulaCardView', item_height=dp(120))
+    daftar.data = [{'title': 'Kecepatan', 'formula': 'v = s / t'}, ...]
+    daftar.bind(on_item_press=lambda rv, index, data: ...)
+
+Baris boleh memakai viewclass berbeda dengan key 'viewclass' dan tinggi
+berbeda dengan key 'height'.
+"""
+
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.metrics import dp
+
+from app_ui import Spacing
+
+
+class RecycleItemBehavior(RecycleDataViewBehavior):
+    """Mixin untuk view yang dipakai ulang oleh CardList"""
+
+    index = None
+    list_view = None
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Dipanggil RecycleView saat view diisi data baris baru"""
+        self.index = index
+        self.list_view = rv
+        return super().refresh_view_attrs(rv, index, data)
+
+    def select(self, *args):
+        """Memberi tahu CardList bahwa baris ini dipilih"""
+        if self.list_view is not None and self.index is not None:
+            self.list_view.dispatch('on_item_press', self.index, self.list_view.data[self.index])
+
+
+class CardList(RecycleView):
+    """Daftar kartu tervirtualisasi dengan event on_item_press(index, data)"""
+
+    __events__ = ('on_item_press',)
+
+    def __init__(self, viewclass=None, item_height=dp(120), spacing=Spacing.MD,
+                 padding=Spacing.MD, **kwargs):
+        super().__init__(**kwargs)
+
+        self.do_scroll_x = False
+        self.bar_width = dp(4)
+
+        self.layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, item_height),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=spacing,
+            padding=padding,
+            key_viewclass='viewclass'
+        )
+        self.layout.bind(minimum_height=self.layout.setter('height'))
+        self.add_widget(self.layout)
+
+        if viewclass:
+            self.viewclass = viewclass
+
+    def on_item_press(self, index, data):
+        pass
+
+    @staticmethod
+    def row(viewclass=None, height=None, **fields):
+        """Menyusun satu baris data, opsional dengan viewclass dan tinggi sendiri"""
+        if viewclass:
+            fields['viewclass'] = viewclass
+        if height is not None:
+            fields['height'] = height
+        return fields
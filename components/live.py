@@ -0,0 +1,89 @@
+"""
+Perhitungan ulang otomatis saat pengguna mengetik
+
+Setiap perubahan input hanya memanggil satu Clock trigger; ketikan yang
+berdekatan digabung menjadi satu evaluasi setelah jeda singkat. Evaluasi
+juga dilewati jika nilai input (setelah diparse menjadi angka) sama dengan
+evaluasi sebelumnya, misalnya '2' -> '2.' -> '2.0'.
+
+Contoh:
+    self.live = LiveCalculation(self.read_inputs, self.show_live_result, self.clear_result)
+    self.live.watch(text_input)
+
+Objek LiveCalculation harus disimpan (misalnya sebagai atribut screen):
+Kivy menyimpan callback bind() sebagai weak reference.
+"""
+
+from kivy.clock import Clock
+
+# Jeda (detik) setelah ketikan terakhir sebelum hasil dihitung ulang
+DEFAULT_DELAY = 0.25
+
+_UNSET = object()
+
+
+def values_key(values):
+    """Kunci pembanding untuk {simbol: angka}"""
+    return tuple(sorted(values.items()))
+
+
+class LiveCalculation:
+    """
+    Menghitung ulang hasil saat input berubah, lewat satu Clock trigger
+
+    Args:
+        read_inputs: Fungsi tanpa argumen yang mengembalikan {simbol: angka},
+            atau None jika ada input yang kosong/belum valid
+        evaluate: Dipanggil dengan {simbol: angka} saat nilai berubah
+        incomplete: Dipanggil (opsional) saat input berubah menjadi tidak lengkap
+        delay: Jeda setelah ketikan terakhir
+    """
+
+    def __init__(self, read_inputs, evaluate, incomplete=None, delay=DEFAULT_DELAY):
+        self.read_inputs = read_inputs
+        self.evaluate = evaluate
+        self.incomplete = incomplete
+        self.enabled = True
+        self.evaluations = 0
+        self._last = _UNSET
+        self._trigger = Clock.create_trigger(self._run, delay)
+
+    def watch(self, widget, name='text'):
+        """Menghitung ulang setiap kali property widget berubah"""
+        widget.bind(**{name: self.schedule})
+
+    def schedule(self, *args):
+        """Menjadwalkan evaluasi (beberapa panggilan sebelum trigger jalan digabung)"""
+        if self.enabled:
+            self._trigger()
+
+    def reset(self, values=None):
+        """
+        Melupakan evaluasi terakhir
+
+        Dengan values, nilai tersebut dianggap sudah ditampilkan; dipakai saat
+        input diisi program (ganti rumus, clear) agar tidak langsung dihitung.
+        """
+        self._last = _UNSET if values is None else values_key(values)
+
+    def cancel(self):
+        """Membatalkan evaluasi yang sudah dijadwalkan"""
+        self._trigger.cancel()
+
+    def _run(self, dt):
+        values = self.read_inputs()
+        if values is None:
+            if self._last is not None and self.incomplete is not None:
+                self.incomplete()
+            self._last = None
+            return
+
+        key = values_key(values)
+        if key == self._last:
+            return
+        self._last = key
+        self.evaluations += 1
+        self.evaluate(values)
+
+
+__all__ = ['LiveCalculation']
@@ -0,0 +1,94 @@
+"""
+ScreenManager dengan pembuatan screen secara lazy
+
+Screen didaftarkan sebagai factory dan baru dibuat saat pertama kali
+dibuka (atau diambil dengan get_screen). Screen yang kemungkinan besar
+dibuka berikutnya bisa dibuat lebih awal dengan prewarm(), satu screen per
+frame setelah frame pertama tampil.
+
+Contoh:
+    sm = LazyScreenManager()
+    sm.register('home', HomeScreen)
+    sm.register('quiz', QuizScreen)
+    sm.current = 'home'          # HomeScreen dibuat di sini
+    sm.prewarm(['quiz'])         # QuizScreen dibuat saat aplikasi idle
+"""
+
+from time import perf_counter
+
+from kivy.clock import Clock
+from kivy.uix.screenmanager import ScreenManager
+
+
+class LazyScreenManager(ScreenManager):
+    """
+    ScreenManager yang membuat screen saat pertama kali dibutuhkan
+
+    Event on_screen_built(screen, duration) dipanggil setiap kali screen
+    selesai dibuat, dengan durasi konstruktor dalam detik.
+    """
+
+    __events__ = ('on_screen_built',)
+
+    def __init__(self, **kwargs):
+        self.factories = {}
+        super().__init__(**kwargs)
+
+    def register(self, name, factory):
+        """Mendaftarkan factory screen; factory dipanggil dengan name=name"""
+        self.factories[name] = factory
+
+    def is_built(self, name):
+        """True jika screen sudah dibuat"""
+        return any(screen.name == name for screen in self.screens)
+
+    def build_screen(self, name):
+        """Membuat screen terdaftar (jika belum ada) dan mengembalikannya"""
+        for screen in self.screens:
+            if screen.name == name:
+                return screen
+        start = perf_counter()
+        screen = self.factories[name](name=name)
+        screen.name = name
+        self.add_widget(screen)
+        self.dispatch('on_screen_built', screen, perf_counter() - start)
+        return screen
+
+    def on_screen_built(self, screen, duration):
+        pass
+
+    def get_screen(self, name):
+        if name in self.factories and not self.is_built(name):
+            return self.build_screen(name)
+        return super().get_screen(name)
+
+    def has_screen(self, name):
+        return name in self.factories or super().has_screen(name)
+
+    @property
+    def registered_names(self):
+        """Nama semua screen terdaftar, termasuk yang belum dibuat"""
+        names = list(self.factories)
+        names.extend(name for name in self.screen_names if name not in self.factories)
+        return names
+
+    def prewarm(self, names, delay=0.5):
+        """
+        Membuat screen di latar belakang, satu per frame
+
+        Dimulai setelah delay detik agar frame pertama tidak tertunda.
+        Screen yang sudah dibuka pengguna sebelum giliran prewarm dilewati.
+        """
+        pending = [name for name in names if name in self.factories]
+
+        def build_next(dt):
+            while pending:
+                name = pending.pop(0)
+                if not self.is_built(name):
+                    self.build_screen(name)
+                    break
+            if pending:
+                Clock.schedule_once(build_next, 0)
+
+        if pending:
+            Clock.schedule_once(build_next, delay)
@@ -0,0 +1,24 @@
+"""
+ScrollView yang tidak menumpuk observer bar_color
+
+Setiap update_from_scroll (dipicu perubahan scroll_x/scroll_y, pos, size,
+atau ukuran konten) ScrollView Kivy mem-fbind _change_bar_color ke
+bar_color, tetapi trigger 0.5 detik sesudahnya hanya mem-funbind sekali.
+Beberapa update dalam jendela 0.5 detik itu, misalnya saat konten ditukar
+dengan subtree dari ViewCache, meninggalkan observer duplikat yang tidak
+pernah dilepas.
+
+Contoh:
+    self.scroll = StableScrollView(size_hint=(1, 1))
+"""
+
+from kivy.uix.scrollview import ScrollView
+
+
+class StableScrollView(ScrollView):
+    """ScrollView dengan paling banyak satu observer _change_bar_color di bar_color"""
+
+    def update_from_scroll(self, *largs):
+        # funbind tidak melakukan apa-apa jika belum ada binding
+        self.funbind('bar_color', self._change_bar_color)
+        super().update_from_scroll(*largs)
@@ -0,0 +1,111 @@
+"""
+Cache LRU untuk subtree widget yang sudah dibangun
+
+Halaman detail membangun banyak kartu untuk setiap rumus. Dengan ViewCache,
+subtree untuk satu kunci (misalnya id rumus) dibangun sekali lalu dipakai
+ulang saat rumus yang sama dibuka lagi; hanya widget induknya yang ditukar.
+
+Contoh:
+    self.view_cache = ViewCache(maxsize=8)
+    view = self.view_cache.get_or_build(formula_id, self.build_view)
+
+Saat sistem kekurangan memori (Window.on_memorywarning, di Android dipicu
+onLowMemory), release_all() mengosongkan semua cache kecuali view yang
+sedang tampil.
+"""
+
+import weakref
+from collections import OrderedDict
+
+# Semua cache yang masih hidup, untuk eviksi saat memori sistem menipis
+_caches = weakref.WeakSet()
+
+
+class ViewCache:
+    """
+    Cache LRU terbatas berisi widget, dengan kunci bebas (hashable)
+
+    Widget yang dieviksi tidak dihapus dari induknya; jika masih tampil
+    widget tetap dipakai sampai ditukar, lalu dibebaskan oleh garbage collector.
+    """
+
+    def __init__(self, maxsize=8):
+        """
+        Args:
+            maxsize: Jumlah subtree maksimum yang disimpan
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._views = OrderedDict()
+        _caches.add(self)
+
+    def get(self, key, default=None):
+        """Mengambil subtree dan menandainya sebagai yang terakhir dipakai"""
+        view = self._views.get(key)
+        if view is None:
+            self.misses += 1
+            return default
+        self._views.move_to_end(key)
+        self.hits += 1
+        return view
+
+    def set(self, key, view):
+        """Menyimpan subtree lalu mengeviksi yang paling lama jika penuh"""
+        self._views[key] = view
+        self._views.move_to_end(key)
+        self.trim(self.maxsize)
+
+    def get_or_build(self, key, builder):
+        """Mengambil subtree dari cache, atau memanggil builder(key) dan menyimpannya"""
+        view = self.get(key)
+        if view is None:
+            view = builder(key)
+            self.set(key, view)
+        return view
+
+    def trim(self, size):
+        """Mengeviksi subtree paling lama sampai jumlahnya paling banyak size"""
+        while len(self._views) > max(size, 0):
+            self._views.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Menghapus semua subtree (statistik tetap disimpan)"""
+        self._views.clear()
+
+    def stats(self):
+        """Mengembalikan statistik cache"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._views),
+            'maxsize': self.maxsize,
+        }
+
+    def __contains__(self, key):
+        return key in self._views
+
+    def __len__(self):
+        return len(self._views)
+
+
+def release_all(keep=1):
+    """
+    Mengosongkan semua ViewCache, menyisakan keep subtree terakhir dipakai
+
+    Dipanggil saat memori sistem menipis. Default keep=1 mempertahankan view
+    yang sedang tampil agar kembali ke halaman itu tidak perlu membangun ulang.
+    Mengembalikan jumlah subtree yang dieviksi.
+    """
+    released = 0
+    for cache in list(_caches):
+        before = len(cache)
+        cache.trim(keep)
+        released += before - len(cache)
+    return released
+
+
+__all__ = ['ViewCache', 'release_all']
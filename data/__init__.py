@@ -3,9 +3,17 @@ Package untuk data aplikasi
 """
 
 from .formulas import physics_formulas, formula_categories, all_formulas
+from physicalc.core.registry import FormulaRegistry
+from physicalc.core.catalog import load_catalog, get_formulas, get_formula, get_topics, get_categories
 
 __all__ = [
     'physics_formulas',
     'formula_categories',
-    'all_formulas'
+    'all_formulas',
+    'FormulaRegistry',
+    'load_catalog',
+    'get_formulas',
+    'get_formula',
+    'get_topics',
+    'get_categories'
 ]
\ No newline at end of file
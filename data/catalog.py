@@ -0,0 +1,12 @@
+"""
+Katalog rumus fisika terpadu
+
+Modul kompatibilitas: implementasinya ada di physicalc.core.catalog.
+"""
+
+from physicalc.core.catalog import (
+    CATALOG_PATH, SCHEMA_VERSION, DEFAULT_LANGUAGE, LANGUAGES, CatalogError,
+    validate_catalog, build_indexes, rebuild_snapshot, load_catalog, localize,
+    get_formulas, get_formula, get_categories, get_category_name,
+    get_formulas_by_symbol, get_topics
+)
@@ -0,0 +1,7 @@
+"""
+Registry rumus fisika
+
+Modul kompatibilitas: implementasinya ada di physicalc.core.registry.
+"""
+
+from physicalc.core.registry import freeze, split_symbols, FormulaRegistry
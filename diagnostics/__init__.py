@@ -0,0 +1,37 @@
+"""
+Package untuk alat diagnostik aplikasi (opt-in, tidak aktif secara default)
+
+Submodule diimpor langsung, misalnya `from diagnostics import startup`,
+agar package ini tidak ikut mengimpor Kivy sebelum profiler startup aktif.
+
+- startup: profil waktu startup (impor, build, screen, frame pertama)
+- frames: monitor waktu frame dan jank dengan overlay FPS
+"""
+
+import os
+
+_ENABLED_VALUES = ('1', 'true', 'yes', 'on')
+_DISABLED_VALUES = ('0', 'false', 'no', 'off')
+
+
+def output_option(env_var, cli_flag, default_output, argv=None):
+    """
+    Membaca opsi diagnostik dari env var atau flag CLI
+
+    Nilai '1'/'true' berarti aktif dengan file output default, nilai lain
+    dianggap path file output. Flag (`--flag` atau `--flag=path`) dihapus dari
+    argv agar tidak dibaca parser argumen Kivy. Mengembalikan path output,
+    atau None jika tidak diaktifkan.
+    """
+    output = None
+    value = os.environ.get(env_var, '').strip()
+    if value and value.lower() not in _DISABLED_VALUES:
+        output = default_output if value.lower() in _ENABLED_VALUES else value
+
+    if argv is not None:
+        for arg in list(argv[1:]):
+            if arg == cli_flag or arg.startswith(cli_flag + '='):
+                output = arg.partition('=')[2] or default_output
+                argv.remove(arg)
+
+    return output
@@ -0,0 +1,448 @@
+"""
+Monitor waktu frame dan jank berbasis Kivy Clock
+
+Mencatat durasi setiap frame, mengaitkan frame yang lambat dengan callback
+Clock atau method screen yang berjalan di dalamnya, menampilkan overlay
+kecil FPS/jank di pojok window, dan mengekspor histogram waktu frame ke
+file JSON untuk dibandingkan secara offline.
+
+Aktifkan dengan salah satu cara:
+    PHYSICALC_FRAME_MONITOR=1 python main.py
+    PHYSICALC_FRAME_MONITOR=frames.json python main.py
+    python main.py --frame-monitor[=frames.json]
+
+Selama monitor aktif, callback yang dijadwalkan lewat Clock.schedule_once,
+schedule_interval dan create_trigger dibungkus agar waktunya terukur.
+Callback berupa bound method tetap disimpan sebagai weak reference seperti
+perilaku Kivy biasa. Method screen diukur dengan instrument_class().
+
+Modul ini tidak mengimpor Kivy di level modul, sehingga flag CLI bisa
+dibaca sebelum Kivy mem-parsing sys.argv.
+"""
+
+import functools
+import heapq
+import inspect
+import json
+import sys
+import weakref
+from datetime import datetime
+from time import perf_counter
+
+from diagnostics import output_option
+
+ENV_VAR = 'PHYSICALC_FRAME_MONITOR'
+CLI_FLAG = '--frame-monitor'
+DEFAULT_OUTPUT = 'frame_times.json'
+
+# Jumlah frame lambat (terlama) yang disimpan di laporan
+MAX_LONG_FRAMES = 100
+# Jumlah callback/method yang dicatat per frame lambat
+MAX_CULPRITS = 5
+
+
+def format_ms(value):
+    """Durasi milidetik untuk ringkasan ('-' jika belum ada frame)"""
+    return '-' if value is None else f"{value:.1f} ms"
+
+
+class FrameHistogram:
+    """Histogram waktu frame (milidetik) dengan bucket di sekitar budget 60 FPS"""
+
+    BUCKETS_MS = (8, 12, 16.7, 20, 25, 33.3, 50, 66.7, 100, 250, 500, 1000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms):
+        """Mencatat satu durasi frame dalam milidetik"""
+        for index, bound in enumerate(self.BUCKETS_MS):
+            if ms <= bound:
+                break
+        else:
+            index = len(self.BUCKETS_MS)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, fraction):
+        """Perkiraan persentil (batas atas bucket yang memuat persentil, paling besar max_ms)"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self):
+        buckets = [{'le': bound, 'count': count} for bound, count in zip(self.BUCKETS_MS, self.counts)]
+        buckets.append({'le': 'inf', 'count': self.counts[-1]})
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else None,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(0.50),
+            'p90_ms': self.percentile(0.90),
+            'p99_ms': self.percentile(0.99),
+            'buckets': buckets,
+        }
+
+
+class _TimedCallback:
+    """Pembungkus callback Clock yang melaporkan durasinya ke FrameMonitor"""
+
+    __slots__ = ('callback', 'label', 'monitor', '__weakref__')
+
+    def __init__(self, callback, monitor):
+        if getattr(callback, '__self__', None) is not None:
+            # Bound method: simpan weak reference seperti WeakMethod milik Kivy
+            self.callback = weakref.WeakMethod(callback)
+        else:
+            self.callback = lambda: callback
+        self.label = _label(callback)
+        self.monitor = monitor
+
+    def resolve(self):
+        return self.callback()
+
+    def matches(self, callback):
+        return self.resolve() == callback
+
+    def __call__(self, *args):
+        callback = self.resolve()
+        if callback is None:
+            # Widget pemilik callback sudah dihapus: hentikan jadwal interval
+            return False
+        start = perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            self.monitor.note(self.label, perf_counter() - start)
+
+
+def _label(func):
+    """Nama yang mudah dibaca untuk callback atau method"""
+    func = getattr(func, 'func', func)  # functools.partial
+    qualname = getattr(func, '__qualname__', None) or repr(func)
+    module = getattr(func, '__module__', None)
+    return f"{module}.{qualname}" if module and module != '__main__' else qualname
+
+
+class FrameMonitor:
+    """
+    Pencatat durasi frame dan penyebab jank
+
+    Frame dianggap jank jika durasinya minimal 1,5x budget frame (satu frame
+    atau lebih terlewat). Setiap frame, callback dan method terukur yang
+    berjalan sejak frame sebelumnya dikumpulkan; untuk frame jank, yang
+    paling lama dicatat sebagai penyebab.
+    """
+
+    def __init__(self, output=DEFAULT_OUTPUT, target_fps=None, overlay=True):
+        self.output = output
+        self.target_fps = target_fps
+        self.budget_ms = None
+        self.show_overlay = overlay
+
+        self.histogram = FrameHistogram()
+        self.jank_frames = 0
+        self.dropped_frames = 0
+        self.long_frames = []  # min-heap (durasi, nomor frame, data)
+        self.culprits = {}
+
+        self.running = False
+        self.started = None
+        self._last_frame = None
+        self._frame_notes = []
+        self._wrappers = weakref.WeakSet()
+        self._clock_originals = {}
+        self._frame_event = None
+        self._overlay_event = None
+        self._overlay = None
+        self._window_frames = 0
+        self._window_jank = 0
+        self._window_start = None
+
+    # ===== Pencatatan =====
+
+    def note(self, label, seconds):
+        """Mencatat waktu yang dihabiskan sebuah callback/method di frame saat ini"""
+        if self.running:
+            self._frame_notes.append((label, seconds))
+
+    def _on_frame(self, dt):
+        now = perf_counter()
+        if self._last_frame is None:
+            self._last_frame = now
+            self._frame_notes = []
+            return
+
+        ms = (now - self._last_frame) * 1000.0
+        self._last_frame = now
+        self.histogram.observe(ms)
+        self._window_frames += 1
+
+        notes, self._frame_notes = self._frame_notes, []
+        dropped = int(round(ms / self.budget_ms)) - 1
+        if dropped < 1:
+            return
+
+        self.jank_frames += 1
+        self.dropped_frames += dropped
+        self._window_jank += 1
+
+        notes.sort(key=lambda note: note[1], reverse=True)
+        frame = {
+            'frame': self.histogram.count,
+            'at_s': now - self.started,
+            'duration_ms': ms,
+            'dropped': dropped,
+            'culprits': [{'label': label, 'ms': seconds * 1000.0} for label, seconds in notes[:MAX_CULPRITS]]
+        }
+        entry = (ms, self.histogram.count, frame)
+        if len(self.long_frames) < MAX_LONG_FRAMES:
+            heapq.heappush(self.long_frames, entry)
+        else:
+            heapq.heappushpop(self.long_frames, entry)
+
+        per_label = {}
+        for label, seconds in notes:
+            per_label[label] = per_label.get(label, 0.0) + seconds * 1000.0
+        for label, ms_spent in per_label.items():
+            stats = self.culprits.setdefault(label, {'long_frames': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            stats['long_frames'] += 1
+            stats['total_ms'] += ms_spent
+            stats['max_ms'] = max(stats['max_ms'], ms_spent)
+
+    # ===== Instrumentasi =====
+
+    def instrument_class(self, cls, names=None):
+        """
+        Mengukur method yang didefinisikan langsung di class (misalnya screen)
+
+        Tanpa names, semua function non-dunder di cls.__dict__ dibungkus.
+        Harus dipanggil sebelum instance dibuat agar bind() memakai versi terukur.
+        """
+        if names is None:
+            names = [name for name, value in vars(cls).items()
+                     if inspect.isfunction(value) and not name.startswith('__')]
+        for name in names:
+            func = vars(cls).get(name)
+            if not inspect.isfunction(func) or getattr(func, '_frame_monitor', False):
+                continue
+            setattr(cls, name, self._timed_method(func, f"{cls.__name__}.{name}"))
+
+    def _timed_method(self, func, label):
+        monitor = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                monitor.note(label, perf_counter() - start)
+
+        wrapper._frame_monitor = True
+        return wrapper
+
+    def _install_clock_hooks(self, clock):
+        originals = self._clock_originals
+        for name in ('schedule_once', 'schedule_interval', 'create_trigger', 'unschedule'):
+            originals[name] = getattr(clock, name)
+
+        def wrap(callback):
+            if isinstance(callback, _TimedCallback) or getattr(callback, '_frame_monitor', False):
+                # Sudah terukur (method hasil instrument_class)
+                return callback
+            wrapper = _TimedCallback(callback, self)
+            self._wrappers.add(wrapper)
+            return wrapper
+
+        def schedule_once(callback, timeout=0):
+            return originals['schedule_once'](wrap(callback), timeout)
+
+        def schedule_interval(callback, timeout):
+            return originals['schedule_interval'](wrap(callback), timeout)
+
+        def create_trigger(callback, timeout=0, interval=False, release_ref=True):
+            return originals['create_trigger'](wrap(callback), timeout, interval, release_ref)
+
+        def unschedule(callback, all=True):
+            for wrapper in list(self._wrappers):
+                if wrapper.matches(callback):
+                    originals['unschedule'](wrapper, all)
+            return originals['unschedule'](callback, all)
+
+        clock.schedule_once = schedule_once
+        clock.schedule_interval = schedule_interval
+        clock.create_trigger = create_trigger
+        clock.unschedule = unschedule
+
+    def _remove_clock_hooks(self, clock):
+        for name in self._clock_originals:
+            delattr(clock, name)
+        self._clock_originals = {}
+
+    # ===== Overlay =====
+
+    def _create_overlay(self):
+        from kivy.core.window import Window
+        from kivy.graphics import Color, Rectangle
+        from kivy.metrics import dp, sp
+        from kivy.uix.label import Label
+
+        overlay = Label(
+            text='-- fps',
+            font_size=sp(11),
+            color=[1, 1, 1, 1],
+            size_hint=(None, None),
+            size=(dp(110), dp(22))
+        )
+        with overlay.canvas.before:
+            Color(0, 0, 0, 0.6)
+            overlay.bg = Rectangle(pos=overlay.pos, size=overlay.size)
+
+        def place(*args):
+            overlay.pos = (Window.width - overlay.width - dp(4), Window.height - overlay.height - dp(4))
+            overlay.bg.pos = overlay.pos
+            overlay.bg.size = overlay.size
+
+        Window.bind(size=place)
+        place()
+        Window.add_widget(overlay)
+        return overlay
+
+    def _update_overlay(self, dt):
+        now = perf_counter()
+        elapsed = now - self._window_start
+        fps = self._window_frames / elapsed if elapsed else 0
+        self._overlay.text = f"{fps:.0f} fps  jank {self._window_jank}"
+        self._overlay.color = [1, 0.4, 0.4, 1] if self._window_jank else [1, 1, 1, 1]
+        self._window_frames = 0
+        self._window_jank = 0
+        self._window_start = now
+
+    # ===== Start / stop =====
+
+    def start(self):
+        """Mulai memantau frame (dipanggil dari App.on_start)"""
+        if self.running:
+            return
+        from kivy.clock import Clock
+        from kivy.config import Config
+
+        if not self.target_fps:
+            # maxfps 0 berarti tidak dibatasi; pakai 60 FPS sebagai acuan
+            self.target_fps = Config.getint('graphics', 'maxfps') or 60
+        self.budget_ms = 1000.0 / self.target_fps
+
+        self.running = True
+        self.started = perf_counter()
+        self._window_start = self.started
+        self._last_frame = None
+
+        self._install_clock_hooks(Clock)
+        originals = self._clock_originals
+        self._frame_event = originals['schedule_interval'](self._on_frame, 0)
+        if self.show_overlay:
+            self._overlay = self._create_overlay()
+            self._overlay_event = originals['schedule_interval'](self._update_overlay, 0.5)
+
+    def stop(self):
+        """Berhenti memantau dan mengekspor laporan"""
+        if not self.running:
+            return None
+        from kivy.clock import Clock
+
+        self._frame_event.cancel()
+        if self._overlay_event is not None:
+            self._overlay_event.cancel()
+        if self._overlay is not None and self._overlay.parent is not None:
+            self._overlay.parent.remove_widget(self._overlay)
+        self._remove_clock_hooks(Clock)
+        self.running = False
+        return self.export()
+
+    def report(self):
+        """Laporan dalam bentuk dictionary yang bisa di-dump ke JSON"""
+        try:
+            from physicalc import __version__ as version
+        except ImportError:
+            version = None
+
+        duration = (perf_counter() - self.started) if self.started else 0.0
+        culprits = sorted(
+            ({'label': label, **stats} for label, stats in self.culprits.items()),
+            key=lambda item: item['total_ms'],
+            reverse=True
+        )
+        return {
+            'version': version,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'target_fps': self.target_fps,
+            'budget_ms': self.budget_ms,
+            'duration_s': duration,
+            'frames': self.histogram.count,
+            'fps_mean': self.histogram.count / duration if duration else None,
+            'jank_frames': self.jank_frames,
+            'dropped_frames': self.dropped_frames,
+            'histogram': self.histogram.to_dict(),
+            'culprits': culprits,
+            'long_frames': [frame for _, _, frame in sorted(self.long_frames, reverse=True)]
+        }
+
+    def export(self, path=None):
+        """Menulis laporan ke file JSON dan mencetak ringkasan singkat"""
+        path = path or self.output
+        report = self.report()
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+
+        histogram = report['histogram']
+        print(
+            f"Frame monitor: {report['frames']} frames, {report['jank_frames']} jank "
+            f"({report['dropped_frames']} dropped), p50 {format_ms(histogram['p50_ms'])}, "
+            f"p99 {format_ms(histogram['p99_ms'])}, max {format_ms(histogram['max_ms'])}",
+            file=sys.stderr
+        )
+        for item in report['culprits'][:5]:
+            print(f"  {item['label']:<48}{item['long_frames']:5d} long frames, "
+                  f"max {item['max_ms']:.1f} ms", file=sys.stderr)
+        if path:
+            print(f"Frame report written to {path}", file=sys.stderr)
+        return report
+
+
+# ===== Monitor global =====
+
+_monitor = None
+
+
+def enable_from_environment(argv=None):
+    """
+    Membuat monitor jika env var atau flag CLI diset (flag dihapus dari argv)
+
+    Monitor baru mulai mencatat setelah start() dipanggil. Mengembalikan
+    monitor atau None.
+    """
+    global _monitor
+
+    output = output_option(ENV_VAR, CLI_FLAG, DEFAULT_OUTPUT, argv)
+    if output is not None and _monitor is None:
+        _monitor = FrameMonitor(output)
+    return _monitor
+
+
+def get_monitor():
+    """Monitor yang aktif, atau None jika tidak diaktifkan"""
+    return _monitor
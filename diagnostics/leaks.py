@@ -0,0 +1,358 @@
+"""
+Detektor kebocoran widget dan instruksi canvas antar perpindahan screen
+
+Setiap kali sebuah screen selesai dibuka (event on_enter), detektor
+menghitung untuk screen tersebut: jumlah widget di pohonnya, jumlah
+instruksi canvas, event Clock milik widget tersebut, dan jumlah binding
+(observer property/event). Secara global dihitung juga objek
+Widget yang masih hidup per class (lewat gc). Nilai yang naik terus-menerus
+selama beberapa kunjungan berturut-turut dilaporkan sebagai dugaan bocor.
+
+Aktifkan dengan salah satu cara:
+    PHYSICALC_LEAK_DETECTOR=1 python main.py
+    python main.py --leak-detector[=leaks.json]
+
+Soak run tanpa interaksi (membuka semua screen dan rumus berulang kali):
+    python -m diagnostics.leaks --cycles 10
+
+Modul ini tidak mengimpor Kivy di level modul, sehingga flag CLI bisa
+dibaca sebelum Kivy mem-parsing sys.argv.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import weakref
+from collections import Counter
+from datetime import datetime
+
+from diagnostics import output_option
+
+ENV_VAR = 'PHYSICALC_LEAK_DETECTOR'
+CLI_FLAG = '--leak-detector'
+DEFAULT_OUTPUT = 'leak_report.json'
+
+# Jumlah kunjungan berturut-turut yang nilainya harus naik sebelum ditandai bocor
+DEFAULT_WINDOW = 5
+
+SCREEN_METRICS = ('widgets', 'canvas_instructions', 'clock_events', 'bindings')
+
+
+def count_instructions(group):
+    """Jumlah instruksi canvas di dalam group, termasuk group bersarang"""
+    children = getattr(group, 'children', None)
+    if not children:
+        return 0
+    return sum(1 + count_instructions(child) for child in children)
+
+
+def count_bindings(widget):
+    """Jumlah observer yang terpasang di semua property dan event widget"""
+    total = 0
+    for name in list(widget.properties()) + list(widget.events()):
+        try:
+            total += len(widget.get_property_observers(name))
+        except (KeyError, AttributeError):
+            pass
+    return total
+
+
+def clock_events_by_owner():
+    """Counter id(objek pemilik) -> jumlah event Clock yang callback-nya bound method"""
+    from kivy.clock import Clock
+
+    owners = Counter()
+    for event in Clock.get_events():
+        callback = event.get_callback()
+        owner = getattr(callback, '__self__', None)
+        if owner is not None:
+            owners[id(owner)] += 1
+    return owners
+
+
+def screen_snapshot(screen, clock_owners):
+    """Hitungan metrik untuk satu screen (widget di pohon screen tersebut)"""
+    widgets = list(screen.walk(restrict=True))
+    return {
+        'widgets': len(widgets),
+        'canvas_instructions': sum(count_instructions(widget.canvas) for widget in widgets),
+        'clock_events': sum(clock_owners.get(id(widget), 0) for widget in widgets),
+        'bindings': sum(count_bindings(widget) for widget in widgets),
+    }
+
+
+def view_name(screen):
+    """
+    Nama tampilan screen untuk deret per kunjungan
+
+    Screen detail menampilkan rumus yang berbeda-beda dari cache view, dan
+    jumlah widget/binding-nya memang berbeda per rumus; karena itu setiap
+    rumus mendapat deret sendiri ('formula_detail[force]').
+    """
+    formula_id = getattr(screen, 'current_formula_id', None)
+    return screen.name if formula_id is None else f"{screen.name}[{formula_id}]"
+
+
+def live_widget_counts():
+    """Jumlah objek Widget yang masih hidup per nama class (setelah gc.collect)"""
+    from kivy.uix.widget import Widget
+
+    gc.collect()
+    # type() dan bukan isinstance(): isinstance membaca __class__, yang pada
+    # WeakProxy milik Kivy error jika objek aslinya sudah dihapus
+    counts = Counter()
+    for obj in gc.get_objects():
+        cls = type(obj)
+        if issubclass(cls, Widget):
+            counts[cls.__name__] += 1
+    return counts
+
+
+def is_growing(values, window):
+    """
+    True jika window nilai terakhir tidak pernah turun dan naik di sebagian besar langkah
+
+    Kenaikan sekali (misalnya cache yang terisi saat kunjungan pertama) tidak
+    dianggap bocor; kebocoran biasanya menambah sesuatu di setiap kunjungan.
+    """
+    if len(values) < window:
+        return False
+    recent = values[-window:]
+    steps = list(zip(recent, recent[1:]))
+    if any(b < a for a, b in steps):
+        return False
+    return sum(b > a for a, b in steps) * 2 > len(steps)
+
+
+class LeakDetector:
+    """
+    Mencatat metrik setelah setiap transisi screen dan menandai pertumbuhan monoton
+
+    Ada dua jenis deret: per kunjungan (otomatis lewat on_enter) dan per
+    checkpoint (dipanggil manual, misalnya di akhir setiap siklus soak run,
+    saat semua screen berada pada keadaan yang sama). Deret per kunjungan
+    dipisah per tampilan (lihat view_name) agar hanya kunjungan ke tampilan
+    yang sama yang dibandingkan.
+    """
+
+    def __init__(self, output=DEFAULT_OUTPUT, window=DEFAULT_WINDOW):
+        self.output = output
+        self.window = window
+        self._manager = None
+        self._screens = weakref.WeakSet()
+        self.reset()
+
+    def reset(self):
+        """Menghapus semua riwayat (misalnya setelah siklus pemanasan)"""
+        self.transitions = 0
+        self.checkpoints = 0
+        self.history = {}          # 'visit'/'checkpoint' -> {kunci: [nilai]}
+        self.flagged = {}          # kunci -> info pertama kali ditandai
+
+    def attach(self, manager):
+        """Memantau ScreenManager; screen yang dibuat belakangan ikut dipantau"""
+        self._manager = weakref.ref(manager)
+        for screen in manager.screens:
+            self.watch(screen)
+        if 'on_screen_built' in manager.events():
+            manager.bind(on_screen_built=lambda sm, screen, duration: self.watch(screen))
+
+    def watch(self, screen):
+        if screen not in self._screens:
+            self._screens.add(screen)
+            screen.bind(on_enter=self.snapshot)
+
+    def snapshot(self, screen):
+        """
+        Menghitung metrik setelah transisi ke screen selesai
+
+        Metrik per screen dicatat sekali per kunjungan ke screen itu,
+        sedangkan jumlah widget hidup global dicatat di setiap transisi.
+        """
+        self.transitions += 1
+        view = view_name(screen)
+        self._record('visit', {view: screen}, f"{view}.live.")
+
+    def checkpoint(self):
+        """Menghitung metrik semua screen yang sudah dibuat dan widget hidup global"""
+        manager = self._manager() if self._manager else None
+        if manager is None:
+            return
+        self.checkpoints += 1
+        self._record('checkpoint', {screen.name: screen for screen in manager.screens}, 'live.')
+
+    def _record(self, kind, screens, live_prefix):
+        series = self.history.setdefault(kind, {})
+        clock_owners = clock_events_by_owner()
+        for name, screen in screens.items():
+            values = screen_snapshot(screen, clock_owners)
+            for metric in SCREEN_METRICS:
+                key = f"{name}.{metric}"
+                series.setdefault(key, []).append(values[metric])
+                self._check(kind, key, series[key])
+
+        counts = live_widget_counts()
+        known = {key[len(live_prefix):] for key in series if key.startswith(live_prefix)}
+        for name in known | set(counts):
+            key = f"{live_prefix}{name}"
+            series.setdefault(key, []).append(counts.get(name, 0))
+            self._check(kind, key, series[key])
+
+    def _check(self, kind, key, values):
+        flag_key = f"{kind}:{key}"
+        if flag_key in self.flagged or not is_growing(values, self.window):
+            return
+        recent = values[-self.window:]
+        self.flagged[flag_key] = {
+            'key': key,
+            'kind': kind,
+            'at': self.transitions if kind == 'visit' else self.checkpoints,
+            'values': recent,
+            'growth_per_step': (recent[-1] - recent[0]) / (len(recent) - 1)
+        }
+        from kivy.logger import Logger
+        Logger.warning(
+            f"Leaks: {key} grew for {self.window} {kind}s in a row: "
+            f"{' -> '.join(str(value) for value in recent)}"
+        )
+
+    def report(self):
+        """Laporan dalam bentuk dictionary yang bisa di-dump ke JSON"""
+        try:
+            from physicalc import __version__ as version
+        except ImportError:
+            version = None
+
+        return {
+            'version': version,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'transitions': self.transitions,
+            'checkpoints': self.checkpoints,
+            'window': self.window,
+            'flagged': sorted(self.flagged.values(), key=lambda item: item['growth_per_step'], reverse=True),
+            'history': self.history
+        }
+
+    def export(self, path=None):
+        """Menulis laporan JSON dan mencetak ringkasan; mengembalikan laporan"""
+        path = path or self.output
+        report = self.report()
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+
+        print(f"Leak detector: {report['transitions']} transitions, {report['checkpoints']} checkpoints, "
+              f"{len(report['flagged'])} growing metrics", file=sys.stderr)
+        for item in report['flagged']:
+            print(f"  {item['key']:<40}+{item['growth_per_step']:.1f} per {item['kind']} "
+                  f"({' -> '.join(str(value) for value in item['values'])})", file=sys.stderr)
+        if path:
+            print(f"Leak report written to {path}", file=sys.stderr)
+        return report
+
+
+# ===== Detektor global =====
+
+_detector = None
+
+
+def enable_from_environment(argv=None):
+    """Membuat detektor jika env var atau flag CLI diset (flag dihapus dari argv)"""
+    global _detector
+
+    output = output_option(ENV_VAR, CLI_FLAG, DEFAULT_OUTPUT, argv)
+    if output is not None and _detector is None:
+        _detector = LeakDetector(output)
+    return _detector
+
+
+def install(detector):
+    """Memasang detektor sebagai detektor global (dipakai main.py saat build)"""
+    global _detector
+    _detector = detector
+    return detector
+
+
+def get_detector():
+    """Detektor yang aktif, atau None jika tidak diaktifkan"""
+    return _detector
+
+
+# ===== Soak run =====
+
+def soak(app, detector, cycles=10, ticks=3):
+    """
+    Membuka screen-screen aplikasi berulang kali tanpa interaksi pengguna
+
+    Setiap siklus membuka daftar materi, detail setiap materi, lalu screen
+    lain yang terdaftar, dan kembali ke home. Siklus pertama adalah
+    pemanasan (screen lazy dibuat, cache terisi) dan tidak dihitung; setelah
+    setiap siklus berikutnya detector.checkpoint() dipanggil. Transisi
+    dibuat instan dan Clock di-tick agar event on_enter terpanggil.
+    """
+    from kivy.clock import Clock
+    from kivy.uix.screenmanager import NoTransition
+
+    manager = app.root
+    manager.transition = NoTransition()
+
+    def go(name):
+        manager.current = name
+        for _ in range(ticks):
+            Clock.tick()
+
+    topics = [row['formula_id'] for row in manager.get_screen('formula_list').topic_list.data]
+    others = [name for name in manager.registered_names
+              if name not in ('home', 'formula_list', 'formula_detail')]
+
+    for cycle in range(cycles + 1):
+        go('formula_list')
+        for formula_id in topics:
+            manager.get_screen('formula_detail').load_formula(formula_id)
+            go('formula_detail')
+            go('formula_list')
+        for name in others:
+            go(name)
+        go('home')
+
+        if cycle == 0:
+            detector.reset()
+        else:
+            detector.checkpoint()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m diagnostics.leaks',
+                                     description='Cycle through all screens and report growing widget counts.')
+    parser.add_argument('--cycles', type=int, default=10,
+                        help="measured navigation cycles after one warm-up cycle (default: 10)")
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW,
+                        help=f"visits in a row that must grow before flagging (default: {DEFAULT_WINDOW})")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                        help=f"JSON report path (default: {DEFAULT_OUTPUT})")
+    args = parser.parse_args(argv)
+
+    import os
+    os.environ.setdefault('KIVY_NO_ARGS', '1')
+
+    # Dengan `python -m` modul ini berjalan sebagai __main__; pasang detektor
+    # di modul diagnostics.leaks yang juga diimpor main.py
+    from diagnostics import leaks
+    detector = leaks.install(leaks.LeakDetector(args.output, args.window))
+
+    from kivy.base import EventLoop
+    from main import PhysicsApp
+
+    app = PhysicsApp()
+    app.root = app.build()
+    EventLoop.ensure_window()
+    EventLoop.window.add_widget(app.root)
+
+    soak(app, detector, args.cycles)
+    report = detector.export()
+    return 1 if report['flagged'] else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
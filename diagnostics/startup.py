@@ -0,0 +1,336 @@
+"""
+Profiler waktu startup aplikasi
+
+Mencatat durasi tiap fase dari awal main.py sampai frame pertama tampil:
+impor (per modul, seperti `python -X importtime` tetapi dari dalam
+aplikasi), PhysicsApp.build, konstruktor tiap screen, dan frame pertama.
+Hasilnya ditulis sebagai laporan JSON dan ringkasan teks di stderr.
+
+Aktifkan dengan salah satu cara:
+    PHYSICALC_PROFILE_STARTUP=1 python main.py
+    PHYSICALC_PROFILE_STARTUP=profil.json python main.py
+    python main.py --profile-startup[=profil.json]
+
+Membandingkan dua laporan (misalnya antar rilis):
+    python -m diagnostics.startup laporan_lama.json laporan_baru.json
+
+Modul ini tidak mengimpor Kivy di level modul, sehingga bisa diaktifkan
+sebelum impor Kivy pertama.
+"""
+
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from diagnostics import output_option
+
+ENV_VAR = 'PHYSICALC_PROFILE_STARTUP'
+CLI_FLAG = '--profile-startup'
+DEFAULT_OUTPUT = 'startup_profile.json'
+
+
+class StartupProfiler:
+    """Pencatat fase dan waktu impor selama startup"""
+
+    def __init__(self, output=DEFAULT_OUTPUT):
+        self.output = output
+        self.started = time.perf_counter()
+        self.phases = []
+        self.imports = []
+        self.finished = False
+        self._open_phases = {}
+        self._import_stack = []
+        self._finder = None
+
+    def now(self):
+        """Detik sejak profiler dimulai"""
+        return time.perf_counter() - self.started
+
+    # ===== Fase =====
+
+    def begin(self, name):
+        """Memulai fase; fase yang dimulai di dalam fase lain tercatat bersarang"""
+        self._open_phases[name] = (self.now(), len(self._open_phases))
+
+    def end(self, name):
+        """Mengakhiri fase yang dimulai dengan begin()"""
+        if name not in self._open_phases:
+            return
+        start, depth = self._open_phases.pop(name)
+        self.record(name, self.now() - start, start=start, depth=depth)
+
+    def record(self, name, duration, start=None, depth=None):
+        """Mencatat fase yang durasinya diukur di tempat lain"""
+        if start is None:
+            start = self.now() - duration
+        if depth is None:
+            depth = len(self._open_phases)
+        self.phases.append({'name': name, 'start_s': start, 'duration_s': duration, 'depth': depth})
+
+    @contextmanager
+    def phase(self, name):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    # ===== Impor =====
+
+    def start_import_tracking(self):
+        """Memasang finder di sys.meta_path untuk mengukur waktu eksekusi tiap modul"""
+        if self._finder is None:
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def stop_import_tracking(self):
+        if self._finder is not None:
+            if self._finder in sys.meta_path:
+                sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def _import_started(self, name):
+        self._import_stack.append([name, time.perf_counter(), 0.0])
+
+    def _import_finished(self, name):
+        name, start, children = self._import_stack.pop()
+        cumulative = time.perf_counter() - start
+        if self._import_stack:
+            self._import_stack[-1][2] += cumulative
+        self.imports.append({
+            'module': name,
+            'self_s': cumulative - children,
+            'cumulative_s': cumulative,
+            'depth': len(self._import_stack)
+        })
+
+    # ===== Laporan =====
+
+    def report(self):
+        """Laporan dalam bentuk dictionary yang bisa di-dump ke JSON"""
+        try:
+            from physicalc import __version__ as version
+        except ImportError:
+            version = None
+
+        phases = sorted(self.phases, key=lambda p: p['start_s'])
+        return {
+            'version': version,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'total_s': max((p['start_s'] + p['duration_s'] for p in phases), default=self.now()),
+            'phases': phases,
+            'imports': sorted(self.imports, key=lambda i: i['cumulative_s'], reverse=True)
+        }
+
+    def finish(self):
+        """Menulis laporan JSON dan mencetak ringkasan (hanya sekali)"""
+        if self.finished:
+            return None
+        self.finished = True
+        self.stop_import_tracking()
+
+        report = self.report()
+        if self.output:
+            with open(self.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        print(format_summary(report), file=sys.stderr)
+        if self.output:
+            print(f"Startup profile written to {self.output}", file=sys.stderr)
+        return report
+
+
+class _ImportTimer:
+    """
+    Finder di sys.meta_path yang membungkus exec_module milik loader
+
+    Pencarian modul tetap dilakukan finder asli; hanya eksekusi modul yang
+    diukur. Loader berbentuk class (builtin/frozen) tidak diukur sendiri,
+    waktunya masuk ke modul induknya.
+    """
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            if loader is not None and not isinstance(loader, type) and hasattr(loader, 'exec_module'):
+                self._wrap(loader, fullname)
+            return spec
+        return None
+
+    def _wrap(self, loader, fullname):
+        exec_module = loader.exec_module
+        profiler = self.profiler
+
+        def timed_exec_module(module):
+            profiler._import_started(fullname)
+            try:
+                exec_module(module)
+            finally:
+                profiler._import_finished(fullname)
+
+        loader.exec_module = timed_exec_module
+
+
+# ===== Ringkasan =====
+
+def _ms(seconds):
+    return f"{seconds * 1000:9.1f} ms"
+
+
+def format_summary(report, top=15):
+    """Ringkasan teks dari laporan startup"""
+    lines = [f"Startup profile: {report['total_s'] * 1000:.1f} ms to first frame"]
+
+    lines.append("Phases:")
+    for phase in report['phases']:
+        name = '  ' * phase['depth'] + phase['name']
+        lines.append(f"  {name:<32}{_ms(phase['duration_s'])}  (at {phase['start_s'] * 1000:.1f} ms)")
+
+    if report['imports']:
+        lines.append(f"Slowest imports (cumulative / self), top {top} of {len(report['imports'])}:")
+        for item in report['imports'][:top]:
+            lines.append(f"  {item['module']:<40}{_ms(item['cumulative_s'])}{_ms(item['self_s'])}")
+
+    return '\n'.join(lines)
+
+
+def compare_reports(old, new, top=15):
+    """Ringkasan teks selisih dua laporan (new - old) per fase dan per impor"""
+    lines = [
+        f"Total: {old['total_s'] * 1000:.1f} ms -> {new['total_s'] * 1000:.1f} ms "
+        f"({(new['total_s'] - old['total_s']) * 1000:+.1f} ms)"
+    ]
+
+    old_phases = {p['name']: p['duration_s'] for p in old['phases']}
+    lines.append("Phases:")
+    for phase in new['phases']:
+        before = old_phases.get(phase['name'])
+        delta = '      new' if before is None else f"{(phase['duration_s'] - before) * 1000:+9.1f} ms"
+        lines.append(f"  {phase['name']:<32}{_ms(phase['duration_s'])}  {delta}")
+
+    old_imports = {i['module']: i['self_s'] for i in old['imports']}
+    changes = sorted(
+        ((i['module'], i['self_s'] - old_imports.get(i['module'], 0.0)) for i in new['imports']),
+        key=lambda change: abs(change[1]),
+        reverse=True
+    )
+    lines.append(f"Largest import changes (self time), top {top}:")
+    for module, delta in changes[:top]:
+        lines.append(f"  {module:<40}{delta * 1000:+9.1f} ms")
+
+    return '\n'.join(lines)
+
+
+# ===== Profiler global =====
+
+_profiler = None
+
+
+def enable_from_environment(argv=None):
+    """
+    Mengaktifkan profiler jika env var atau flag CLI diset
+
+    Flag dihapus dari argv agar tidak dibaca parser argumen Kivy.
+    Mengembalikan profiler yang aktif atau None.
+    """
+    global _profiler
+
+    output = output_option(ENV_VAR, CLI_FLAG, DEFAULT_OUTPUT, argv)
+    if output is None:
+        return None
+
+    if _profiler is None:
+        _profiler = StartupProfiler(output)
+        _profiler.start_import_tracking()
+    return _profiler
+
+
+def get_profiler():
+    """Profiler yang aktif, atau None jika profiling tidak diaktifkan"""
+    return _profiler
+
+
+def is_enabled():
+    return _profiler is not None and not _profiler.finished
+
+
+def begin(name):
+    if is_enabled():
+        _profiler.begin(name)
+
+
+def end(name):
+    if is_enabled():
+        _profiler.end(name)
+
+
+def record(name, duration):
+    if is_enabled():
+        _profiler.record(name, duration)
+
+
+@contextmanager
+def phase(name):
+    """Mengukur blok kode sebagai satu fase (tidak melakukan apa-apa jika nonaktif)"""
+    if not is_enabled():
+        yield
+        return
+    with _profiler.phase(name):
+        yield
+
+
+def finish_after_first_frame():
+    """
+    Mengakhiri fase 'first_frame' dan menulis laporan setelah window pertama kali di-flip
+
+    Dipanggil dari App.on_start; fase 'first_frame' harus sudah dimulai
+    dengan begin('first_frame').
+    """
+    if not is_enabled():
+        return
+
+    from kivy.core.window import Window
+
+    def on_flip(*args):
+        Window.unbind(on_flip=on_flip)
+        end('first_frame')
+        _profiler.finish()
+
+    Window.bind(on_flip=on_flip)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in (1, 2):
+        print("usage: python -m diagnostics.startup REPORT.json [NEW_REPORT.json]", file=sys.stderr)
+        return 2
+
+    reports = []
+    for path in argv:
+        with open(path, encoding='utf-8') as f:
+            reports.append(json.load(f))
+
+    if len(reports) == 1:
+        print(format_summary(reports[0]))
+    else:
+        print(compare_reports(*reports))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,11 @@
+"""
+Mesin rumus fisika
+
+Modul kompatibilitas: implementasinya ada di physicalc.core.engine.
+"""
+
+from physicalc.core.engine import (
+    FormulaError, FormulaSyntaxError, UnsolvableError, MissingInputError,
+    ZeroInputError, DomainError, ResultTooLargeError, CompiledFormula, Solver,
+    tokenize, parse_formula, compile_formula, get_compiled_formula, solve, compile_catalog
+)
@@ -4,22 +4,28 @@ Dibuat dengan Python Kivy
 Kompatibel untuk Android menggunakan Buildozer
 """
 
+import sys
+
+# Profiler startup harus aktif sebelum impor Kivy pertama
+from diagnostics import startup, frames, leaks
+startup.enable_from_environment(sys.argv)
+frames.enable_from_environment(sys.argv)
+leaks.enable_from_environment(sys.argv)
+startup.begin('imports')
+
 import kivy
 from kivy.app import App
 
-from kivy.uix.screenmanager import ScreenManager, Screen, SlideTransition
+# Hanya widget yang dipakai saat start; widget yang jarang dipakai
+# (Spinner, ProgressBar) diimpor di dalam screen yang membutuhkannya
+from kivy.uix.screenmanager import Screen, SlideTransition
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.textinput import TextInput
-from kivy.uix.image import Image
-from kivy.uix.popup import Popup
 from kivy.uix.widget import Widget
-from kivy.uix.anchorlayout import AnchorLayout
-from kivy.uix.stacklayout import StackLayout
-from kivy.uix.floatlayout import FloatLayout
 
 from kivy.core.window import Window
 from kivy.metrics import dp, sp
@@ -27,39 +33,28 @@ from kivy.graphics import Color, Rectangle, RoundedRectangle
 
 from kivy.properties import (
     StringProperty,
-    NumericProperty,
-    ListProperty,
-    ObjectProperty,
-    BooleanProperty
+    ListProperty
 )
 
-from kivy.clock import Clock
 from kivy.uix.behaviors import ButtonBehavior
-from kivy.uix.togglebutton import ToggleButton
-from kivy.uix.spinner import Spinner
-from kivy.uix.slider import Slider
-from kivy.uix.switch import Switch
-from kivy.uix.progressbar import ProgressBar
-from kivy.uix.carousel import Carousel
-from kivy.uix.tabbedpanel import TabbedPanel, TabbedPanelItem
-from kivy.uix.dropdown import DropDown
-from kivy.uix.modalview import ModalView
-
-# RecycleView imports (BENAR)
-from kivy.uix.recycleview import RecycleView
-from kivy.uix.recycleboxlayout import RecycleBoxLayout
-from kivy.uix.recyclegridlayout import RecycleGridLayout
-from kivy.uix.recycleview.views import RecycleDataViewBehavior
-from kivy.uix.recycleview.layout import LayoutSelectionBehavior
-from kivy.uix.behaviors import FocusBehavior
-from kivy.uix.recycleview.layout import RecycleLayoutManagerBehavior
 
-import math
-import json
 import os
-import sys
-import random
-from datetime import datetime
+
+from physicalc.core.registry import FormulaRegistry
+from components.lists import CardList, RecycleItemBehavior
+from components.navigation import LazyScreenManager
+from components.view_cache import ViewCache, release_all
+from components.scroll import StableScrollView
+from components.live import LiveCalculation
+
+from physicalc.core.catalog import get_topics, get_formula
+from physicalc.core.engine import DomainError, MissingInputError, ResultTooLargeError, ZeroInputError
+from physicalc.core.calculator import get_calculator, get_calculators
+from physicalc.core.validation import parse_number
+from physicalc.core.worksheet import CycleError, Worksheet
+from physicalc.ui import number_input_filter
+
+startup.end('imports')
 
 # Konfigurasi ukuran window untuk pengembangan
 Window.size = (280, 640)
@@ -72,37 +67,93 @@ Window.clearcolor = (0.95, 0.96, 0.98, 1)  # Warna latar belakang aplikasi
 class PhysicsApp(App):
     """Kelas utama aplikasi Fisika SMP"""
     
+    # Screen yang dibuat lebih awal setelah frame pertama tampil
+    PREWARM_SCREENS = ('formula_list',)
+    
     def build(self):
         """Membangun antarmuka aplikasi"""
+        with startup.phase('build'):
+            return self.build_screens()
+    
+    def build_screens(self):
+        """Mendaftarkan screen dan membuat halaman awal"""
         self.title = "Physicalc"
         self.icon = "assets/icon.png" if os.path.exists("assets/icon.png") else ""
         
-        # Inisialisasi ScreenManager
-        self.sm = ScreenManager(transition=SlideTransition())
-        
-        # Tambahkan screen
-        self.sm.add_widget(HomeScreen(name='home'))
-        self.sm.add_widget(FormulaListScreen(name='formula_list'))
-        self.sm.add_widget(CalculatorScreen(name='calculator'))
-        self.sm.add_widget(FormulaDetailScreen(name='formula_detail'))
-        self.sm.add_widget(AboutScreen(name='about'))
-        self.sm.add_widget(QuizScreen(name='quiz'))
-        self.sm.add_widget(SettingsScreen(name='settings'))
+        # Inisialisasi ScreenManager; screen dibuat saat pertama kali dibuka
+        self.sm = LazyScreenManager(transition=SlideTransition())
+        self.sm.bind(on_screen_built=self.on_screen_built)
+        Window.bind(on_memorywarning=self.on_memorywarning)
+        
+        # Daftarkan screen
+        self.sm.register('home', HomeScreen)
+        self.sm.register('formula_list', FormulaListScreen)
+        self.sm.register('calculator', CalculatorScreen)
+        self.sm.register('formula_detail', FormulaDetailScreen)
+        self.sm.register('about', AboutScreen)
+        self.sm.register('quiz', QuizScreen)
+        self.sm.register('settings', SettingsScreen)
+        
+        # Monitor frame (opt-in) mengukur semua method screen
+        monitor = frames.get_monitor()
+        if monitor is not None:
+            for factory in self.sm.factories.values():
+                monitor.instrument_class(factory)
+        
+        # Detektor kebocoran (opt-in) menghitung widget setelah setiap transisi
+        detector = leaks.get_detector()
+        if detector is not None:
+            detector.attach(self.sm)
+        
+        # Hanya halaman awal yang dibuat sekarang
+        self.sm.current = 'home'
         
         return self.sm
     
+    def on_screen_built(self, manager, screen, duration):
+        """Mencatat waktu konstruktor screen ke profiler startup/monitor frame (jika aktif)"""
+        startup.record(f'screen:{screen.name}', duration)
+        monitor = frames.get_monitor()
+        if monitor is not None:
+            monitor.note(f'build:{screen.name}', duration)
+    
     def on_start(self):
         """Dipanggil saat aplikasi dimulai"""
-        # Inisialisasi data jika diperlukan
-        pass
+        startup.begin('first_frame')
+        startup.finish_after_first_frame()
+        
+        monitor = frames.get_monitor()
+        if monitor is not None:
+            monitor.start()
+        
+        # Siapkan screen berikutnya yang paling mungkin dibuka
+        self.sm.prewarm(self.PREWARM_SCREENS)
+    
+    def on_stop(self):
+        """Dipanggil saat aplikasi ditutup"""
+        monitor = frames.get_monitor()
+        if monitor is not None:
+            monitor.stop()
+        detector = leaks.get_detector()
+        if detector is not None:
+            detector.export()
     
     def on_pause(self):
         """Dipanggil saat aplikasi di-pause (untuk mobile)"""
+        # Di Android aplikasi bisa dimatikan saat pause tanpa on_stop
+        monitor = frames.get_monitor()
+        if monitor is not None and monitor.running:
+            monitor.export()
         return True
     
     def on_resume(self):
         """Dipanggil saat aplikasi di-resume (untuk mobile)"""
         pass
+    
+    def on_memorywarning(self, window):
+        """Dipanggil saat memori sistem menipis (Android onLowMemory)"""
+        # Halaman detail yang di-cache bisa dibangun ulang; sisakan yang sedang tampil
+        release_all(keep=1)
 
 # ============================================================================
 # DATA RUMUS FISIKA SMP
@@ -111,351 +162,46 @@ class PhysicsApp(App):
 class FormulaData:
     """Kelas untuk menyimpan dan mengelola data rumus fisika"""
     
+    # Data berasal dari katalog terpadu (data/catalog.json) versi bahasa Indonesia.
+    # Registry dibangun sekali saat pertama kali dibutuhkan
+    _registry = None
+    
+    @classmethod
+    def get_registry(cls):
+        """Mengembalikan registry rumus (dibangun sekali lalu dibekukan)"""
+        if cls._registry is None:
+            cls._registry = FormulaRegistry(get_topics('id'))
+        return cls._registry
+    
     @staticmethod
     def get_all_formulas():
-        """Mengembalikan semua rumus fisika SMP"""
-        formulas = {
-            'gerak_lurus': {
-                'id': 'gerak_lurus',
-                'title': 'Gerak Lurus',
-                'category': 'Kinematika',
-                'icon': 'run',
-                'color': [0.2, 0.6, 0.9, 1],  # Biru
-                'formulas': [
-                    {
-                        'name': 'Kecepatan',
-                        'formula': 'v = s / t',
-                        'latex': 'v = \\frac{s}{t}',
-                        'description': 'Kecepatan adalah jarak yang ditempuh per satuan waktu.',
-                        'variables': [
-                            {'symbol': 'v', 'name': 'Kecepatan', 'unit': 'm/s'},
-                            {'symbol': 's', 'name': 'Jarak', 'unit': 'm'},
-                            {'symbol': 't', 'name': 'Waktu', 'unit': 's'}
-                        ],
-                        'example': 'Jika sebuah mobil menempuh jarak 100 meter dalam waktu 20 detik, maka kecepatannya adalah 5 m/s.',
-                        'notes': 'Kecepatan adalah besaran vektor yang memiliki nilai dan arah.'
-                    },
-                    {
-                        'name': 'Percepatan',
-                        'formula': 'a = Δv / Δt',
-                        'latex': 'a = \\frac{\\Delta v}{\\Delta t}',
-                        'description': 'Percepatan adalah perubahan kecepatan per satuan waktu.',
-                        'variables': [
-                            {'symbol': 'a', 'name': 'Percepatan', 'unit': 'm/s²'},
-                            {'symbol': 'Δv', 'name': 'Perubahan Kecepatan', 'unit': 'm/s'},
-                            {'symbol': 'Δt', 'name': 'Perubahan Waktu', 'unit': 's'}
-                        ],
-                        'example': 'Jika kecepatan meningkat dari 10 m/s menjadi 30 m/s dalam 5 detik, percepatannya adalah 4 m/s².',
-                        'notes': 'Percepatan bisa positif (percepatan) atau negatif (perlambatan).'
-                    },
-                    {
-                        'name': 'Gerak Lurus Beraturan (GLB)',
-                        'formula': 's = v × t',
-                        'latex': 's = v \\times t',
-                        'description': 'Jarak yang ditempuh dalam gerak lurus beraturan.',
-                        'variables': [
-                            {'symbol': 's', 'name': 'Jarak', 'unit': 'm'},
-                            {'symbol': 'v', 'name': 'Kecepatan', 'unit': 'm/s'},
-                            {'symbol': 't', 'name': 'Waktu', 'unit': 's'}
-                        ],
-                        'example': 'Jika bergerak dengan kecepatan 5 m/s selama 10 detik, jarak yang ditempuh adalah 50 meter.',
-                        'notes': 'Kecepatan konstan pada GLB.'
-                    }
-                ]
-            },
-            'gaya': {
-                'id': 'gaya',
-                'title': 'Gaya',
-                'category': 'Dinamika',
-                'icon': 'weight',
-                'color': [0.9, 0.5, 0.2, 1],  # Oranye
-                'formulas': [
-                    {
-                        'name': 'Hukum Newton II',
-                        'formula': 'F = m × a',
-                        'latex': 'F = m \\times a',
-                        'description': 'Gaya yang bekerja pada suatu benda sebanding dengan massa benda dan percepatannya.',
-                        'variables': [
-                            {'symbol': 'F', 'name': 'Gaya', 'unit': 'N (Newton)'},
-                            {'symbol': 'm', 'name': 'Massa', 'unit': 'kg'},
-                            {'symbol': 'a', 'name': 'Percepatan', 'unit': 'm/s²'}
-                        ],
-                        'example': 'Sebuah benda bermassa 2 kg mengalami percepatan 3 m/s², maka gaya yang bekerja adalah 6 Newton.',
-                        'notes': '1 Newton = 1 kg·m/s²'
-                    },
-                    {
-                        'name': 'Gaya Berat',
-                        'formula': 'w = m × g',
-                        'latex': 'w = m \\times g',
-                        'description': 'Gaya berat adalah gaya gravitasi yang bekerja pada suatu benda.',
-                        'variables': [
-                            {'symbol': 'w', 'name': 'Gaya Berat', 'unit': 'N'},
-                            {'symbol': 'm', 'name': 'Massa', 'unit': 'kg'},
-                            {'symbol': 'g', 'name': 'Percepatan Gravitasi', 'unit': 'm/s²'}
-                        ],
-                        'example': 'Benda bermassa 10 kg memiliki berat sekitar 98 N (dengan g = 9.8 m/s²).',
-                        'notes': 'Nilai g di permukaan bumi sekitar 9.8 m/s².'
-                    },
-                    {
-                        'name': 'Gaya Gesek',
-                        'formula': 'f = μ × N',
-                        'latex': 'f = \\mu \\times N',
-                        'description': 'Gaya gesek sebanding dengan gaya normal dan koefisien gesekan.',
-                        'variables': [
-                            {'symbol': 'f', 'name': 'Gaya Gesek', 'unit': 'N'},
-                            {'symbol': 'μ', 'name': 'Koefisien Gesek', 'unit': '-'},
-                            {'symbol': 'N', 'name': 'Gaya Normal', 'unit': 'N'}
-                        ],
-                        'example': 'Jika koefisien gesek 0.3 dan gaya normal 50 N, maka gaya gesek adalah 15 N.',
-                        'notes': 'Koefisien gesek bergantung pada permukaan yang bersentuhan.'
-                    }
-                ]
-            },
-            'tekanan': {
-                'id': 'tekanan',
-                'title': 'Tekanan',
-                'category': 'Fluida',
-                'icon': 'water',
-                'color': [0.3, 0.7, 0.5, 1],  # Hijau
-                'formulas': [
-                    {
-                        'name': 'Tekanan',
-                        'formula': 'P = F / A',
-                        'latex': 'P = \\frac{F}{A}',
-                        'description': 'Tekanan adalah gaya yang bekerja tegak lurus pada suatu permukaan per satuan luas.',
-                        'variables': [
-                            {'symbol': 'P', 'name': 'Tekanan', 'unit': 'Pa (Pascal)'},
-                            {'symbol': 'F', 'name': 'Gaya', 'unit': 'N'},
-                            {'symbol': 'A', 'name': 'Luas Permukaan', 'unit': 'm²'}
-                        ],
-                        'example': 'Jika gaya 100 N bekerja pada luas 2 m², maka tekanannya adalah 50 Pa.',
-                        'notes': '1 Pa = 1 N/m²'
-                    },
-                    {
-                        'name': 'Tekanan Hidrostatis',
-                        'formula': 'P = ρ × g × h',
-                        'latex': 'P = \\rho \\times g \\times h',
-                        'description': 'Tekanan pada zat cair akibat berat zat cair itu sendiri.',
-                        'variables': [
-                            {'symbol': 'P', 'name': 'Tekanan Hidrostatis', 'unit': 'Pa'},
-                            {'symbol': 'ρ', 'name': 'Massa Jenis', 'unit': 'kg/m³'},
-                            {'symbol': 'g', 'name': 'Percepatan Gravitasi', 'unit': 'm/s²'},
-                            {'symbol': 'h', 'name': 'Kedalaman', 'unit': 'm'}
-                        ],
-                        'example': 'Pada kedalaman 10 m dalam air (ρ=1000 kg/m³), tekanan hidrostatisnya sekitar 98.000 Pa.',
-                        'notes': 'Tekanan meningkat dengan bertambahnya kedalaman.'
-                    },
-                    {
-                        'name': 'Hukum Pascal',
-                        'formula': 'F₁/A₁ = F₂/A₂',
-                        'latex': '\\frac{F_1}{A_1} = \\frac{F_2}{A_2}',
-                        'description': 'Tekanan yang diberikan pada zat cair dalam ruang tertutup diteruskan sama besar ke segala arah.',
-                        'variables': [
-                            {'symbol': 'F₁, F₂', 'name': 'Gaya pada Piston', 'unit': 'N'},
-                            {'symbol': 'A₁, A₂', 'name': 'Luas Penampang Piston', 'unit': 'm²'}
-                        ],
-                        'example': 'Pada dongkrak hidrolik, gaya kecil pada piston kecil dapat menghasilkan gaya besar pada piston besar.',
-                        'notes': 'Prinsip ini digunakan dalam rem hidrolik dan dongkrak.'
-                    }
-                ]
-            },
-            'usaha': {
-                'id': 'usaha',
-                'title': 'Usaha',
-                'category': 'Energi',
-                'icon': 'cog',
-                'color': [0.8, 0.4, 0.7, 1],  # Ungu
-                'formulas': [
-                    {
-                        'name': 'Usaha',
-                        'formula': 'W = F × s × cos θ',
-                        'latex': 'W = F \\times s \\times \\cos\\theta',
-                        'description': 'Usaha adalah hasil kali gaya dengan perpindahan benda dan cosinus sudut antara keduanya.',
-                        'variables': [
-                            {'symbol': 'W', 'name': 'Usaha', 'unit': 'J (Joule)'},
-                            {'symbol': 'F', 'name': 'Gaya', 'unit': 'N'},
-                            {'symbol': 's', 'name': 'Perpindahan', 'unit': 'm'},
-                            {'symbol': 'θ', 'name': 'Sudut antara Gaya dan Perpindahan', 'unit': '°'}
-                        ],
-                        'example': 'Gaya 10 N menggerakkan benda sejauh 5 m searah gaya, maka usaha = 50 Joule.',
-                        'notes': 'Jika gaya tegak lurus perpindahan, usaha = 0.'
-                    },
-                    {
-                        'name': 'Usaha oleh Gaya Konstan',
-                        'formula': 'W = F × s',
-                        'latex': 'W = F \\times s',
-                        'description': 'Usaha ketika gaya searah dengan perpindahan.',
-                        'variables': [
-                            {'symbol': 'W', 'name': 'Usaha', 'unit': 'J'},
-                            {'symbol': 'F', 'name': 'Gaya', 'unit': 'N'},
-                            {'symbol': 's', 'name': 'Perpindahan', 'unit': 'm'}
-                        ],
-                        'example': 'Mendorong meja dengan gaya 20 N sejauh 3 m menghasilkan usaha 60 J.',
-                        'notes': 'Ini adalah kasus khusus ketika cos θ = 1.'
-                    }
-                ]
-            },
-            'energi_kinetik': {
-                'id': 'energi_kinetik',
-                'title': 'Energi Kinetik',
-                'category': 'Energi',
-                'icon': 'rocket',
-                'color': [0.9, 0.8, 0.2, 1],  # Kuning
-                'formulas': [
-                    {
-                        'name': 'Energi Kinetik',
-                        'formula': 'EK = ½ × m × v²',
-                        'latex': 'EK = \\frac{1}{2} \\times m \\times v^2',
-                        'description': 'Energi yang dimiliki benda karena geraknya.',
-                        'variables': [
-                            {'symbol': 'EK', 'name': 'Energi Kinetik', 'unit': 'J'},
-                            {'symbol': 'm', 'name': 'Massa', 'unit': 'kg'},
-                            {'symbol': 'v', 'name': 'Kecepatan', 'unit': 'm/s'}
-                        ],
-                        'example': 'Bola bermassa 0.5 kg bergerak dengan kecepatan 4 m/s memiliki energi kinetik 4 Joule.',
-                        'notes': 'Energi kinetik sebanding dengan kuadrat kecepatan.'
-                    },
-                    {
-                        'name': 'Teorema Usaha-Energi',
-                        'formula': 'W = ΔEK',
-                        'latex': 'W = \\Delta EK',
-                        'description': 'Usaha total yang dilakukan pada benda sama dengan perubahan energi kinetiknya.',
-                        'variables': [
-                            {'symbol': 'W', 'name': 'Usaha Total', 'unit': 'J'},
-                            {'symbol': 'ΔEK', 'name': 'Perubahan Energi Kinetik', 'unit': 'J'}
-                        ],
-                        'example': 'Jika energi kinetik bertambah 30 J, maka usaha total yang dilakukan adalah 30 J.',
-                        'notes': 'Teorema ini menghubungkan konsep usaha dan energi kinetik.'
-                    }
-                ]
-            },
-            'energi_potensial': {
-                'id': 'energi_potensial',
-                'title': 'Energi Potensial',
-                'category': 'Energi',
-                'icon': 'arrow-up-bold',
-                'color': [0.4, 0.8, 0.6, 1],  # Hijau muda
-                'formulas': [
-                    {
-                        'name': 'Energi Potensial Gravitasi',
-                        'formula': 'EP = m × g × h',
-                        'latex': 'EP = m \\times g \\times h',
-                        'description': 'Energi yang dimiliki benda karena kedudukannya terhadap bumi.',
-                        'variables': [
-                            {'symbol': 'EP', 'name': 'Energi Potensial', 'unit': 'J'},
-                            {'symbol': 'm', 'name': 'Massa', 'unit': 'kg'},
-                            {'symbol': 'g', 'name': 'Percepatan Gravitasi', 'unit': 'm/s²'},
-                            {'symbol': 'h', 'name': 'Ketinggian', 'unit': 'm'}
-                        ],
-                        'example': 'Buku bermassa 1 kg pada ketinggian 2 m memiliki energi potensial sekitar 19.6 J.',
-                        'notes': 'Energi potensial nol pada ketinggian nol (acuan).'
-                    },
-                    {
-                        'name': 'Energi Potensial Pegas',
-                        'formula': 'EP = ½ × k × x²',
-                        'latex': 'EP = \\frac{1}{2} \\times k \\times x^2',
-                        'description': 'Energi yang tersimpan pada pegas yang diregangkan atau ditekan.',
-                        'variables': [
-                            {'symbol': 'EP', 'name': 'Energi Potensial Pegas', 'unit': 'J'},
-                            {'symbol': 'k', 'name': 'Konstanta Pegas', 'unit': 'N/m'},
-                            {'symbol': 'x', 'name': 'Simpangan', 'unit': 'm'}
-                        ],
-                        'example': 'Pegas dengan k = 100 N/m diregangkan 0.1 m menyimpan energi 0.5 J.',
-                        'notes': 'Energi potensial pegas selalu positif.'
-                    }
-                ]
-            },
-            'daya': {
-                'id': 'daya',
-                'title': 'Daya',
-                'category': 'Energi',
-                'icon': 'flash',
-                'color': [1, 0.6, 0.2, 1],  # Jingga
-                'formulas': [
-                    {
-                        'name': 'Daya',
-                        'formula': 'P = W / t',
-                        'latex': 'P = \\frac{W}{t}',
-                        'description': 'Daya adalah laju usaha dilakukan atau energi ditransfer per satuan waktu.',
-                        'variables': [
-                            {'symbol': 'P', 'name': 'Daya', 'unit': 'W (Watt)'},
-                            {'symbol': 'W', 'name': 'Usaha', 'unit': 'J'},
-                            {'symbol': 't', 'name': 'Waktu', 'unit': 's'}
-                        ],
-                        'example': 'Jika usaha 600 J dilakukan dalam 2 detik, dayanya adalah 300 Watt.',
-                        'notes': '1 Watt = 1 Joule/detik'
-                    },
-                    {
-                        'name': 'Daya dalam Gerak',
-                        'formula': 'P = F × v',
-                        'latex': 'P = F \\times v',
-                        'description': 'Daya juga dapat dihitung sebagai hasil kali gaya dan kecepatan.',
-                        'variables': [
-                            {'symbol': 'P', 'name': 'Daya', 'unit': 'W'},
-                            {'symbol': 'F', 'name': 'Gaya', 'unit': 'N'},
-                            {'symbol': 'v', 'name': 'Kecepatan', 'unit': 'm/s'}
-                        ],
-                        'example': 'Gaya 50 N menggerakkan benda dengan kecepatan 3 m/s menghasilkan daya 150 W.',
-                        'notes': 'Rumus ini berguna ketika gaya konstan searah kecepatan.'
-                    }
-                ]
-            },
-            'massa_jenis': {
-                'id': 'massa_jenis',
-                'title': 'Massa Jenis',
-                'category': 'Materi',
-                'icon': 'cube',
-                'color': [0.6, 0.4, 0.8, 1],  # Ungu tua
-                'formulas': [
-                    {
-                        'name': 'Massa Jenis',
-                        'formula': 'ρ = m / V',
-                        'latex': '\\rho = \\frac{m}{V}',
-                        'description': 'Massa jenis adalah massa per satuan volume suatu zat.',
-                        'variables': [
-                            {'symbol': 'ρ', 'name': 'Massa Jenis', 'unit': 'kg/m³'},
-                            {'symbol': 'm', 'name': 'Massa', 'unit': 'kg'},
-                            {'symbol': 'V', 'name': 'Volume', 'unit': 'm³'}
-                        ],
-                        'example': 'Benda bermassa 500 kg dengan volume 0.2 m³ memiliki massa jenis 2500 kg/m³.',
-                        'notes': 'Massa jenis air sekitar 1000 kg/m³.'
-                    },
-                    {
-                        'name': 'Massa Jenis Relatif',
-                        'formula': 'ρ_relatif = ρ_benda / ρ_air',
-                        'latex': '\\rho_{relatif} = \\frac{\\rho_{benda}}{\\rho_{air}}',
-                        'description': 'Perbandingan massa jenis benda terhadap massa jenis air.',
-                        'variables': [
-                            {'symbol': 'ρ_relatif', 'name': 'Massa Jenis Relatif', 'unit': '-'},
-                            {'symbol': 'ρ_benda', 'name': 'Massa Jenis Benda', 'unit': 'kg/m³'},
-                            {'symbol': 'ρ_air', 'name': 'Massa Jenis Air', 'unit': 'kg/m³'}
-                        ],
-                        'example': 'Jika massa jenis benda 800 kg/m³, massa jenis relatifnya adalah 0.8.',
-                        'notes': 'Benda dengan ρ < 1 akan mengapung di air.'
-                    }
-                ]
-            }
-        }
-        
-        # Tambahkan materi tambahan untuk mencapai 8 materi
-        # (sudah ada 8 materi di atas)
-        
-        return formulas
+        """Mengembalikan semua rumus fisika SMP (read-only)"""
+        return FormulaData.get_registry().topics
     
     @staticmethod
     def get_formula_by_id(formula_id):
         """Mengembalikan rumus berdasarkan ID"""
-        formulas = FormulaData.get_all_formulas()
-        return formulas.get(formula_id, None)
+        return FormulaData.get_registry().get_topic(formula_id)
     
     @staticmethod
     def get_all_categories():
         """Mengembalikan semua kategori rumus"""
-        formulas = FormulaData.get_all_formulas()
-        categories = set()
-        for formula in formulas.values():
-            categories.add(formula['category'])
-        return list(categories)
+        return list(FormulaData.get_registry().categories)
+    
+    @staticmethod
+    def get_formulas_by_category(category):
+        """Mengembalikan semua materi dalam satu kategori"""
+        return FormulaData.get_registry().get_topics_by_category(category)
+    
+    @staticmethod
+    def get_formula_by_name(name):
+        """Mengembalikan pasangan (ID materi, rumus) berdasarkan nama rumus"""
+        return FormulaData.get_registry().get_formula_by_name(name)
+    
+    @staticmethod
+    def get_formulas_by_symbol(symbol):
+        """Mengembalikan semua rumus yang memakai simbol variabel tertentu"""
+        return FormulaData.get_registry().get_formulas_by_symbol(symbol)
 
 # ============================================================================
 # KOMPONEN UI KUSTOM
@@ -498,6 +244,7 @@ class PhysicsCard(ButtonBehavior, BoxLayout):
     title = StringProperty('')
     subtitle = StringProperty('')
     icon = StringProperty('')
+    count_text = StringProperty('')
     color = ListProperty([0.2, 0.6, 0.9, 1])
     
     def __init__(self, **kwargs):
@@ -509,7 +256,7 @@ class PhysicsCard(ButtonBehavior, BoxLayout):
         self.spacing = dp(10)
         
         with self.canvas.before:
-            Color(*self.color)
+            self.bg_color = Color(*self.color)
             self.rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[15])
         
         self.bind(pos=self.update_rect, size=self.update_rect)
@@ -519,7 +266,7 @@ class PhysicsCard(ButtonBehavior, BoxLayout):
         
         # Ikon (simulasi dengan label)
         icon_label = Label(
-            text='[•]' if not self.icon else f'[{self.icon}]',
+            text=self.icon_text(),
             font_size=sp(24),
             markup=True,
             size_hint=(None, 1),
@@ -566,22 +313,45 @@ class PhysicsCard(ButtonBehavior, BoxLayout):
         separator = Widget(size_hint=(1, None), height=dp(1))
         with separator.canvas:
             Color(0, 0, 0, 0.1)
-            Rectangle(pos=separator.pos, size=separator.size)
+            separator.rect = Rectangle(pos=separator.pos, size=separator.size)
+        separator.bind(pos=self.update_separator, size=self.update_separator)
         self.add_widget(separator)
         
         # Jumlah rumus
         formula_count = Label(
-            text='3 rumus tersedia',
+            text=self.count_text,
             font_size=sp(12),
             color=[0.5, 0.5, 0.5, 1],
             halign='left'
         )
         formula_count.bind(size=formula_count.setter('text_size'))
         self.add_widget(formula_count)
+        
+        # Tampilan mengikuti property agar kartu bisa dipakai ulang RecycleView
+        self.bind(
+            title=title_label.setter('text'),
+            subtitle=subtitle_label.setter('text'),
+            icon=lambda instance, value: setattr(icon_label, 'text', self.icon_text()),
+            count_text=formula_count.setter('text'),
+            color=lambda instance, value: setattr(self.bg_color, 'rgba', value)
+        )
+    
+    def icon_text(self):
+        return '[•]' if not self.icon else f'[{self.icon}]'
     
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
+    
+    def update_separator(self, instance, value):
+        instance.rect.pos = instance.pos
+        instance.rect.size = instance.size
+
+class PhysicsCardView(RecycleItemBehavior, PhysicsCard):
+    """PhysicsCard untuk CardList; data baris: title, subtitle, count_text, color"""
+    
+    def on_press(self):
+        self.select()
 
 class FormulaCard(BoxLayout):
     """Kartu untuk menampilkan detail rumus"""
@@ -689,14 +459,15 @@ class CalculatorInput(BoxLayout):
         self.height = dp(60)
         self.spacing = dp(10)
         
-        # Label
+        # Label (mengikuti property label agar baris bisa dipakai ulang)
         label_widget = Label(
             text=self.label,
             font_size=sp(16),
-            size_hint=(0.4, 1),
+            size_hint=(0.35, 1),
             halign='left'
         )
         label_widget.bind(size=label_widget.setter('text_size'))
+        self.bind(label=label_widget.setter('text'))
         self.add_widget(label_widget)
         
         # Input field
@@ -704,12 +475,12 @@ class CalculatorInput(BoxLayout):
             text=self.value,
             multiline=False,
             font_size=sp(16),
-            size_hint=(0.4, 1),
+            size_hint=(0.35, 1),
             background_color=[1, 1, 1, 1],
             foreground_color=[0, 0, 0, 1],
             padding=[dp(10), dp(10)],
             write_tab=False,
-            input_filter='float'
+            input_filter=number_input_filter
         )
         self.add_widget(self.input_field)
         
@@ -717,10 +488,28 @@ class CalculatorInput(BoxLayout):
         unit_widget = Label(
             text=self.unit,
             font_size=sp(16),
-            size_hint=(0.2, 1),
+            size_hint=(0.15, 1),
             halign='left'
         )
+        self.bind(unit=unit_widget.setter('text'))
         self.add_widget(unit_widget)
+        
+        # Tombol tautan: mengambil nilai dari hasil kalkulator lain
+        self.link_button = Button(
+            text='←',
+            font_size=sp(18),
+            size_hint=(0.15, 1),
+            background_color=[0.85, 0.85, 0.85, 1],
+            color=[0.2, 0.2, 0.2, 1]
+        )
+        self.add_widget(self.link_button)
+    
+    def set_linked(self, linked):
+        """Input tertaut hanya menampilkan nilai sumber (tidak bisa diketik)"""
+        self.input_field.readonly = linked
+        self.input_field.background_color = [0.9, 0.95, 1, 1] if linked else [1, 1, 1, 1]
+        self.link_button.background_color = [0.2, 0.6, 0.9, 1] if linked else [0.85, 0.85, 0.85, 1]
+        self.link_button.color = [1, 1, 1, 1] if linked else [0.2, 0.2, 0.2, 1]
 
 # ============================================================================
 # SCREEN APLIKASI
@@ -916,36 +705,33 @@ class FormulaListScreen(Screen):
         header.add_widget(title_label)
         header.add_widget(spacer)
         
-        # Konten dengan ScrollView
-        scroll = ScrollView(size_hint=(1, 1))
-        
-        # Grid layout untuk kartu-kartu rumus
-        self.content_layout = GridLayout(
-            cols=1,
+        # Daftar materi tervirtualisasi: hanya kartu yang terlihat yang dibuat
+        self.topic_list = CardList(
+            viewclass='PhysicsCardView',
+            item_height=dp(120),
             spacing=dp(15),
-            size_hint_y=None,
             padding=[dp(15), dp(15), dp(15), dp(15)]
         )
-        self.content_layout.bind(minimum_height=self.content_layout.setter('height'))
+        self.topic_list.bind(
+            on_item_press=lambda instance, index, data: self.show_formula_detail(data['formula_id'])
+        )
         
-        # Ambil data rumus
+        # Satu baris data per materi
         formulas = FormulaData.get_all_formulas()
-        
-        # Tambahkan kartu untuk setiap materi
-        for formula_id, formula_data in formulas.items():
-            card = PhysicsCard(
-                title=formula_data['title'],
-                subtitle=formula_data['category'],
-                color=formula_data['color']
-            )
-            card.bind(on_press=lambda instance, fid=formula_id: self.show_formula_detail(fid))
-            self.content_layout.add_widget(card)
-        
-        scroll.add_widget(self.content_layout)
+        self.topic_list.data = [
+            {
+                'formula_id': formula_id,
+                'title': formula_data['title'],
+                'subtitle': formula_data['category'],
+                'count_text': f"{len(formula_data['formulas'])} rumus tersedia",
+                'color': formula_data['color']
+            }
+            for formula_id, formula_data in formulas.items()
+        ]
         
         # Gabungkan semua komponen
         main_layout.add_widget(header)
-        main_layout.add_widget(scroll)
+        main_layout.add_widget(self.topic_list)
         
         self.add_widget(main_layout)
     
@@ -961,6 +747,9 @@ class FormulaListScreen(Screen):
 class FormulaDetailScreen(Screen):
     """Halaman detail rumus"""
     
+    # Jumlah halaman rumus yang disimpan untuk dibuka ulang tanpa membangun kartu
+    VIEW_CACHE_SIZE = 8
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'formula_detail'
@@ -972,7 +761,7 @@ class FormulaDetailScreen(Screen):
         # Header dengan tombol kembali
         self.header = BoxLayout(size_hint=(1, 0.12), padding=[dp(10), 0, dp(10), 0])
         with self.header.canvas.before:
-            Color(0.2, 0.6, 0.9, 1)
+            self.header_color = Color(0.2, 0.6, 0.9, 1)
             self.header_rect = Rectangle(pos=self.header.pos, size=self.header.size)
         
         self.header.bind(pos=self.update_header_rect, size=self.update_header_rect)
@@ -1003,19 +792,10 @@ class FormulaDetailScreen(Screen):
         self.header.add_widget(self.title_label)
         self.header.add_widget(spacer)
         
-        # Konten dengan ScrollView
-        self.scroll = ScrollView(size_hint=(1, 1))
-        
-        # Layout konten
-        self.content_layout = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            padding=[dp(20), dp(20), dp(20), dp(20)],
-            spacing=dp(20)
-        )
-        self.content_layout.bind(minimum_height=self.content_layout.setter('height'))
-        
-        self.scroll.add_widget(self.content_layout)
+        # Konten dengan ScrollView; isinya subtree per rumus dari view_cache
+        self.scroll = StableScrollView(size_hint=(1, 1))
+        self.view_cache = ViewCache(maxsize=self.VIEW_CACHE_SIZE)
+        self.content_layout = None
         
         # Gabungkan semua komponen
         main_layout.add_widget(self.header)
@@ -1037,12 +817,26 @@ class FormulaDetailScreen(Screen):
         
         # Update header
         self.title_label.text = formula_data['title']
-        with self.header.canvas.before:
-            Color(*formula_data['color'])
-            self.header_rect = Rectangle(pos=self.header.pos, size=self.header.size)
-        
-        # Clear konten sebelumnya
-        self.content_layout.clear_widgets()
+        # Ubah warna instruksi yang sudah ada; jangan menambah instruksi baru ke canvas
+        self.header_color.rgba = formula_data['color']
+        
+        # Pakai ulang kartu yang sudah dibangun jika rumus ini pernah dibuka
+        content = self.view_cache.get_or_build(formula_id, lambda key: self.build_content(formula_data))
+        if content is not self.content_layout:
+            self.scroll.clear_widgets()
+            self.scroll.add_widget(content)
+            self.content_layout = content
+        self.scroll.scroll_y = 1
+    
+    def build_content(self, formula_data):
+        """Membangun layout konten (judul, kartu rumus, contoh, catatan) untuk satu rumus"""
+        content_layout = BoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            padding=[dp(20), dp(20), dp(20), dp(20)],
+            spacing=dp(20)
+        )
+        content_layout.bind(minimum_height=content_layout.setter('height'))
         
         # Tambahkan judul dan kategori
         title_container = BoxLayout(orientation='vertical', size_hint=(1, None), height=dp(80))
@@ -1068,17 +862,17 @@ class FormulaDetailScreen(Screen):
         
         title_container.add_widget(main_title)
         title_container.add_widget(category)
-        self.content_layout.add_widget(title_container)
+        content_layout.add_widget(title_container)
         
         # Tambahkan kartu untuk setiap rumus
         for formula in formula_data['formulas']:
             card = FormulaCard(
-                formula_name=formula['name'],
+                formula_name=formula['title'],
                 formula=formula['formula'],
                 description=formula['description'],
                 variables=formula['variables']
             )
-            self.content_layout.add_widget(card)
+            content_layout.add_widget(card)
             
             # Tambahkan contoh jika ada
             if 'example' in formula:
@@ -1116,7 +910,7 @@ class FormulaDetailScreen(Screen):
                 
                 example_box.add_widget(example_title)
                 example_box.add_widget(example_text)
-                self.content_layout.add_widget(example_box)
+                content_layout.add_widget(example_box)
             
             # Tambahkan catatan jika ada
             if 'notes' in formula:
@@ -1154,22 +948,43 @@ class FormulaDetailScreen(Screen):
                 
                 notes_box.add_widget(notes_title)
                 notes_box.add_widget(notes_text)
-                self.content_layout.add_widget(notes_box)
+                content_layout.add_widget(notes_box)
         
         # Update tinggi konten layout
-        self.content_layout.height = sum(child.height for child in self.content_layout.children) + dp(40)
+        content_layout.height = sum(child.height for child in content_layout.children) + dp(40)
+        
+        return content_layout
     
     def go_back(self, instance):
         """Kembali ke halaman daftar rumus"""
         self.manager.current = 'formula_list'
 
 class CalculatorScreen(Screen):
-    """Halaman kalkulator fisika"""
+    """
+    Halaman kalkulator fisika untuk semua rumus di katalog
+    
+    Setiap rumus yang pernah dibuka menjadi satu sel di lembar kerja
+    (Worksheet) dengan ID sel = ID rumus. Input bisa ditautkan ke hasil
+    rumus lain (tombol ←), misalnya F pada tekanan dari hasil kalkulator
+    gaya; mengubah input gaya lalu hanya menghitung ulang sel turunannya.
+    """
+    
+    # Rumus yang dipilih saat kalkulator pertama kali dibuka
+    DEFAULT_FORMULA = 'linear_motion'
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'calculator'
-        self.current_calculator = 'kecepatan'  # Default
+        self.current_calculator = self.DEFAULT_FORMULA
+        
+        # Pool input: baris dipakai ulang (label diganti) saat rumus berganti
+        self.input_rows = []
+        
+        # Hasil dihitung ulang otomatis setelah pengguna berhenti mengetik
+        self.live = LiveCalculation(self.read_inputs, self.show_live_result, self.clear_result)
+        
+        # Lembar kerja: input tiap rumus diingat dan hasilnya bisa ditautkan
+        self.worksheet = Worksheet()
         
         # Layout utama
         main_layout = BoxLayout(orientation='vertical')
@@ -1209,39 +1024,24 @@ class CalculatorScreen(Screen):
         # Konten
         content = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(20))
         
-        # Pilihan kalkulator
-        calc_selector = GridLayout(cols=3, spacing=dp(10), size_hint=(1, None), height=dp(50))
-        
-        kecepatan_btn = ToggleButton(
-            text='Kecepatan',
-            group='calculator',
-            state='down' if self.current_calculator == 'kecepatan' else 'normal',
-            on_press=lambda x: self.switch_calculator('kecepatan')
-        )
-        
-        gaya_btn = ToggleButton(
-            text='Gaya',
-            group='calculator',
-            state='down' if self.current_calculator == 'gaya' else 'normal',
-            on_press=lambda x: self.switch_calculator('gaya')
-        )
+        # Pilihan kalkulator: semua rumus di katalog
+        from kivy.uix.spinner import Spinner
         
-        tekanan_btn = ToggleButton(
-            text='Tekanan',
-            group='calculator',
-            state='down' if self.current_calculator == 'tekanan' else 'normal',
-            on_press=lambda x: self.switch_calculator('tekanan')
+        self.calculators = {spec.label: spec.formula_id for spec in get_calculators('id')}
+        self.calc_selector = Spinner(
+            text=get_calculator(self.current_calculator, 'id').label,
+            values=list(self.calculators),
+            size_hint=(1, None),
+            height=dp(50)
         )
+        self.calc_selector.bind(text=self.on_calculator_selected)
         
-        calc_selector.add_widget(kecepatan_btn)
-        calc_selector.add_widget(gaya_btn)
-        calc_selector.add_widget(tekanan_btn)
-        
-        content.add_widget(calc_selector)
+        content.add_widget(self.calc_selector)
         
         # Area kalkulator
         self.calculator_area = BoxLayout(orientation='vertical', spacing=dp(15))
-        self.setup_kecepatan_calculator()
+        self.setup_calculator_area()
+        self.switch_calculator(self.current_calculator)
         
         content.add_widget(self.calculator_area)
         
@@ -1255,51 +1055,42 @@ class CalculatorScreen(Screen):
         """Kembali ke halaman utama"""
         self.manager.current = 'home'
     
-    def switch_calculator(self, calculator_type):
-        """Mengganti jenis kalkulator"""
-        self.current_calculator = calculator_type
-        self.calculator_area.clear_widgets()
-        
-        if calculator_type == 'kecepatan':
-            self.setup_kecepatan_calculator()
-        elif calculator_type == 'gaya':
-            self.setup_gaya_calculator()
-        elif calculator_type == 'tekanan':
-            self.setup_tekanan_calculator()
+    def on_calculator_selected(self, spinner, text):
+        """Dipanggil saat rumus dipilih dari spinner"""
+        formula_id = self.calculators.get(text)
+        if formula_id and formula_id != self.current_calculator:
+            self.switch_calculator(formula_id)
     
-    def setup_kecepatan_calculator(self):
-        """Setup kalkulator kecepatan"""
+    def setup_calculator_area(self):
+        """Membuat widget area kalkulator sekali; isinya diganti oleh switch_calculator"""
         # Judul
-        title = Label(
-            text='Hitung Kecepatan (v = s/t)',
+        self.calc_title = Label(
             font_size=sp(20),
             bold=True,
             color=[0.1, 0.1, 0.1, 1],
+            halign='center',
             size_hint=(1, None),
             height=dp(40)
         )
-        self.calculator_area.add_widget(title)
+        self.calc_title.bind(size=self.calc_title.setter('text_size'))
+        self.calculator_area.add_widget(self.calc_title)
         
-        # Input jarak
-        self.jarak_input = CalculatorInput(label='Jarak (s):', unit='m')
-        self.calculator_area.add_widget(self.jarak_input)
-        
-        # Input waktu
-        self.waktu_input = CalculatorInput(label='Waktu (t):', unit='s')
-        self.calculator_area.add_widget(self.waktu_input)
+        # Baris input (diisi dari pool)
+        self.input_area = BoxLayout(orientation='vertical', spacing=dp(15), size_hint=(1, None))
+        self.input_area.bind(minimum_height=self.input_area.setter('height'))
+        self.calculator_area.add_widget(self.input_area)
         
         # Tombol hitung
-        calculate_btn = Button(
-            text='HITUNG KECEPATAN',
+        self.calculate_btn = Button(
             font_size=sp(18),
             bold=True,
             background_color=[0.2, 0.6, 0.9, 1],
             color=[1, 1, 1, 1],
             size_hint=(1, None),
             height=dp(50),
-            on_press=self.calculate_kecepatan
+            on_press=self.calculate
         )
-        self.calculator_area.add_widget(calculate_btn)
+        self.calculator_area.add_widget(self.calculate_btn)
         
         # Hasil
         self.result_label = Label(
@@ -1311,167 +1102,192 @@ class CalculatorScreen(Screen):
         )
         self.calculator_area.add_widget(self.result_label)
     
-    def setup_gaya_calculator(self):
-        """Setup kalkulator gaya"""
-        # Judul
-        title = Label(
-            text='Hitung Gaya (F = m × a)',
-            font_size=sp(20),
-            bold=True,
-            color=[0.1, 0.1, 0.1, 1],
-            size_hint=(1, None),
-            height=dp(40)
-        )
-        self.calculator_area.add_widget(title)
-        
-        # Input massa
-        self.massa_input = CalculatorInput(label='Massa (m):', unit='kg')
-        self.calculator_area.add_widget(self.massa_input)
-        
-        # Input percepatan
-        self.percepatan_input = CalculatorInput(label='Percepatan (a):', unit='m/s²')
-        self.calculator_area.add_widget(self.percepatan_input)
-        
-        # Tombol hitung
-        calculate_btn = Button(
-            text='HITUNG GAYA',
-            font_size=sp(18),
-            bold=True,
-            background_color=[0.9, 0.5, 0.2, 1],
-            color=[1, 1, 1, 1],
-            size_hint=(1, None),
-            height=dp(50),
-            on_press=self.calculate_gaya
-        )
-        self.calculator_area.add_widget(calculate_btn)
-        
-        # Hasil
-        self.result_label = Label(
-            text='Hasil akan muncul di sini',
-            font_size=sp(16),
-            color=[0.3, 0.3, 0.3, 1],
-            size_hint=(1, None),
-            height=dp(80)
-        )
-        self.calculator_area.add_widget(self.result_label)
+    def switch_calculator(self, formula_id):
+        """Mengganti rumus kalkulator dengan memberi label ulang pada baris input"""
+        self.current_calculator = formula_id
+        spec = get_calculator(formula_id, 'id')
+        
+        self.calc_selector.text = spec.label
+        self.calc_title.text = f'Hitung {spec.target_name} ({spec.formula})'
+        self.calculate_btn.text = f'HITUNG {spec.target_name.upper()}'
+        
+        while len(self.input_rows) < len(spec.fields):
+            row = CalculatorInput()
+            self.live.watch(row.input_field)
+            row.link_button.bind(on_release=self.open_link_menu)
+            self.input_rows.append(row)
+        
+        if formula_id not in self.worksheet:
+            self.worksheet.add_cell(formula_id, cell_id=formula_id)
+        cell = self.worksheet.cell(formula_id)
+        values = self.worksheet.input_values(formula_id)
+        
+        for row, field in zip(self.input_rows, spec.fields):
+            row.label = f'{field.name} ({field.symbol}):'
+            row.unit = field.unit
+            row.set_linked(field.symbol in cell.links)
+            value = values[field.symbol]
+            if value is not None:
+                row.input_field.text = f'{value:.10g}'
+            elif field.symbol in cell.links:
+                row.input_field.text = ''
+            else:
+                # Input dikosongkan kecuali rumus punya nilai default (misalnya g = 9.8)
+                row.input_field.text = '' if field.default == '0' else field.default
+        
+        # Pasang hanya baris yang dipakai rumus ini
+        rows = self.input_rows[:len(spec.fields)]
+        if list(reversed(self.input_area.children)) != rows:
+            self.input_area.clear_widgets()
+            for row in rows:
+                self.input_area.add_widget(row)
+        
+        # Hasil yang sudah ada di lembar kerja langsung ditampilkan
+        values = self.read_inputs()
+        self.live.reset(values)
+        if values is None:
+            self.clear_result()
+        else:
+            self.calculate(None)
     
-    def setup_tekanan_calculator(self):
-        """Setup kalkulator tekanan"""
-        # Judul
-        title = Label(
-            text='Hitung Tekanan (P = F/A)',
-            font_size=sp(20),
-            bold=True,
-            color=[0.1, 0.1, 0.1, 1],
-            size_hint=(1, None),
-            height=dp(40)
-        )
-        self.calculator_area.add_widget(title)
-        
-        # Input gaya
-        self.gaya_input = CalculatorInput(label='Gaya (F):', unit='N')
-        self.calculator_area.add_widget(self.gaya_input)
-        
-        # Input luas
-        self.luas_input = CalculatorInput(label='Luas (A):', unit='m²')
-        self.calculator_area.add_widget(self.luas_input)
-        
-        # Tombol hitung
-        calculate_btn = Button(
-            text='HITUNG TEKANAN',
-            font_size=sp(18),
-            bold=True,
-            background_color=[0.3, 0.7, 0.5, 1],
-            color=[1, 1, 1, 1],
-            size_hint=(1, None),
-            height=dp(50),
-            on_press=self.calculate_tekanan
-        )
-        self.calculator_area.add_widget(calculate_btn)
-        
-        # Hasil
-        self.result_label = Label(
-            text='Hasil akan muncul di sini',
-            font_size=sp(16),
-            color=[0.3, 0.3, 0.3, 1],
-            size_hint=(1, None),
-            height=dp(80)
-        )
-        self.calculator_area.add_widget(self.result_label)
+    def open_link_menu(self, button):
+        """Menampilkan pilihan sumber nilai untuk satu input"""
+        from kivy.uix.dropdown import DropDown
+        
+        row = button.parent
+        field = get_calculator(self.current_calculator, 'id').fields[self.input_rows.index(row)]
+        
+        dropdown = DropDown()
+        choices = [(None, 'Isi manual')]
+        for formula_id in self.worksheet.cells:
+            source = get_calculator(formula_id, 'id')
+            if formula_id != self.current_calculator and source.unit == field.unit:
+                value = self.worksheet.cell(formula_id).value
+                shown = '-' if value is None else f'{value:.4g}'
+                choices.append((formula_id, f'{source.target_name} ({source.title}) = {shown} {source.unit}'))
+        
+        for source_id, text in choices:
+            option = Button(text=text, size_hint_y=None, height=dp(44))
+            option.bind(on_release=lambda option, source_id=source_id: self.select_link(
+                dropdown, field.symbol, source_id))
+            dropdown.add_widget(option)
+        dropdown.open(button)
     
-    def calculate_kecepatan(self, instance):
-        """Menghitung kecepatan"""
+    def select_link(self, dropdown, symbol, source_id):
+        """Menautkan input ke hasil rumus lain (None = kembali diisi manual)"""
+        dropdown.dismiss()
         try:
-            # Ambil nilai dari input
-            jarak = float(self.jarak_input.input_field.text)
-            waktu = float(self.waktu_input.input_field.text)
-            
-            # Validasi input
-            if waktu == 0:
-                self.result_label.text = 'Error: Waktu tidak boleh nol!'
-                self.result_label.color = [1, 0, 0, 1]
-                return
-            
-            # Hitung kecepatan
-            kecepatan = jarak / waktu
-            
-            # Tampilkan hasil
-            self.result_label.text = f'Hasil:\nKecepatan = {kecepatan:.2f} m/s\n\nv = s / t\nv = {jarak} / {waktu}\nv = {kecepatan:.2f} m/s'
-            self.result_label.color = [0, 0.5, 0, 1]
-            
-        except ValueError:
-            self.result_label.text = 'Error: Masukkan angka yang valid!'
-            self.result_label.color = [1, 0, 0, 1]
-        except Exception as e:
-            self.result_label.text = f'Error: {str(e)}'
+            if source_id is None:
+                self.worksheet.unlink(self.current_calculator, symbol)
+            else:
+                self.worksheet.link(self.current_calculator, symbol, source_id)
+        except CycleError:
+            self.result_label.text = 'Error: Tautan membuat perhitungan berputar!'
             self.result_label.color = [1, 0, 0, 1]
+            return
+        self.worksheet.recompute()
+        self.switch_calculator(self.current_calculator)
+    
+    def clear_result(self):
+        """Mengembalikan label hasil ke teks awal"""
+        self.result_label.text = 'Hasil akan muncul di sini'
+        self.result_label.color = [0.3, 0.3, 0.3, 1]
     
-    def calculate_gaya(self, instance):
-        """Menghitung gaya"""
+    def read_inputs(self):
+        """Nilai input {simbol: angka}, atau None jika ada input yang kosong/tidak valid"""
+        fields = get_calculator(self.current_calculator, 'id').fields
+        linked = self.worksheet.input_values(self.current_calculator)
+        links = self.worksheet.cell(self.current_calculator).links
+        values = {}
+        for row, field in zip(self.input_rows, fields):
+            if field.symbol in links:
+                value = linked[field.symbol]
+            else:
+                try:
+                    value = parse_number(row.input_field.text)
+                except ValueError:
+                    value = None
+            if value is None:
+                return None
+            values[field.symbol] = value
+        return values
+    
+    def show_live_result(self, values):
+        """Dipanggil LiveCalculation saat semua input terisi dan nilainya berubah"""
+        self.calculate(None)
+    
+    def calculate(self, instance):
+        """Menghitung rumus yang sedang aktif"""
+        fields = get_calculator(self.current_calculator, 'id').fields
+        self.hitung_rumus(
+            self.current_calculator,
+            {field.symbol: row for row, field in zip(self.input_rows, fields)}
+        )
+    
+    def hitung_rumus(self, formula_id, inputs):
+        """
+        Menghitung rumus katalog lewat lembar kerja lalu menampilkan langkahnya
+        
+        Input manual disimpan ke sel rumus; input tertaut memakai hasil sel
+        sumber. Sel lain yang memakai hasil rumus ini ikut dihitung ulang.
+        
+        Args:
+            formula_id: ID rumus di katalog
+            inputs: Dictionary {simbol variabel: CalculatorInput}
+        """
+        spec = get_calculator(formula_id, 'id')
+        rumus = spec.compiled
+        target = spec.target
+        nama = spec.target_name
+        satuan = spec.unit
+        cell = self.worksheet.cell(formula_id)
+        
         try:
-            # Ambil nilai dari input
-            massa = float(self.massa_input.input_field.text)
-            percepatan = float(self.percepatan_input.input_field.text)
-            
-            # Hitung gaya
-            gaya = massa * percepatan
-            
-            # Tampilkan hasil
-            self.result_label.text = f'Hasil:\nGaya = {gaya:.2f} N\n\nF = m × a\nF = {massa} × {percepatan}\nF = {gaya:.2f} N'
-            self.result_label.color = [0, 0.5, 0, 1]
-            
+            # Ambil nilai dari input yang diisi manual
+            for symbol, widget in inputs.items():
+                if symbol not in cell.links:
+                    self.worksheet.set_input(formula_id, symbol, parse_number(widget.input_field.text))
         except ValueError:
             self.result_label.text = 'Error: Masukkan angka yang valid!'
             self.result_label.color = [1, 0, 0, 1]
-        except Exception as e:
-            self.result_label.text = f'Error: {str(e)}'
-            self.result_label.color = [1, 0, 0, 1]
-    
-    def calculate_tekanan(self, instance):
-        """Menghitung tekanan"""
-        try:
-            # Ambil nilai dari input
-            gaya = float(self.gaya_input.input_field.text)
-            luas = float(self.luas_input.input_field.text)
-            
-            # Validasi input
-            if luas == 0:
-                self.result_label.text = 'Error: Luas tidak boleh nol!'
-                self.result_label.color = [1, 0, 0, 1]
-                return
-            
-            # Hitung tekanan
-            tekanan = gaya / luas
-            
+            return
+        
+        self.worksheet.recompute()
+        nilai = self.worksheet.input_values(formula_id)
+        hasil = cell.value
+        
+        if cell.error is None:
             # Tampilkan hasil
-            self.result_label.text = f'Hasil:\nTekanan = {tekanan:.2f} Pa\n\nP = F / A\nP = {gaya} / {luas}\nP = {tekanan:.2f} Pa'
+            self.result_label.text = (
+                f'Hasil:\n{nama} = {hasil:.2f} {satuan}\n\n'
+                f'{rumus.text}\n{rumus.solved_text(values=nilai)}\n'
+                f'{target} = {hasil:.2f} {satuan}'
+            )
             self.result_label.color = [0, 0.5, 0, 1]
-            
-        except ValueError:
-            self.result_label.text = 'Error: Masukkan angka yang valid!'
+        elif isinstance(cell.error, ZeroInputError):
+            nama_nol = spec.name_of(cell.error.symbol, 'Pembagi')
+            self.result_label.text = f'Error: {nama_nol} tidak boleh nol!'
+            self.result_label.color = [1, 0, 0, 1]
+        elif isinstance(cell.error, MissingInputError):
+            # Input tertaut kosong jika rumus sumbernya belum punya hasil
+            kosong = ', '.join(spec.name_of(symbol, symbol) for symbol in cell.error.symbols)
+            sumber = sorted({
+                get_calculator(cell.links[symbol], 'id').title
+                for symbol in cell.error.symbols if symbol in cell.links
+            })
+            if sumber:
+                self.result_label.text = f'Error: {kosong} belum ada, hitung dulu {", ".join(sumber)}!'
+            else:
+                self.result_label.text = f'Error: {kosong} belum diisi!'
             self.result_label.color = [1, 0, 0, 1]
-        except Exception as e:
-            self.result_label.text = f'Error: {str(e)}'
+        elif isinstance(cell.error, DomainError):
+            self.result_label.text = 'Error: Tidak ada hasil real untuk nilai ini!'
+            self.result_label.color = [1, 0, 0, 1]
+        elif isinstance(cell.error, ResultTooLargeError):
+            self.result_label.text = 'Error: Hasil terlalu besar!'
+            self.result_label.color = [1, 0, 0, 1]
+        else:
+            self.result_label.text = f'Error: {cell.error}'
             self.result_label.color = [1, 0, 0, 1]
 
 class AboutScreen(Screen):
@@ -1739,11 +1555,14 @@ class QuizScreen(Screen):
     
     def load_questions(self):
         """Memuat soal-soal kuis"""
+        # Jawaban benar untuk soal rumus diambil dari katalog (formula_id),
+        # sehingga kuis selalu sama dengan halaman detail dan kalkulator
         questions = [
             {
                 'question': 'Rumus untuk menghitung kecepatan adalah...',
-                'options': ['v = s × t', 'v = s / t', 'v = t / s', 'v = m × a'],
+                'options': ['v = s × t', None, 'v = t / s', 'v = m × a'],
                 'correct': 1,
+                'formula_id': 'linear_motion',
                 'explanation': 'Kecepatan = Jarak / Waktu (v = s/t)'
             },
             {
@@ -1754,23 +1573,32 @@ class QuizScreen(Screen):
             },
             {
                 'question': 'Rumus hukum Newton II adalah...',
-                'options': ['F = m / a', 'F = m × a', 'F = m + a', 'F = m - a'],
+                'options': ['F = m / a', None, 'F = m + a', 'F = m - a'],
                 'correct': 1,
+                'formula_id': 'force',
                 'explanation': 'Hukum Newton II: F = m × a'
             },
             {
                 'question': 'Tekanan dihitung dengan rumus...',
-                'options': ['P = F × A', 'P = F / A', 'P = A / F', 'P = F + A'],
+                'options': ['P = F × A', None, 'P = A / F', 'P = F + A'],
                 'correct': 1,
+                'formula_id': 'pressure',
                 'explanation': 'Tekanan = Gaya / Luas (P = F/A)'
             },
             {
                 'question': 'Energi kinetik dihitung dengan...',
-                'options': ['EK = m × v', 'EK = ½ × m × v²', 'EK = m × g × h', 'EK = F × s'],
+                'options': ['Ek = m × v', None, 'Ek = m × g × h', 'Ek = F × s'],
                 'correct': 1,
+                'formula_id': 'kinetic_energy',
                 'explanation': 'Energi kinetik = ½ × massa × kecepatan²'
             }
         ]
+        
+        for question in questions:
+            if 'formula_id' in question:
+                formula = get_formula(question['formula_id'], 'id')
+                question['options'][question['correct']] = formula['formula']
+        
         return questions
     
     def init_quiz(self):
@@ -1832,6 +1660,8 @@ class QuizScreen(Screen):
         self.content.add_widget(progress_text)
         
         # Progress bar visual
+        from kivy.uix.progressbar import ProgressBar
+        
         progress_container = BoxLayout(size_hint=(1, None), height=dp(20))
         progress_bar = ProgressBar(
             max=len(self.questions),
@@ -0,0 +1,9 @@
+"""
+PhysiCalc - kalkulator fisika SMP
+
+physicalc.core berisi perhitungan, format, validasi, satuan, dan katalog rumus
+tanpa ketergantungan Kivy, sehingga bisa dipakai job batch dan skrip biasa.
+physicalc.ui berisi helper tampilan yang baru mengimpor Kivy saat dipanggil.
+"""
+
+__version__ = '1.0.0'
@@ -0,0 +1,395 @@
+"""
+Evaluator batch dari command line
+
+Membaca baris CSV atau JSONL dari file/stdin, menghitungnya per potongan
+(chunk), lalu menulis hasilnya secara streaming sehingga memori tetap konstan
+berapa pun jumlah barisnya.
+
+Format JSONL (satu objek per baris):
+    {"id": "q1", "formula": "force", "inputs": {"m": 2, "a": 3}}
+    {"formula": "linear_motion", "target": "t", "inputs": {"v": 5, "s": 100},
+     "units": {"s": "cm"}, "unit": "min"}
+
+Format CSV (kolom selain id/formula/target/unit adalah nilai variabel,
+satuan masukan boleh ditulis di header dalam kurung siku):
+    id,formula,target,unit,m [g],a
+    q1,force,,,2000,3
+
+'formula' adalah ID rumus di katalog, atau nama fungsi calculate_* tanpa
+awalan (misalnya 'momentum' dengan input {"mass": 2, "velocity": 3}).
+
+Contoh:
+    python -m physicalc jawaban.csv -o hasil.csv --workers 4
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import math
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import calculations
+from .core.catalog import get_formulas
+from .core.engine import FormulaError, ZeroInputError, get_compiled_formula
+from .core.formatting import format_result
+from .core.units import can_convert, convert_units, short_unit
+from .core.validation import PARSE_ERROR_MESSAGES, PARSE_OK, parse_number_result, parse_numbers
+
+RESERVED_COLUMNS = ('id', 'formula', 'target', 'unit')
+OUTPUT_FIELDS = ('line', 'id', 'formula', 'target', 'value', 'unit', 'result', 'error')
+
+_HEADER_UNIT_RE = re.compile(r'^(.+?)\s*\[(.+)\]$')
+
+
+class RowError(ValueError):
+    """Baris input tidak bisa dihitung"""
+
+
+# ===== Membaca input =====
+
+def read_jsonl(stream):
+    """Menghasilkan (nomor baris, record) dari stream JSONL"""
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            record = {'_error': f"Invalid JSON: {e}"}
+        yield line_no, record
+
+
+def read_csv(stream):
+    """Menghasilkan (nomor baris, record) dari stream CSV dengan header"""
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+
+    columns = []
+    for name in header:
+        name = name.strip()
+        match = _HEADER_UNIT_RE.match(name)
+        columns.append((match.group(1), match.group(2)) if match else (name, None))
+
+    for line_no, row in enumerate(reader, 2):
+        if not any(cell.strip() for cell in row):
+            continue
+
+        record = {'inputs': {}, 'units': {}}
+        for (name, unit), cell in zip(columns, row):
+            cell = cell.strip()
+            if not cell:
+                continue
+            if name in RESERVED_COLUMNS:
+                record[name] = cell
+            else:
+                record['inputs'][name] = cell
+                if unit:
+                    record['units'][name] = unit
+        yield line_no, record
+
+
+def detect_format(path, first_line):
+    """Menentukan format input dari ekstensi file atau isi baris pertama"""
+    if path.endswith('.csv'):
+        return 'csv'
+    if path.endswith(('.jsonl', '.json', '.ndjson')):
+        return 'jsonl'
+    return 'jsonl' if first_line.lstrip().startswith('{') else 'csv'
+
+
+# ===== Evaluasi =====
+
+# Tipe field record; field lain di luar daftar ini tidak diperiksa
+RECORD_FIELD_TYPES = (('formula', str), ('target', str), ('unit', str), ('inputs', dict), ('units', dict))
+
+
+def check_record(record):
+    """
+    Memastikan field record bertipe benar sebelum dihitung
+
+    Raises:
+        RowError: Jika misalnya inputs berupa list atau unit berupa angka
+    """
+    for field, kind in RECORD_FIELD_TYPES:
+        value = record.get(field)
+        if value is not None and not isinstance(value, kind):
+            raise RowError(f"'{field}' must be {'an object' if kind is dict else 'a string'}")
+    for symbol, unit in (record.get('units') or {}).items():
+        if not isinstance(unit, str):
+            raise RowError(f"Unit of '{symbol}' must be a string")
+
+
+def _to_float(symbol, value):
+    if type(value) is float and math.isfinite(value):
+        return value
+    value, code = parse_number_result(value)
+    if code != PARSE_OK:
+        raise RowError(f"{symbol}: {PARSE_ERROR_MESSAGES[code]}")
+    return value
+
+
+def parse_chunk_inputs(chunk):
+    """
+    Mengubah semua input teks (sel CSV) dalam satu chunk menjadi float sekaligus
+
+    Dipakai sebelum evaluasi agar setiap teks di-parse sekali dengan
+    parse_numbers; input yang tidak valid dibiarkan apa adanya sehingga
+    _to_float melaporkan error per baris.
+    """
+    cells = []
+    for line_no, record in chunk:
+        inputs = record.get('inputs') if isinstance(record, dict) else None
+        if isinstance(inputs, dict):
+            cells.extend((inputs, symbol) for symbol, value in inputs.items() if isinstance(value, str))
+    if not cells:
+        return
+
+    values, valid, errors = parse_numbers([inputs[symbol] for inputs, symbol in cells])
+    for (inputs, symbol), value, ok in zip(cells, values, valid):
+        if ok:
+            inputs[symbol] = float(value)
+
+
+_catalog_specs = {}
+
+
+def _catalog_spec(formula_id):
+    """Data rumus yang dibutuhkan evaluator, disiapkan sekali per rumus per proses"""
+    spec = _catalog_specs.get(formula_id)
+    if spec is None:
+        formula = get_formulas()[formula_id]
+        names = {v['symbol']: v['name'] for v in formula['variables']}
+        units = {v['symbol']: short_unit(v['unit']) for v in formula['variables']}
+        spec = (get_compiled_formula(formula_id), names, units)
+        _catalog_specs[formula_id] = spec
+    return spec
+
+
+def _evaluate_catalog(formula_id, record):
+    """Menghitung rumus katalog dengan mesin rumus"""
+    compiled, names, expected_units = _catalog_spec(formula_id)
+    target = record.get('target') or compiled.default_target
+
+    if target not in names:
+        raise RowError(f"Unknown variable '{target}' for {formula_id}")
+
+    units = record.get('units') or {}
+    values = {}
+    for symbol, value in (record.get('inputs') or {}).items():
+        expected = expected_units.get(symbol)
+        if expected is None:
+            raise RowError(f"Unknown variable '{symbol}' for {formula_id}")
+        value = _to_float(symbol, value)
+        unit = units.get(symbol, expected)
+        if unit != expected:
+            if not can_convert(unit, expected):
+                raise RowError(f"{symbol}: Cannot convert {unit} to {expected}")
+            value = convert_units(value, unit, expected)
+        values[symbol] = value
+
+    try:
+        value = compiled.evaluate(values, target)
+    except ZeroInputError as e:
+        raise RowError(f"{names.get(e.symbol, 'Divisor')} cannot be zero")
+
+    return target, value, expected_units[target]
+
+
+def _evaluate_function(name, record):
+    """Menghitung dengan fungsi calculate_<name> dari physicalc.core.calculations"""
+    func = getattr(calculations, f"calculate_{name}", None)
+    if func is None:
+        raise RowError(f"Unknown formula: {name}")
+
+    inputs = {key: _to_float(key, value) for key, value in (record.get('inputs') or {}).items()}
+    try:
+        value, message = func(**inputs)
+    except TypeError as e:
+        raise RowError(str(e))
+    if value is None:
+        raise RowError(message)
+
+    return None, value, ''
+
+
+def evaluate_record(line_no, record, precision=2):
+    """
+    Menghitung satu record dan mengembalikan dictionary hasil
+
+    Error per baris dilaporkan di field 'error', tidak menghentikan proses.
+    """
+    result = dict.fromkeys(OUTPUT_FIELDS)
+    result['line'] = line_no
+
+    if not isinstance(record, dict):
+        result['error'] = "Row must be an object"
+        return result
+
+    result['id'] = record.get('id')
+    result['formula'] = formula = record.get('formula')
+
+    try:
+        if '_error' in record:
+            raise RowError(record['_error'])
+        check_record(record)
+        if not formula:
+            raise RowError("Missing formula")
+
+        if formula in get_formulas():
+            target, value, unit = _evaluate_catalog(formula, record)
+        else:
+            target, value, unit = _evaluate_function(formula, record)
+
+        wanted = record.get('unit') or unit
+        if wanted != unit:
+            if not can_convert(unit, wanted):
+                raise RowError(f"Cannot convert {unit} to {wanted}")
+            value = convert_units(value, unit, wanted)
+
+        result['target'] = target
+        result['value'] = value
+        result['unit'] = wanted
+        result['result'] = format_result(value, wanted, precision).strip()
+
+    except (RowError, FormulaError) as e:
+        result['error'] = str(e)
+    except (ValueError, ArithmeticError) as e:
+        result['error'] = f"Calculation error: {e}"
+
+    return result
+
+
+def evaluate_chunk(chunk, precision=2):
+    """Menghitung satu potongan [(nomor baris, record), ...] (dipanggil di worker)"""
+    parse_chunk_inputs(chunk)
+    return [evaluate_record(line_no, record, precision) for line_no, record in chunk]
+
+
+def iter_chunks(rows, size):
+    """Memecah iterator menjadi list berukuran maksimal size"""
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def evaluate_stream(rows, chunk_size=1000, workers=1, precision=2):
+    """
+    Menghitung semua baris dan menghasilkan list hasil per chunk sesuai urutan input
+
+    Dengan workers > 1 chunk dikirim ke process pool. Jumlah chunk yang
+    sedang diproses dibatasi (2 per worker) agar memori tetap konstan.
+    """
+    chunks = iter_chunks(rows, chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield evaluate_chunk(chunk, precision)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(evaluate_chunk, chunk, precision))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# ===== Menulis output =====
+
+class JsonlWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, result):
+        self.stream.write(json.dumps(result, ensure_ascii=False) + '\n')
+
+
+class CsvWriter:
+    def __init__(self, stream):
+        self.writer = csv.DictWriter(stream, fieldnames=OUTPUT_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, result):
+        self.writer.writerow(result)
+
+
+WRITERS = {'jsonl': JsonlWriter, 'csv': CsvWriter}
+
+
+# ===== Entry point =====
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m physicalc',
+        description='Evaluate physics formulas in bulk from CSV or JSONL rows.'
+    )
+    parser.add_argument('input', nargs='?', default='-',
+                        help="input file (default: stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file (default: stdout)")
+    parser.add_argument('-f', '--format', choices=('auto', 'csv', 'jsonl'), default='auto',
+                        help="input format (default: from extension or content)")
+    parser.add_argument('--output-format', choices=('csv', 'jsonl'),
+                        help="output format (default: same as input)")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="number of worker processes (default: 1)")
+    parser.add_argument('--chunk-size', type=int, default=1000,
+                        help="rows per chunk (default: 1000)")
+    parser.add_argument('--precision', type=int, default=2,
+                        help="decimal places in formatted results (default: 2)")
+    return parser
+
+
+def _open(path, mode):
+    if path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.workers < 1 or args.chunk_size < 1:
+        print("error: --workers and --chunk-size must be at least 1", file=sys.stderr)
+        return 2
+
+    source = _open(args.input, 'r')
+    target = _open(args.output, 'w')
+
+    try:
+        first_line = source.readline()
+        fmt = args.format
+        if fmt == 'auto':
+            fmt = detect_format(args.input, first_line)
+
+        stream = itertools.chain([first_line], source)
+        rows = read_csv(stream) if fmt == 'csv' else read_jsonl(stream)
+        writer = WRITERS[args.output_format or fmt](target)
+
+        total = errors = 0
+        for results in evaluate_stream(rows, args.chunk_size, args.workers, args.precision):
+            for result in results:
+                writer.write(result)
+                total += 1
+                errors += result['error'] is not None
+
+        target.flush()
+        print(f"Processed {total} rows, {errors} errors", file=sys.stderr)
+        return 0
+
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
@@ -0,0 +1,116 @@
+"""
+Inti perhitungan fisika tanpa Kivy
+
+Modul:
+    calculations - fungsi calculate_* skalar
+    batch        - versi NumPy dari fungsi calculate_*
+    cache        - cache LRU untuk hasil perhitungan
+    formatting   - format hasil untuk ditampilkan
+    validation   - validasi input angka
+    units        - sistem satuan dan konversi dengan analisis dimensi
+    catalog      - katalog rumus terpadu
+    registry     - registry materi dan rumus
+    engine       - mesin rumus (solve untuk variabel mana pun)
+    calculator   - metadata kalkulator untuk setiap rumus katalog
+"""
+
+from .calculations import (
+    calculate_velocity, calculate_force, calculate_pressure,
+    calculate_work, calculate_kinetic_energy, calculate_potential_energy,
+    calculate_density, calculate_power, calculate_acceleration,
+    calculate_momentum, calculate_with_error_handling
+)
+from .cache import (
+    CalculationCache, cached_calculation, cached,
+    clear_calculation_cache, get_cache_stats
+)
+from .formatting import (
+    FormattedValue, ResultFormatter, format_result, get_formatter, round_to_significant
+)
+from .validation import (
+    NumberInputError, parse_number, parse_number_result, parse_numbers,
+    validate_number_input, validate_physics_inputs
+)
+from .units import UnitError, parse_unit, convert_units, conversion_factor, unit_choices
+from .catalog import (
+    CatalogError, load_catalog, get_formulas, get_formula, get_topics,
+    get_categories, get_category_name, get_formulas_by_symbol
+)
+from .registry import FormulaRegistry
+from .engine import (
+    FormulaError, ZeroInputError, DomainError, ResultTooLargeError, CompiledFormula, compile_formula,
+    get_compiled_formula, solve
+)
+from .calculator import CalculatorSpec, get_calculator, get_calculators
+from .search import SearchIndex, SearchSession, get_search_index, search_formulas, tokenize
+from .graph import FormulaGraph, NoSolutionError, find_path, get_formula_graph, solve_chain
+from .worksheet import Cell, CycleError, Worksheet, WorksheetError
+
+__all__ = [
+    'calculate_velocity',
+    'calculate_force',
+    'calculate_pressure',
+    'calculate_work',
+    'calculate_kinetic_energy',
+    'calculate_potential_energy',
+    'calculate_density',
+    'calculate_power',
+    'calculate_acceleration',
+    'calculate_momentum',
+    'calculate_with_error_handling',
+    'CalculationCache',
+    'cached_calculation',
+    'cached',
+    'clear_calculation_cache',
+    'get_cache_stats',
+    'FormattedValue',
+    'ResultFormatter',
+    'format_result',
+    'get_formatter',
+    'round_to_significant',
+    'NumberInputError',
+    'parse_number',
+    'parse_number_result',
+    'parse_numbers',
+    'validate_number_input',
+    'validate_physics_inputs',
+    'UnitError',
+    'parse_unit',
+    'convert_units',
+    'conversion_factor',
+    'unit_choices',
+    'CatalogError',
+    'load_catalog',
+    'get_formulas',
+    'get_formula',
+    'get_topics',
+    'get_categories',
+    'get_category_name',
+    'get_formulas_by_symbol',
+    'FormulaRegistry',
+    'FormulaError',
+    'ZeroInputError',
+    'DomainError',
+    'ResultTooLargeError',
+    'CompiledFormula',
+    'compile_formula',
+    'get_compiled_formula',
+    'solve',
+    'CalculatorSpec',
+    'get_calculator',
+    'get_calculators',
+    'SearchIndex',
+    'SearchSession',
+    'get_search_index',
+    'search_formulas',
+    'tokenize',
+    'FormulaGraph',
+    'NoSolutionError',
+    'find_path',
+    'get_formula_graph',
+    'solve_chain',
+    'Cell',
+    'CycleError',
+    'Worksheet',
+    'WorksheetError'
+]
@@ -0,0 +1,109 @@
+"""
+Versi batch (NumPy) dari fungsi perhitungan fisika
+
+Menerima array/buffer dan mengembalikan (values, valid, errors):
+    values - float64, NaN untuk elemen yang tidak valid
+    valid  - mask boolean per elemen
+    errors - kode error uint8 per elemen (lihat BATCH_ERROR_MESSAGES)
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, hanya dibutuhkan fungsi *_batch
+    np = None
+
+BATCH_OK = 0
+BATCH_ZERO_TIME = 1
+BATCH_ZERO_AREA = 2
+BATCH_ZERO_VOLUME = 3
+BATCH_NOT_FINITE = 4
+
+BATCH_ERROR_MESSAGES = {
+    BATCH_OK: "",
+    BATCH_ZERO_TIME: "Time cannot be zero",
+    BATCH_ZERO_AREA: "Area cannot be zero",
+    BATCH_ZERO_VOLUME: "Volume cannot be zero",
+    BATCH_NOT_FINITE: "Invalid number",
+}
+
+def _batch_arrays(*arrays):
+    """Mengubah input menjadi array float64 dengan bentuk yang sama (broadcast)"""
+    if np is None:
+        raise ImportError("NumPy is required for batch calculations")
+    return np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in arrays])
+
+def _batch_finish(values, errors):
+    """Menandai hasil NaN/inf sebagai error lalu menyusun (values, valid, errors)"""
+    bad = ~np.isfinite(values) & (errors == BATCH_OK)
+    errors[bad] = BATCH_NOT_FINITE
+    valid = errors == BATCH_OK
+    values[~valid] = np.nan
+    return values, valid, errors
+
+def _batch_product(factor, *arrays):
+    """Perkalian elemen demi elemen: factor × a × b × ..."""
+    arrays = _batch_arrays(*arrays)
+    with np.errstate(over='ignore', invalid='ignore'):
+        values = np.full(arrays[0].shape, factor, dtype=np.float64)
+        for array in arrays:
+            values *= array
+    return _batch_finish(values, np.zeros(values.shape, dtype=np.uint8))
+
+def _batch_divide(numerator, denominator, zero_code):
+    """Pembagian elemen demi elemen, penyebut nol ditandai dengan zero_code"""
+    numerator, denominator = _batch_arrays(numerator, denominator)
+    nonzero = denominator != 0
+    values = np.full(numerator.shape, np.nan)
+    with np.errstate(over='ignore', invalid='ignore'):
+        np.divide(numerator, denominator, out=values, where=nonzero)
+    errors = np.where(nonzero, BATCH_OK, zero_code).astype(np.uint8)
+    return _batch_finish(values, errors)
+
+def batch_error_messages(errors):
+    """Mengubah array kode error menjadi list pesan (untuk laporan)"""
+    return [BATCH_ERROR_MESSAGES[int(code)] for code in errors.ravel()]
+
+def calculate_velocity_batch(displacement, time):
+    """Versi batch dari calculate_velocity"""
+    return _batch_divide(displacement, time, BATCH_ZERO_TIME)
+
+def calculate_force_batch(mass, acceleration):
+    """Versi batch dari calculate_force"""
+    return _batch_product(1.0, mass, acceleration)
+
+def calculate_pressure_batch(force, area):
+    """Versi batch dari calculate_pressure"""
+    return _batch_divide(force, area, BATCH_ZERO_AREA)
+
+def calculate_work_batch(force, displacement, angle=0):
+    """Versi batch dari calculate_work (sudut dalam derajat)"""
+    force, displacement, angle = _batch_arrays(force, displacement, angle)
+    return _batch_product(1.0, force, displacement, np.cos(np.radians(angle)))
+
+def calculate_kinetic_energy_batch(mass, velocity):
+    """Versi batch dari calculate_kinetic_energy"""
+    mass, velocity = _batch_arrays(mass, velocity)
+    return _batch_product(0.5, mass, velocity, velocity)
+
+def calculate_potential_energy_batch(mass, height, gravity=9.8):
+    """Versi batch dari calculate_potential_energy"""
+    return _batch_product(1.0, mass, gravity, height)
+
+def calculate_density_batch(mass, volume):
+    """Versi batch dari calculate_density"""
+    return _batch_divide(mass, volume, BATCH_ZERO_VOLUME)
+
+def calculate_power_batch(work, time):
+    """Versi batch dari calculate_power"""
+    return _batch_divide(work, time, BATCH_ZERO_TIME)
+
+def calculate_acceleration_batch(initial_velocity, final_velocity, time):
+    """Versi batch dari calculate_acceleration"""
+    initial_velocity, final_velocity = _batch_arrays(initial_velocity, final_velocity)
+    with np.errstate(over='ignore', invalid='ignore'):
+        delta = final_velocity - initial_velocity
+    return _batch_divide(delta, time, BATCH_ZERO_TIME)
+
+def calculate_momentum_batch(mass, velocity):
+    """Versi batch dari calculate_momentum"""
+    return _batch_product(1.0, mass, velocity)
@@ -0,0 +1,173 @@
+"""
+Cache LRU untuk hasil perhitungan
+"""
+
+from collections import OrderedDict
+import functools
+import threading
+import time
+
+
+_MISSING = object()
+_NAN_KEY = ('nan',)
+
+def _normalize_key(value):
+    """
+    Menormalkan argumen agar bisa dipakai sebagai key cache
+
+    Angka dijadikan float (1 dan 1.0 berbagi entri), NaN diganti sentinel
+    karena NaN != NaN, dan list/dict diubah menjadi tuple. Bool diberi tag
+    karena True == 1.0 dan hash-nya sama, padahal bool bukan input angka
+    yang valid. Int yang terlalu besar untuk float dibiarkan int.
+    """
+    if isinstance(value, bool):
+        return ('bool', value)
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        try:
+            value = float(value)
+        except OverflowError:
+            return value
+        return _NAN_KEY if value != value else value
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_key(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize_key(item)) for key, item in value.items()))
+    return value
+
+class CalculationCache:
+    """
+    Cache LRU terbatas (ukuran dan opsional TTL) yang aman dipakai antar thread
+
+    Pembacaan tidak mengambil lock: lookup dict atomik di bawah GIL, dan
+    perpindahan urutan LRU yang kalah balapan dengan eviksi cukup diabaikan.
+    Penulisan dan eviksi dilindungi lock. Counter hits/misses tidak dikunci
+    sehingga nilainya perkiraan pada beban multi-thread.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        """
+        Args:
+            maxsize: Jumlah entri maksimum
+            ttl: Umur entri dalam detik (None = tidak kedaluwarsa)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, func, args, kwargs=None):
+        """Menyusun key ternormalisasi dari fungsi dan argumennya"""
+        key = (func, _normalize_key(args))
+        if kwargs:
+            key += (_normalize_key(kwargs),)
+        return key
+
+    def get(self, key, default=None):
+        """Mengambil nilai dari cache tanpa lock"""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        value, expires = entry
+        if expires is not None and expires < time.monotonic():
+            self.misses += 1
+            with self._lock:
+                if self._data.get(key) is entry:
+                    del self._data[key]
+                    self.evictions += 1
+            return default
+
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            pass  # Sudah dieviksi thread lain, nilai tetap valid
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Menyimpan nilai lalu mengeviksi entri paling lama jika penuh"""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def call(self, func, *args, **kwargs):
+        """Memanggil func dengan caching"""
+        key = self.make_key(func, args, kwargs)
+        result = self.get(key, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            self.set(key, result)
+        return result
+
+    def memoize(self, func):
+        """Decorator: hasil func disimpan di cache ini"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+
+        wrapper.cache = self
+        return wrapper
+
+    def clear(self):
+        """Menghapus semua entri (statistik tetap disimpan)"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """Mengembalikan statistik cache"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+        }
+
+    def __len__(self):
+        return len(self._data)
+
+_calculation_cache = CalculationCache(maxsize=1024)
+
+def cached_calculation(func, *args):
+    """Melakukan perhitungan dengan caching untuk performa"""
+    return _calculation_cache.call(func, *args)
+
+def cached(func=None, maxsize=None, ttl=None):
+    """
+    Decorator caching untuk fungsi calculate_*
+
+    Tanpa argumen memakai cache bersama; dengan maxsize/ttl membuat cache sendiri.
+
+        @cached
+        def calculate_x(...): ...
+
+        @cached(maxsize=256, ttl=60)
+        def calculate_y(...): ...
+    """
+    if maxsize is None and ttl is None:
+        cache = _calculation_cache
+    else:
+        cache = CalculationCache(maxsize=maxsize or 1024, ttl=ttl)
+
+    if func is None:
+        return cache.memoize
+    return cache.memoize(func)
+
+def clear_calculation_cache():
+    """Membersihkan cache perhitungan"""
+    _calculation_cache.clear()
+
+def get_cache_stats():
+    """Mengembalikan statistik cache perhitungan bersama"""
+    return _calculation_cache.stats()
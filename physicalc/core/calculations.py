@@ -0,0 +1,88 @@
+"""
+Fungsi perhitungan fisika skalar
+
+Setiap fungsi mengembalikan tuple (nilai, pesan); nilai None jika input tidak valid.
+"""
+
+import math
+
+
+def calculate_velocity(displacement, time):
+    """Menghitung kecepatan v = s / t"""
+    if time == 0:
+        return None, "Time cannot be zero"
+    return displacement / time, "Velocity calculated successfully"
+
+def calculate_force(mass, acceleration):
+    """Menghitung gaya F = m × a"""
+    return mass * acceleration, "Force calculated successfully"
+
+def calculate_pressure(force, area):
+    """Menghitung tekanan P = F / A"""
+    if area == 0:
+        return None, "Area cannot be zero"
+    return force / area, "Pressure calculated successfully"
+
+def calculate_work(force, displacement, angle=0):
+    """Menghitung usaha W = F × s × cosθ"""
+    try:
+        radians = math.radians(angle)
+        result = force * displacement * math.cos(radians)
+        return result, "Work calculated successfully"
+    except:
+        return None, "Calculation error"
+
+def calculate_kinetic_energy(mass, velocity):
+    """Menghitung energi kinetik Ek = ½ × m × v²"""
+    try:
+        result = 0.5 * mass * (velocity ** 2)
+        return result, "Kinetic energy calculated successfully"
+    except:
+        return None, "Calculation error"
+
+def calculate_potential_energy(mass, height, gravity=9.8):
+    """Menghitung energi potensial Ep = m × g × h"""
+    try:
+        result = mass * gravity * height
+        return result, "Potential energy calculated successfully"
+    except:
+        return None, "Calculation error"
+
+def calculate_density(mass, volume):
+    """Menghitung massa jenis ρ = m / V"""
+    if volume == 0:
+        return None, "Volume cannot be zero"
+    return mass / volume, "Density calculated successfully"
+
+def calculate_power(work, time):
+    """Menghitung daya P = W / t"""
+    if time == 0:
+        return None, "Time cannot be zero"
+    return work / time, "Power calculated successfully"
+
+def calculate_acceleration(initial_velocity, final_velocity, time):
+    """Menghitung percepatan a = (v₂ - v₁) / t"""
+    if time == 0:
+        return None, "Time cannot be zero"
+    return (final_velocity - initial_velocity) / time, "Acceleration calculated successfully"
+
+def calculate_momentum(mass, velocity):
+    """Menghitung momentum p = m × v"""
+    return mass * velocity, "Momentum calculated successfully"
+
+def calculate_with_error_handling(func, *args):
+    """
+    Wrapper untuk fungsi perhitungan dengan error handling
+    
+    Args:
+        func: Fungsi perhitungan
+        *args: Argumen untuk fungsi
+    """
+    try:
+        return func(*args)
+    except ZeroDivisionError:
+        return None, "Division by zero error"
+    except ValueError as e:
+        return None, f"Value error: {str(e)}"
+    except Exception as e:
+        return None, f"Calculation error: {str(e)}"
@@ -0,0 +1,98 @@
+"""
+Metadata kalkulator yang diturunkan dari katalog rumus
+
+Setiap rumus di katalog otomatis punya kalkulator: variabel target (ruas
+kiri rumus), daftar input beserta nama, satuan, dan nilai default (misalnya
+g = 9.8), serta rumus terkompilasi untuk menghitungnya. Layar kalkulator
+cukup membaca CalculatorSpec tanpa kode khusus per rumus.
+
+Contoh:
+    spec = get_calculator('potential_energy')
+    [field.symbol for field in spec.fields]       # ['m', 'g', 'h']
+    spec.evaluate({'m': 2, 'g': 9.8, 'h': 10})      # 196.0
+"""
+
+from collections import namedtuple
+
+from .catalog import DEFAULT_LANGUAGE, get_formulas
+from .engine import get_compiled_formula
+
+# Satu input kalkulator; default berupa teks awal input ('0' jika tidak ada)
+CalculatorField = namedtuple('CalculatorField', 'symbol name unit default')
+
+
+def display_unit(unit):
+    """Satuan untuk tampilan: 'N (Newton)' -> 'N', '-' (tanpa satuan) -> ''"""
+    unit = unit.split(' (')[0].strip()
+    return '' if unit == '-' else unit
+
+
+def format_default(value):
+    """Teks awal input untuk nilai default katalog"""
+    return '0' if value is None else f"{value:g}"
+
+
+class CalculatorSpec:
+    """Kalkulator untuk satu rumus katalog dalam satu bahasa"""
+
+    def __init__(self, formula, compiled):
+        """
+        Args:
+            formula: Rumus hasil get_formulas(lang)
+            compiled: CompiledFormula untuk rumus tersebut
+        """
+        self.formula_id = formula['id']
+        self.title = formula['title']
+        self.formula = formula['formula']
+        self.description = formula['formula_display']
+        self.compiled = compiled
+
+        variables = {variable['symbol']: variable for variable in formula['variables']}
+        self.names = {symbol: variable['name'] for symbol, variable in variables.items()}
+
+        self.target = compiled.default_target
+        target = variables.get(self.target, {})
+        self.target_name = target.get('name', self.target)
+        self.unit = display_unit(target.get('unit', ''))
+
+        self.fields = tuple(
+            CalculatorField(
+                symbol,
+                self.names.get(symbol, symbol),
+                display_unit(variables[symbol]['unit']) if symbol in variables else '',
+                format_default(variables.get(symbol, {}).get('default'))
+            )
+            for symbol in compiled.inputs_for(self.target)
+        )
+
+    @property
+    def label(self):
+        """Teks pilihan rumus, misalnya 'Velocity (v = s / t)'"""
+        return f"{self.title} ({self.formula})"
+
+    def evaluate(self, values):
+        """Menghitung target dari {simbol: angka}; error mesin rumus diteruskan"""
+        return self.compiled.evaluate(values, self.target)
+
+    def name_of(self, symbol, default=None):
+        """Nama variabel untuk pesan error"""
+        return self.names.get(symbol, default)
+
+
+_calculators = {}
+
+
+def get_calculator(formula_id, lang=DEFAULT_LANGUAGE):
+    """Mengembalikan CalculatorSpec (tercache per bahasa) untuk ID rumus katalog"""
+    key = (formula_id, lang)
+    spec = _calculators.get(key)
+    if spec is None:
+        formula = get_formulas(lang)[formula_id]
+        spec = CalculatorSpec(formula, get_compiled_formula(formula_id))
+        _calculators[key] = spec
+    return spec
+
+
+def get_calculators(lang=DEFAULT_LANGUAGE):
+    """Kalkulator untuk semua rumus katalog, sesuai urutan katalog"""
+    return tuple(get_calculator(formula_id, lang) for formula_id in get_formulas(lang))
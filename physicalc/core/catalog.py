@@ -0,0 +1,274 @@
+"""
+Katalog rumus fisika terpadu (satu sumber data untuk seluruh aplikasi)
+
+Data disimpan sebagai snapshot JSON (catalog.json) yang sudah berisi index
+siap pakai. Snapshot dimuat sekali, divalidasi terhadap skema, lalu dibekukan.
+Aplikasi Kivy (main.py, screens/, screens.py) maupun job tanpa UI membaca
+objek yang sama dari modul ini.
+
+Setelah mengedit catalog.json, bangun ulang index dengan:
+    python -m physicalc.core.catalog
+"""
+
+import json
+import os
+
+from .registry import freeze, split_symbols
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'catalog.json')
+SCHEMA_VERSION = 1
+DEFAULT_LANGUAGE = 'en'
+LANGUAGES = ('en', 'id')
+
+# Skema: nama field -> tipe yang diharapkan
+TOPIC_SCHEMA = {
+    'id': str,
+    'title': dict,
+    'category': str,
+    'icon': str,
+    'color': list,
+    'formulas': list,
+}
+
+FORMULA_SCHEMA = {
+    'id': str,
+    'topic': str,
+    'category': str,
+    'formula': str,
+    'formula_latex': str,
+    'title': dict,
+    'description': dict,
+    'example': dict,
+    'icon': str,
+    'difficulty': str,
+    'variables': list,
+}
+
+# Field opsional yang juga boleh ada pada rumus
+FORMULA_OPTIONAL_SCHEMA = {
+    'formula_display': dict,
+    'notes': dict,
+}
+
+VARIABLE_SCHEMA = {
+    'symbol': str,
+    'name': dict,
+    'unit': str,
+}
+
+# Field teks yang memiliki terjemahan per bahasa
+LOCALIZED_FIELDS = ('title', 'formula_display', 'description', 'example', 'notes')
+
+
+class CatalogError(ValueError):
+    """Error ketika katalog tidak sesuai skema"""
+
+
+_catalog = None
+_formula_views = {}
+_topic_views = {}
+
+
+def _check_fields(record, schema, where, required=True):
+    """Memeriksa field dan tipe sebuah record terhadap skema"""
+    for field, expected in schema.items():
+        if field not in record:
+            if required:
+                raise CatalogError(f"{where}: missing field '{field}'")
+            continue
+        if not isinstance(record[field], expected):
+            raise CatalogError(f"{where}: field '{field}' must be {expected.__name__}")
+
+
+def validate_catalog(raw):
+    """
+    Validasi struktur katalog mentah
+
+    Args:
+        raw: Dictionary hasil json.load dari snapshot
+
+    Raises:
+        CatalogError: Jika katalog tidak valid
+    """
+    if raw.get('schema_version') != SCHEMA_VERSION:
+        raise CatalogError(f"Unsupported catalog schema version: {raw.get('schema_version')}")
+
+    categories = raw.get('categories', {})
+    topics = raw.get('topics', {})
+    formulas = raw.get('formulas', {})
+
+    for topic_id, topic in topics.items():
+        where = f"topic '{topic_id}'"
+        _check_fields(topic, TOPIC_SCHEMA, where)
+        if topic['category'] not in categories:
+            raise CatalogError(f"{where}: unknown category '{topic['category']}'")
+        for formula_id in topic['formulas']:
+            if formula_id not in formulas:
+                raise CatalogError(f"{where}: unknown formula '{formula_id}'")
+
+    for formula_id, formula in formulas.items():
+        where = f"formula '{formula_id}'"
+        _check_fields(formula, FORMULA_SCHEMA, where)
+        _check_fields(formula, FORMULA_OPTIONAL_SCHEMA, where, required=False)
+        if formula['id'] != formula_id:
+            raise CatalogError(f"{where}: id does not match key")
+        if formula['topic'] not in topics:
+            raise CatalogError(f"{where}: unknown topic '{formula['topic']}'")
+        if formula['category'] != topics[formula['topic']]['category']:
+            raise CatalogError(f"{where}: category differs from its topic")
+        for variable in formula['variables']:
+            _check_fields(variable, VARIABLE_SCHEMA, f"{where} variable")
+
+
+def build_indexes(raw):
+    """Menghitung index kategori dan simbol untuk disimpan di snapshot"""
+    by_category = {category: [] for category in raw['categories']}
+    by_symbol = {}
+
+    for topic in raw['topics'].values():
+        for formula_id in topic['formulas']:
+            formula = raw['formulas'][formula_id]
+            by_category[formula['category']].append(formula_id)
+            for variable in formula['variables']:
+                for symbol in split_symbols(variable['symbol']):
+                    ids = by_symbol.setdefault(symbol, [])
+                    if formula_id not in ids:
+                        ids.append(formula_id)
+
+    return {'by_category': by_category, 'by_symbol': by_symbol}
+
+
+def rebuild_snapshot(path=CATALOG_PATH):
+    """Validasi catalog.json lalu tulis ulang dengan index terbaru"""
+    with open(path, encoding='utf-8') as f:
+        raw = json.load(f)
+
+    raw.pop('indexes', None)
+    validate_catalog(raw)
+    raw['indexes'] = build_indexes(raw)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(raw, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+    return raw
+
+
+def load_catalog():
+    """Memuat snapshot katalog sekali lalu mengembalikan objek read-only yang sama"""
+    global _catalog
+
+    if _catalog is None:
+        with open(CATALOG_PATH, encoding='utf-8') as f:
+            raw = json.load(f)
+
+        validate_catalog(raw)
+        if 'indexes' not in raw:
+            raise CatalogError("Catalog snapshot has no indexes, run 'python -m physicalc.core.catalog'")
+
+        _catalog = freeze(raw)
+
+    return _catalog
+
+
+def localize(text, lang=DEFAULT_LANGUAGE):
+    """Mengambil teks sesuai bahasa, dengan fallback ke bahasa lain"""
+    if not text:
+        return ''
+    if lang in text:
+        return text[lang]
+    if DEFAULT_LANGUAGE in text:
+        return text[DEFAULT_LANGUAGE]
+    return next(iter(text.values()))
+
+
+def _localize_formula(formula, catalog, lang):
+    """Meratakan satu rumus ke dalam bahasa tertentu"""
+    record = {
+        'id': formula['id'],
+        'topic': formula['topic'],
+        'category_key': formula['category'],
+        'category': localize(catalog['categories'][formula['category']]['name'], lang),
+        'formula': formula['formula'],
+        'formula_latex': formula['formula_latex'],
+        'icon': formula['icon'],
+        'difficulty': formula['difficulty'],
+    }
+
+    for field in LOCALIZED_FIELDS:
+        record[field] = localize(formula.get(field), lang)
+
+    record['variables'] = [
+        dict(variable, name=localize(variable['name'], lang))
+        for variable in formula['variables']
+    ]
+
+    return record
+
+
+def get_formulas(lang=DEFAULT_LANGUAGE):
+    """
+    Mengembalikan semua rumus dalam satu bahasa {formula_id: rumus}
+
+    Hasil dibangun sekali per bahasa, sehingga semua pemanggil berbagi objek yang sama.
+    """
+    if lang not in _formula_views:
+        catalog = load_catalog()
+        formulas = {}
+        for topic in catalog['topics'].values():
+            for formula_id in topic['formulas']:
+                formula = catalog['formulas'][formula_id]
+                formulas[formula_id] = _localize_formula(formula, catalog, lang)
+        _formula_views[lang] = freeze(formulas)
+
+    return _formula_views[lang]
+
+
+def get_formula(formula_id, lang=DEFAULT_LANGUAGE):
+    """Mengembalikan satu rumus atau None"""
+    return get_formulas(lang).get(formula_id)
+
+
+def get_categories():
+    """Mengembalikan {kategori: tuple formula_id} dari index snapshot"""
+    return load_catalog()['indexes']['by_category']
+
+
+def get_category_name(category, lang=DEFAULT_LANGUAGE):
+    """Mengembalikan nama kategori dalam bahasa tertentu"""
+    return localize(load_catalog()['categories'][category]['name'], lang)
+
+
+def get_formulas_by_symbol(symbol):
+    """Mengembalikan tuple formula_id yang memakai simbol variabel tertentu"""
+    return load_catalog()['indexes']['by_symbol'].get(symbol, ())
+
+
+def get_topics(lang=DEFAULT_LANGUAGE):
+    """
+    Mengembalikan materi beserta rumusnya dalam satu bahasa {topic_id: materi}
+
+    Rumus di dalam materi adalah objek yang sama dengan hasil get_formulas(lang).
+    """
+    if lang not in _topic_views:
+        catalog = load_catalog()
+        formulas = get_formulas(lang)
+        topics = {}
+        for topic_id, topic in catalog['topics'].items():
+            topics[topic_id] = {
+                'id': topic_id,
+                'title': localize(topic['title'], lang),
+                'category': get_category_name(topic['category'], lang),
+                'category_key': topic['category'],
+                'icon': topic['icon'],
+                'color': topic['color'],
+                'formulas': tuple(formulas[formula_id] for formula_id in topic['formulas']),
+            }
+        _topic_views[lang] = freeze(topics)
+
+    return _topic_views[lang]
+
+
+if __name__ == '__main__':
+    snapshot = rebuild_snapshot()
+    print(f"Catalog rebuilt: {len(snapshot['formulas'])} formulas, {len(snapshot['topics'])} topics")
@@ -0,0 +1,651 @@
+"""
+Mesin rumus fisika
+
+Mengubah string rumus di katalog (misalnya 'v = s / t' atau 'Ek = ½ × m × v²')
+menjadi fungsi Python yang sudah dikompilasi. Setiap rumus diparse sekali,
+bentuk kebalikannya diturunkan otomatis, sehingga variabel mana pun bisa
+dihitung dari variabel lainnya.
+
+Contoh:
+    rumus = get_compiled_formula('linear_motion')
+    rumus.evaluate({'s': 100, 't': 20})          # v = 5.0
+    rumus.evaluate({'v': 5, 't': 20}, target='s')  # s = 100.0
+"""
+
+import math
+import re
+
+from .catalog import get_formulas
+
+# ===== Error =====
+
+class FormulaError(ValueError):
+    """Error dasar mesin rumus"""
+
+
+class FormulaSyntaxError(FormulaError):
+    """String rumus tidak bisa diparse"""
+
+
+class UnsolvableError(FormulaError):
+    """Variabel target tidak bisa diisolasi dari persamaan"""
+
+
+class MissingInputError(FormulaError):
+    """Ada variabel masukan yang belum diberi nilai"""
+
+    def __init__(self, symbols):
+        self.symbols = tuple(symbols)
+        super().__init__(f"Missing value for: {', '.join(self.symbols)}")
+
+
+class ZeroInputError(FormulaError):
+    """Pembagian dengan nol karena salah satu masukan bernilai nol"""
+
+    def __init__(self, symbol=None):
+        self.symbol = symbol
+        if symbol:
+            super().__init__(f"{symbol} cannot be zero")
+        else:
+            super().__init__("Division by zero")
+
+
+class DomainError(FormulaError):
+    """Masukan di luar domain fungsi (misalnya akar bilangan negatif atau acos di atas 1)"""
+
+    def __init__(self, detail=None):
+        self.detail = detail
+        super().__init__("Inputs are outside the formula's domain")
+
+
+class ResultTooLargeError(FormulaError):
+    """Hasil (atau hasil antara) terlalu besar untuk float"""
+
+    def __init__(self):
+        super().__init__("Result is too large")
+
+
+# ===== Tokenizer =====
+
+FRACTIONS = {'½': 0.5, '¼': 0.25, '¾': 0.75, '⅓': 1 / 3, '⅔': 2 / 3}
+SUPERSCRIPTS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻', '0123456789-')
+OPERATORS = {
+    '+': '+', '-': '-', '−': '-',
+    '×': '*', '·': '*', '*': '*',
+    '/': '/', '÷': '/',
+    '^': '^', '(': '(', ')': ')', '=': '=',
+}
+
+# Fungsi yang dikenali; sudut dalam derajat seperti pada katalog
+FUNCTIONS = ('sin', 'cos', 'tan', 'sqrt')
+
+_TOKEN_RE = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<fraction>[½¼¾⅓⅔])
+  | (?P<sup>[⁻]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)
+  | (?P<ident>Δ?(?:[A-Za-z]+|[µͰ-Ͽ])(?:_[A-Za-z0-9]+|[₀-₉]+)*)
+  | (?P<op>[-+−×·*/÷^()=])
+''', re.VERBOSE)
+
+
+def tokenize(text):
+    """Memecah string rumus menjadi daftar token (jenis, nilai)"""
+    tokens = []
+    pos = 0
+
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            raise FormulaSyntaxError(f"Unexpected character {text[pos]!r} in {text!r}")
+
+        kind = match.lastgroup
+        value = match.group()
+        pos = match.end()
+
+        if kind == 'space':
+            continue
+        if kind == 'number':
+            tokens.append(('num', float(value)))
+        elif kind == 'fraction':
+            tokens.append(('num', FRACTIONS[value]))
+        elif kind == 'sup':
+            tokens.append(('sup', float(value.translate(SUPERSCRIPTS))))
+        elif kind == 'ident':
+            tokens.append(('func' if value in FUNCTIONS else 'ident', value))
+        else:
+            tokens.append(('op', OPERATORS[value]))
+
+    return tokens
+
+
+# ===== Pohon ekspresi =====
+
+class Num:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Var:
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class BinOp:
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+
+class Neg:
+    __slots__ = ('arg',)
+
+    def __init__(self, arg):
+        self.arg = arg
+
+
+class Pow:
+    __slots__ = ('base', 'exponent')
+
+    def __init__(self, base, exponent):
+        self.base = base
+        self.exponent = exponent
+
+
+class Func:
+    __slots__ = ('name', 'arg')
+
+    def __init__(self, name, arg):
+        self.name = name
+        self.arg = arg
+
+
+def variables_of(node, found=None):
+    """Mengembalikan daftar variabel sesuai urutan kemunculan"""
+    if found is None:
+        found = []
+    if isinstance(node, Var):
+        if node.name not in found:
+            found.append(node.name)
+    elif isinstance(node, BinOp):
+        variables_of(node.left, found)
+        variables_of(node.right, found)
+    elif isinstance(node, Pow):
+        variables_of(node.base, found)
+        variables_of(node.exponent, found)
+    elif isinstance(node, (Neg, Func)):
+        variables_of(node.arg, found)
+    return found
+
+
+def count_variable(node, name):
+    """Menghitung berapa kali sebuah variabel muncul"""
+    if isinstance(node, Var):
+        return 1 if node.name == name else 0
+    if isinstance(node, BinOp):
+        return count_variable(node.left, name) + count_variable(node.right, name)
+    if isinstance(node, Pow):
+        return count_variable(node.base, name) + count_variable(node.exponent, name)
+    if isinstance(node, (Neg, Func)):
+        return count_variable(node.arg, name)
+    return 0
+
+
+def denominators_of(node, found=None):
+    """Mengembalikan variabel yang muncul sebagai penyebut (untuk pesan error)"""
+    if found is None:
+        found = []
+    if isinstance(node, BinOp):
+        if node.op == '/':
+            for name in variables_of(node.right):
+                if name not in found:
+                    found.append(name)
+        denominators_of(node.left, found)
+        denominators_of(node.right, found)
+    elif isinstance(node, Pow):
+        denominators_of(node.base, found)
+    elif isinstance(node, (Neg, Func)):
+        denominators_of(node.arg, found)
+    return found
+
+
+# ===== Parser =====
+
+class _Parser:
+    """Parser recursive descent untuk notasi rumus di katalog"""
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return (None, None)
+
+    def advance(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expect(self, value):
+        kind, token = self.advance()
+        if kind != 'op' or token != value:
+            raise FormulaSyntaxError(f"Expected {value!r} in {self.text!r}")
+
+    def parse_equation(self):
+        left = self.parse_expression()
+        self.expect('=')
+        right = self.parse_expression()
+        if self.peek()[0] is not None:
+            raise FormulaSyntaxError(f"Unexpected token {self.peek()[1]!r} in {self.text!r}")
+        return left, right
+
+    def parse_expression(self):
+        node = self.parse_term()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            op = self.advance()[1]
+            node = BinOp(op, node, self.parse_term())
+        return node
+
+    def starts_atom(self):
+        kind, value = self.peek()
+        return kind in ('num', 'ident', 'func') or (kind == 'op' and value == '(')
+
+    def parse_term(self):
+        node = self.parse_unary()
+        while True:
+            if self.peek() in (('op', '*'), ('op', '/')):
+                op = self.advance()[1]
+                node = BinOp(op, node, self.parse_unary())
+            elif self.starts_atom():
+                # Perkalian implisit, misalnya 'cos θ' atau '½ m v²'
+                node = BinOp('*', node, self.parse_unary())
+            else:
+                return node
+
+    def parse_unary(self):
+        if self.peek() == ('op', '-'):
+            self.advance()
+            return Neg(self.parse_unary())
+        return self.parse_power()
+
+    def parse_power(self):
+        node = self.parse_atom()
+        kind, value = self.peek()
+        if kind == 'sup':
+            self.advance()
+            return Pow(node, Num(value))
+        if (kind, value) == ('op', '^'):
+            self.advance()
+            return Pow(node, self.parse_unary())
+        return node
+
+    def parse_atom(self):
+        kind, value = self.advance()
+        if kind == 'num':
+            return Num(value)
+        if kind == 'ident':
+            return Var(value)
+        if kind == 'func':
+            return Func(value, self.parse_power())
+        if (kind, value) == ('op', '('):
+            node = self.parse_expression()
+            self.expect(')')
+            return node
+        raise FormulaSyntaxError(f"Unexpected token {value!r} in {self.text!r}")
+
+
+def parse_formula(text):
+    """Parse string rumus menjadi pasangan (ruas kiri, ruas kanan)"""
+    return _Parser(text).parse_equation()
+
+
+# ===== Penyelesaian simbolik =====
+
+_INVERSE_FUNCTIONS = {'sin': 'asin', 'cos': 'acos', 'tan': 'atan', 'asin': 'sin', 'acos': 'cos', 'atan': 'tan'}
+
+
+def isolate(left, right, target):
+    """
+    Mengisolasi variabel target sehingga target = ekspresi
+
+    Args:
+        left: Ruas kiri persamaan
+        right: Ruas kanan persamaan
+        target: Simbol variabel yang dicari
+
+    Raises:
+        UnsolvableError: Jika target tidak muncul tepat satu kali
+    """
+    occurrences = count_variable(left, target) + count_variable(right, target)
+    if occurrences != 1:
+        raise UnsolvableError(f"Cannot solve for {target!r}")
+
+    if count_variable(right, target):
+        left, right = right, left
+
+    while not isinstance(left, Var):
+        if isinstance(left, BinOp):
+            in_left = count_variable(left.left, target) > 0
+            other = left.right if in_left else left.left
+
+            if left.op == '+':
+                right = BinOp('-', right, other)
+            elif left.op == '-':
+                right = BinOp('+', right, other) if in_left else BinOp('-', other, right)
+            elif left.op == '*':
+                right = BinOp('/', right, other)
+            elif left.op == '/':
+                right = BinOp('*', right, other) if in_left else BinOp('/', other, right)
+
+            left = left.left if in_left else left.right
+
+        elif isinstance(left, Neg):
+            right = Neg(right)
+            left = left.arg
+
+        elif isinstance(left, Pow):
+            if count_variable(left.exponent, target):
+                raise UnsolvableError(f"Cannot solve for {target!r} in an exponent")
+            right = Func('root', BinOp(',', right, left.exponent))
+            left = left.base
+
+        elif isinstance(left, Func):
+            if left.name == 'sqrt':
+                right = Pow(right, Num(2.0))
+            elif left.name in _INVERSE_FUNCTIONS:
+                right = Func(_INVERSE_FUNCTIONS[left.name], right)
+            else:
+                raise UnsolvableError(f"Cannot invert {left.name!r}")
+            left = left.arg
+
+        else:
+            raise UnsolvableError(f"Cannot solve for {target!r}")
+
+    return right
+
+
+# ===== Kompilasi ke fungsi Python =====
+
+def _root(value, degree):
+    """Akar pangkat n (akar utama), error untuk bilangan negatif"""
+    if degree == 2:
+        return math.sqrt(value)
+    return math.pow(value, 1.0 / degree)
+
+
+_RUNTIME = {
+    '_sin': lambda x: math.sin(math.radians(x)),
+    '_cos': lambda x: math.cos(math.radians(x)),
+    '_tan': lambda x: math.tan(math.radians(x)),
+    '_asin': lambda x: math.degrees(math.asin(x)),
+    '_acos': lambda x: math.degrees(math.acos(x)),
+    '_atan': lambda x: math.degrees(math.atan(x)),
+    '_sqrt': math.sqrt,
+    '_root': _root,
+    '__builtins__': {},
+}
+
+
+def _to_python(node, names):
+    """Menerjemahkan pohon ekspresi menjadi kode Python"""
+    if isinstance(node, Num):
+        return repr(node.value)
+    if isinstance(node, Var):
+        return names[node.name]
+    if isinstance(node, Neg):
+        return f"(-{_to_python(node.arg, names)})"
+    if isinstance(node, Pow):
+        return f"({_to_python(node.base, names)} ** {_to_python(node.exponent, names)})"
+    if isinstance(node, BinOp):
+        if node.op == ',':
+            return f"{_to_python(node.left, names)}, {_to_python(node.right, names)}"
+        return f"({_to_python(node.left, names)} {node.op} {_to_python(node.right, names)})"
+    if isinstance(node, Func):
+        return f"_{node.name}({_to_python(node.arg, names)})"
+    raise FormulaError(f"Unknown node {node!r}")
+
+
+def _numpy_runtime():
+    """Runtime untuk versi vektor (NumPy); None jika NumPy tidak terpasang"""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    return {
+        '_sin': lambda x: np.sin(np.radians(x)),
+        '_cos': lambda x: np.cos(np.radians(x)),
+        '_tan': lambda x: np.tan(np.radians(x)),
+        '_asin': lambda x: np.degrees(np.arcsin(x)),
+        '_acos': lambda x: np.degrees(np.arccos(x)),
+        '_atan': lambda x: np.degrees(np.arctan(x)),
+        '_sqrt': np.sqrt,
+        '_root': lambda x, degree: np.sqrt(x) if degree == 2 else np.power(x, 1.0 / degree),
+        '__builtins__': {},
+    }
+
+
+def compile_expression(expression, inputs, runtime=None):
+    """
+    Mengompilasi ekspresi menjadi fungsi dengan argumen posisi sesuai urutan inputs
+
+    Args:
+        expression: Pohon ekspresi
+        inputs: Urutan simbol argumen
+        runtime: Namespace fungsi (default: versi math untuk skalar)
+    """
+    names = {symbol: f"x{i}" for i, symbol in enumerate(inputs)}
+    args = ', '.join(names[symbol] for symbol in inputs)
+    source = f"lambda {args}: {_to_python(expression, names)}"
+    return eval(compile(source, '<formula>', 'eval'), dict(runtime or _RUNTIME))
+
+
+# ===== Tampilan ekspresi =====
+
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+_SUPERSCRIPT_DIGITS = str.maketrans('0123456789-', '⁰¹²³⁴⁵⁶⁷⁸⁹⁻')
+_DISPLAY_NUMBERS = {value: symbol for symbol, value in FRACTIONS.items()}
+
+
+def format_number(value):
+    """Format konstanta rumus untuk tampilan (0.5 ditulis ½ seperti di katalog)"""
+    if value in _DISPLAY_NUMBERS:
+        return _DISPLAY_NUMBERS[value]
+    return f"{value:g}"
+
+
+def render(node, values=None, parent=0):
+    """
+    Menampilkan ekspresi dengan notasi katalog (×, /, ², √)
+
+    Args:
+        node: Pohon ekspresi
+        values: Dictionary nilai untuk substitusi variabel (opsional)
+        parent: Prioritas operator induk (untuk tanda kurung)
+    """
+    if isinstance(node, Num):
+        return format_number(node.value)
+
+    if isinstance(node, Var):
+        if values and node.name in values:
+            # Nilai masukan pengguna selalu ditulis sebagai angka, bukan pecahan
+            return f"{float(values[node.name]):g}"
+        return node.name
+
+    if isinstance(node, Neg):
+        text = f"-{render(node.arg, values, 3)}"
+        return f"({text})" if parent > 3 else text
+
+    if isinstance(node, Pow):
+        base = render(node.base, values, 4)
+        if isinstance(node.exponent, Num) and float(node.exponent.value).is_integer():
+            return base + format_number(node.exponent.value).translate(_SUPERSCRIPT_DIGITS)
+        return f"{base}^{render(node.exponent, values, 4)}"
+
+    if isinstance(node, BinOp):
+        precedence = _PRECEDENCE[node.op]
+        symbol = '×' if node.op == '*' else node.op
+        # Ruas kanan '-' dan '/' butuh kurung pada prioritas yang sama
+        left = render(node.left, values, precedence)
+        right = render(node.right, values, precedence + 1)
+        text = f"{left} {symbol} {right}"
+        return f"({text})" if precedence < parent else text
+
+    if isinstance(node, Func):
+        if node.name == 'root':
+            arg, degree = node.arg.left, node.arg.right
+            if isinstance(degree, Num) and degree.value == 2:
+                return f"√({render(arg, values)})"
+            return f"({render(arg, values)})^(1/{render(degree, values)})"
+        return f"{node.name}({render(node.arg, values)})"
+
+    raise FormulaError(f"Unknown node {node!r}")
+
+
+# ===== Rumus terkompilasi =====
+
+class Solver:
+    """Fungsi terkompilasi untuk menghitung satu variabel target"""
+
+    __slots__ = ('target', 'inputs', 'expression', 'function', 'denominators', '_vectorized')
+
+    def __init__(self, target, inputs, expression):
+        self.target = target
+        self.inputs = tuple(inputs)
+        self.expression = expression
+        self.function = compile_expression(expression, self.inputs)
+        self.denominators = tuple(denominators_of(expression))
+        self._vectorized = None
+
+    @property
+    def vectorized(self):
+        """
+        Versi NumPy dari solver: argumen posisi berupa array, hasil array
+
+        Pembagian dengan nol menghasilkan inf/NaN (tidak raise); pemanggil
+        memeriksa sendiri elemen yang tidak valid. None jika NumPy tidak ada.
+        """
+        if self._vectorized is None:
+            runtime = _numpy_runtime()
+            if runtime is None:
+                return None
+            self._vectorized = compile_expression(self.expression, self.inputs, runtime)
+        return self._vectorized
+
+    def __call__(self, values):
+        """Menghitung target dari dictionary {simbol: nilai}"""
+        try:
+            args = [values[symbol] for symbol in self.inputs]
+        except KeyError:
+            raise MissingInputError(s for s in self.inputs if s not in values)
+
+        try:
+            return self.function(*args)
+        except ZeroDivisionError:
+            for symbol in self.denominators:
+                if symbol in values and values[symbol] == 0:
+                    raise ZeroInputError(symbol)
+            raise ZeroInputError()
+        except ValueError as e:
+            raise DomainError(str(e)) from e
+        except OverflowError as e:
+            raise ResultTooLargeError() from e
+
+
+class CompiledFormula:
+    """Rumus yang sudah diparse, dengan solver tercache untuk setiap variabel"""
+
+    def __init__(self, text, default_target=None):
+        self.text = text
+        self.left, self.right = parse_formula(text)
+
+        symbols = variables_of(self.left)
+        variables_of(self.right, symbols)
+        self.symbols = tuple(symbols)
+
+        if default_target is None and isinstance(self.left, Var):
+            default_target = self.left.name
+        self.default_target = default_target
+
+        self._solvers = {}
+
+    def solver(self, target=None):
+        """Mengembalikan solver (tercache) untuk variabel target"""
+        target = target or self.default_target
+        solver = self._solvers.get(target)
+
+        if solver is None:
+            if target not in self.symbols:
+                raise UnsolvableError(f"{target!r} is not a variable of {self.text!r}")
+            expression = isolate(self.left, self.right, target)
+            inputs = [symbol for symbol in self.symbols if symbol != target]
+            solver = Solver(target, inputs, expression)
+            self._solvers[target] = solver
+
+        return solver
+
+    def evaluate(self, values, target=None):
+        """Menghitung nilai variabel target dari nilai variabel lain"""
+        return self.solver(target)(values)
+
+    def solved_text(self, target=None, values=None):
+        """Menampilkan bentuk 'target = ekspresi', opsional dengan nilai disubstitusi"""
+        solver = self.solver(target)
+        return f"{solver.target} = {render(solver.expression, values)}"
+
+    def inputs_for(self, target=None):
+        """Daftar variabel yang dibutuhkan untuk menghitung target"""
+        return self.solver(target).inputs
+
+
+_compiled_by_text = {}
+_compiled_by_id = {}
+
+
+def compile_formula(text, default_target=None):
+    """Mengompilasi string rumus (hasil di-cache berdasarkan teks)"""
+    key = (text, default_target)
+    compiled = _compiled_by_text.get(key)
+    if compiled is None:
+        compiled = CompiledFormula(text, default_target)
+        _compiled_by_text[key] = compiled
+    return compiled
+
+
+def get_compiled_formula(formula_id):
+    """
+    Mengembalikan rumus terkompilasi untuk ID rumus di katalog
+
+    Target default adalah ruas kiri rumus, atau variabel pertama di katalog
+    jika ruas kiri bukan satu variabel (misalnya Hukum Pascal).
+    """
+    compiled = _compiled_by_id.get(formula_id)
+    if compiled is None:
+        data = get_formulas().get(formula_id)
+        if data is None:
+            raise FormulaError(f"Unknown formula: {formula_id}")
+        compiled = compile_formula(data['formula'])
+        if compiled.default_target is None:
+            compiled = compile_formula(data['formula'], data['variables'][0]['symbol'])
+        _compiled_by_id[formula_id] = compiled
+    return compiled
+
+
+def solve(formula_id, values, target=None):
+    """Menghitung variabel target sebuah rumus katalog dalam satu panggilan"""
+    return get_compiled_formula(formula_id).evaluate(values, target)
+
+
+def compile_catalog():
+    """Mengompilasi semua rumus di katalog, mengembalikan {formula_id: CompiledFormula}"""
+    return {formula_id: get_compiled_formula(formula_id) for formula_id in get_formulas()}
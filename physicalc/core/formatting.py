@@ -0,0 +1,224 @@
+"""
+Format hasil perhitungan untuk ditampilkan
+
+ResultFormatter menyimpan spesifikasi format yang sudah jadi untuk satu
+kombinasi (precision, threshold, locale), sehingga memformat satu nilai tidak
+lagi menyusun f-string baru. Angka dan satuan dikembalikan terpisah, dan
+format_batch() memformat satu array NumPy sekaligus (misalnya kolom tabel,
+sweep, atau ekspor).
+
+Contoh:
+    formatter = get_formatter(precision=2)
+    formatter.parts(1234.5, 'N')               # FormattedValue('1234.5', 'N')
+    formatter.format_batch(np.array([0.5, 2e-6]))   # ['0.5', '2.00e-06']
+    get_formatter(scientific_threshold=1e-6, locale='id').format(12345.5, 'J')   # '12.345,5 J'
+"""
+
+import math
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, format_batch mengembalikan list tanpa NumPy
+    np = None
+
+# Pemisah (desimal, ribuan) per bahasa; format dasar selalu memakai '.' dan ','
+LOCALE_SEPARATORS = {
+    'en': ('.', ','),
+    'id': (',', '.'),
+}
+
+# Di atas nilai ini format biasa memakai pemisah ribuan
+GROUPING_THRESHOLD = 10000
+
+
+class FormattedValue(namedtuple('FormattedValue', 'number unit')):
+    """Hasil format: teks angka dan satuan; str() menggabungkan keduanya"""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.number} {self.unit}"
+
+
+class ResultFormatter:
+    """
+    Formatter hasil dengan spesifikasi format yang dikompilasi sekali
+
+    Sebaiknya diambil lewat get_formatter() agar dipakai bersama.
+
+    Args:
+        precision: Jumlah digit desimal
+        scientific_threshold: Nilai absolut di bawah threshold (atau di atas
+            1/threshold) ditampilkan dalam notasi ilmiah
+        locale: Kunci LOCALE_SEPARATORS
+    """
+
+    def __init__(self, precision=2, scientific_threshold=1e-4, locale='en'):
+        if locale not in LOCALE_SEPARATORS:
+            raise ValueError(f"Unknown locale: {locale}")
+
+        self.precision = precision
+        self.scientific_threshold = scientific_threshold
+        self.locale = locale
+        self.upper_threshold = 1 / scientific_threshold
+
+        # Method format yang sudah terikat ke spesifikasinya
+        self._scientific = f"{{:.{precision}e}}".format
+        self._grouped = f"{{:,.{precision}f}}".format
+        self._plain = f"{{:.{precision}f}}".format
+        self._strip = precision > 0
+
+        decimal, group = LOCALE_SEPARATORS[locale]
+        self._translation = None
+        if (decimal, group) != ('.', ','):
+            self._translation = str.maketrans({'.': decimal, ',': group})
+
+    def _fixed(self, value, spec):
+        """Format biasa tanpa nol di belakang desimal"""
+        formatted = spec(value)
+        if self._strip:
+            formatted = formatted.rstrip('0')
+            if formatted[-1] == '.':
+                formatted = formatted[:-1]
+        return formatted
+
+    def format_number(self, value):
+        """Teks angka saja untuk satu nilai"""
+        if value is None:
+            return "--"
+
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            return f"{value}"
+
+        # Nilai khusus
+        if value != value:
+            return "NaN"
+        if value == 0:
+            return "0"
+
+        abs_value = abs(value)
+        if abs_value == math.inf:
+            return "∞" if value > 0 else "-∞"
+
+        if abs_value < self.scientific_threshold or abs_value >= self.upper_threshold:
+            formatted = self._scientific(value)
+        elif abs_value >= GROUPING_THRESHOLD:
+            formatted = self._fixed(value, self._grouped)
+        else:
+            formatted = self._fixed(value, self._plain)
+
+        if self._translation is not None:
+            formatted = formatted.translate(self._translation)
+        return formatted
+
+    def parts(self, value, unit):
+        """Mengembalikan FormattedValue(angka, satuan) untuk satu nilai"""
+        return FormattedValue(self.format_number(value), unit)
+
+    def format(self, value, unit):
+        """Teks 'angka satuan', sama dengan format_result()"""
+        return f"{self.format_number(value)} {unit}"
+
+    def format_batch(self, values, unit=None):
+        """
+        Memformat banyak nilai sekaligus
+
+        Nilai dikelompokkan dengan mask NumPy (nol, NaN, tak hingga, ilmiah,
+        ribuan, biasa) lalu tiap kelompok diformat dengan spesifikasinya
+        sendiri, tanpa memeriksa ulang besaran per elemen.
+
+        Args:
+            values: Array/list angka
+            unit: Jika diisi, hasil berupa 'angka satuan'; jika None angka saja
+
+        Returns:
+            Array NumPy (dtype object, bentuk sama dengan values) berisi teks,
+            atau list tanpa NumPy
+        """
+        if np is None:
+            numbers = [self.format_number(value) for value in values]
+            if unit is None:
+                return numbers
+            return [f"{number} {unit}" for number in numbers]
+
+        values = np.asarray(values, dtype=np.float64)
+        flat = values.ravel()
+        out = np.empty(flat.shape, dtype=object)
+
+        abs_values = np.abs(flat)
+        finite = np.isfinite(flat)
+        regular = finite & (flat != 0)
+        scientific = regular & (
+            (abs_values < self.scientific_threshold) | (abs_values >= self.upper_threshold)
+        )
+        fixed = regular & ~scientific
+        grouped = fixed & (abs_values >= GROUPING_THRESHOLD)
+        plain = fixed & ~grouped
+
+        out[finite & ~regular] = "0"
+        out[np.isnan(flat)] = "NaN"
+        out[flat == math.inf] = "∞"
+        out[flat == -math.inf] = "-∞"
+
+        if scientific.any():
+            spec = self._scientific
+            out[scientific] = [spec(value) for value in flat[scientific].tolist()]
+        for mask, spec in ((grouped, self._grouped), (plain, self._plain)):
+            if mask.any():
+                fixed_format = self._fixed
+                out[mask] = [fixed_format(value, spec) for value in flat[mask].tolist()]
+
+        if self._translation is not None:
+            translation = self._translation
+            out[regular] = [text.translate(translation) for text in out[regular].tolist()]
+        if unit is not None:
+            suffix = f" {unit}"
+            out = np.array([text + suffix for text in out.tolist()], dtype=object)
+
+        return out.reshape(values.shape)
+
+
+_formatters = {}
+
+
+def get_formatter(precision=2, scientific_threshold=1e-4, locale='en'):
+    """Mengembalikan ResultFormatter (tercache) untuk kombinasi pengaturan"""
+    key = (precision, scientific_threshold, locale)
+    formatter = _formatters.get(key)
+    if formatter is None:
+        formatter = _formatters[key] = ResultFormatter(precision, scientific_threshold, locale)
+    return formatter
+
+
+def format_result(value, unit, precision=2, scientific_threshold=1e-4):
+    """
+    Format hasil perhitungan dengan unit yang sesuai
+    
+    Args:
+        value: Nilai yang akan diformat
+        unit: Unit pengukuran
+        precision: Jumlah digit desimal
+        scientific_threshold: Threshold untuk notasi ilmiah
+    """
+    return get_formatter(precision, scientific_threshold).format(value, unit)
+
+def round_to_significant(value, digits=3):
+    """
+    Membulatkan angka ke digit signifikan tertentu
+    
+    Args:
+        value: Angka yang akan dibulatkan
+        digits: Jumlah digit signifikan
+    """
+    if value == 0:
+        return 0
+    
+    try:
+        value = float(value)
+        scale = 10 ** (digits - 1 - math.floor(math.log10(abs(value))))
+        return round(value * scale) / scale
+    except:
+        return value
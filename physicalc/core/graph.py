@@ -0,0 +1,283 @@
+"""
+Graf rumus dan besaran untuk soal bertahap
+
+Rumus katalog dan besaran (variabel) membentuk graf bipartit: setiap rumus
+terhubung ke besaran yang dipakainya, dan dari rumus dengan n besaran, satu
+besaran bisa dihitung jika n - 1 lainnya diketahui. Dari besaran yang
+diketahui, find_path() mencari rantai penerapan rumus terpendek (BFS) menuju
+besaran target, lalu solve_chain() menghitung rantai itu dengan mesin rumus.
+
+Besaran dikenali dari simbolnya. Simbol yang dipakai untuk besaran berbeda
+(P untuk tekanan dan daya) diberi satuan, misalnya 'P[Pa]' dan 'P[W]'.
+
+Contoh:
+    result = solve_chain({'m': 2, 'a': 3, 'A': 0.5}, 'P[Pa]')
+    [step.formula_id for step in result.steps]   # ['force', 'pressure']
+    result.value                                 # 12.0
+"""
+
+from collections import deque, namedtuple
+
+from .cache import CalculationCache
+from .calculator import display_unit
+from .catalog import get_formulas
+from .engine import FormulaError, get_compiled_formula
+
+# Batas panjang rantai rumus yang dicari
+MAX_STEPS = 8
+
+# Jumlah rencana (knowns, target) yang diingat
+PATH_CACHE_SIZE = 256
+
+_NO_PATH = 'no path'
+
+
+class NoSolutionError(FormulaError):
+    """Target tidak bisa dihitung dari besaran yang diketahui"""
+
+
+# Satu arah penerapan rumus: menghitung quantity (simbol target) dari inputs
+# berupa tuple (simbol di rumus, kunci besaran)
+Derivation = namedtuple('Derivation', 'formula_id target quantity inputs')
+
+# Satu langkah yang sudah dihitung; text berisi rumus dengan nilai disubstitusi
+SolutionStep = namedtuple('SolutionStep', 'formula_id target quantity value text')
+
+
+class ChainResult:
+    """Hasil solve_chain: nilai target, langkah-langkahnya, dan semua besaran"""
+
+    def __init__(self, target, value, steps, values):
+        self.target = target
+        self.value = value
+        self.steps = steps
+        self.values = values
+
+    def __repr__(self):
+        return f"ChainResult({self.target}={self.value!r}, steps={len(self.steps)})"
+
+
+class FormulaGraph:
+    """
+    Graf bipartit rumus-besaran atas katalog, dibangun sekali
+
+    Args:
+        formula_ids: ID rumus yang dimasukkan (default semua rumus katalog)
+    """
+
+    def __init__(self, formula_ids=None):
+        formulas = get_formulas()
+        formula_ids = tuple(formulas if formula_ids is None else formula_ids)
+
+        # Satuan tiap simbol per rumus, untuk membedakan simbol yang sama
+        symbol_units = {}
+        units_of = {}
+        for formula_id in formula_ids:
+            units = {
+                variable['symbol']: display_unit(variable['unit'])
+                for variable in formulas[formula_id]['variables']
+            }
+            units_of[formula_id] = units
+            for symbol in get_compiled_formula(formula_id).symbols:
+                symbol_units.setdefault(symbol, set()).add(units.get(symbol, ''))
+
+        def quantity_key(symbol, unit):
+            return symbol if len(symbol_units[symbol]) == 1 else f"{symbol}[{unit}]"
+
+        self.quantities = {}      # kunci besaran -> nama
+        self.by_symbol = {}       # simbol -> tuple kunci besaran
+        self.formulas = {}        # formula_id -> tuple kunci besaran
+        self.derivations = []
+        self.producers = {}       # kunci besaran -> derivasi yang menghasilkannya
+        self.defaults = {}        # kunci besaran -> nilai default katalog (misalnya g)
+
+        for formula_id in formula_ids:
+            compiled = get_compiled_formula(formula_id)
+            units = units_of[formula_id]
+            keys = {symbol: quantity_key(symbol, units.get(symbol, '')) for symbol in compiled.symbols}
+            self.formulas[formula_id] = tuple(keys.values())
+
+            for variable in formulas[formula_id]['variables']:
+                key = keys.get(variable['symbol'])
+                if key is None:
+                    continue
+                self.quantities.setdefault(key, variable['name'])
+                if variable.get('default') is not None:
+                    self.defaults.setdefault(key, variable['default'])
+            for symbol, key in keys.items():
+                self.quantities.setdefault(key, symbol)
+                known = self.by_symbol.setdefault(symbol, ())
+                if key not in known:
+                    self.by_symbol[symbol] = known + (key,)
+
+            for target in compiled.symbols:
+                try:
+                    inputs = compiled.inputs_for(target)
+                except FormulaError:
+                    continue  # target tidak bisa diisolasi (misalnya di dalam cos)
+                derivation = Derivation(
+                    formula_id, target, keys[target],
+                    tuple((symbol, keys[symbol]) for symbol in inputs)
+                )
+                self.derivations.append(derivation)
+                self.producers.setdefault(derivation.quantity, []).append(derivation)
+
+        self.cache = CalculationCache(maxsize=PATH_CACHE_SIZE)
+
+    def resolve(self, name):
+        """
+        Mengubah simbol ('m') atau kunci besaran ('P[Pa]') menjadi kunci besaran
+
+        Raises:
+            FormulaError: Jika tidak dikenal atau simbolnya dipakai beberapa besaran
+        """
+        if name in self.quantities:
+            return name
+        keys = self.by_symbol.get(name)
+        if not keys:
+            raise FormulaError(f"Unknown quantity: {name}")
+        if len(keys) > 1:
+            raise FormulaError(f"Ambiguous quantity {name}, use one of: {', '.join(keys)}")
+        return keys[0]
+
+    def formulas_using(self, name):
+        """ID rumus yang memakai sebuah besaran"""
+        key = self.resolve(name)
+        return tuple(formula_id for formula_id, keys in self.formulas.items() if key in keys)
+
+    def reachable(self, knowns):
+        """Semua besaran yang bisa dihitung dari knowns (forward chaining)"""
+        known = set(knowns)
+        changed = True
+        while changed:
+            changed = False
+            for derivation in self.derivations:
+                if derivation.quantity not in known and all(key in known for _, key in derivation.inputs):
+                    known.add(derivation.quantity)
+                    changed = True
+        return known
+
+    def _relevant(self, target, reachable):
+        """Derivasi yang bisa ikut menghasilkan target (ditelusuri mundur dari target)"""
+        relevant = []
+        seen = set()
+        needed = deque([target])
+        while needed:
+            quantity = needed.popleft()
+            if quantity in seen:
+                continue
+            seen.add(quantity)
+            for derivation in self.producers.get(quantity, ()):
+                if all(key in reachable for _, key in derivation.inputs):
+                    relevant.append(derivation)
+                    needed.extend(key for _, key in derivation.inputs)
+        return relevant
+
+    def find_path(self, knowns, target):
+        """
+        Rantai derivasi terpendek dari besaran knowns menuju target
+
+        Hasil di-memoize per (knowns, target).
+
+        Returns:
+            Tuple Derivation sesuai urutan penerapan (kosong jika target sudah
+            diketahui), atau None jika tidak ada rantai
+        """
+        knowns = frozenset(self.resolve(name) for name in knowns)
+        target = self.resolve(target)
+        key = (knowns, target)
+
+        path = self.cache.get(key)
+        if path is None:
+            path = self._search(knowns, target)
+            self.cache.set(key, _NO_PATH if path is None else path)
+        return None if path == _NO_PATH else path
+
+    def _search(self, knowns, target):
+        """BFS atas himpunan besaran yang diketahui, hanya lewat derivasi yang relevan"""
+        if target in knowns:
+            return ()
+        reachable = self.reachable(knowns)
+        if target not in reachable:
+            return None
+
+        derivations = self._relevant(target, reachable)
+        queue = deque([(knowns, ())])
+        visited = {knowns}
+        while queue:
+            state, path = queue.popleft()
+            if len(path) >= MAX_STEPS:
+                continue
+            for derivation in derivations:
+                quantity = derivation.quantity
+                if quantity in state or not all(key in state for _, key in derivation.inputs):
+                    continue
+                if quantity == target:
+                    return path + (derivation,)
+                next_state = state | {quantity}
+                if next_state not in visited:
+                    visited.add(next_state)
+                    queue.append((next_state, path + (derivation,)))
+        return None
+
+    def solve_chain(self, values, target, use_defaults=True):
+        """
+        Menghitung target dari nilai besaran yang diketahui lewat rantai rumus
+
+        Args:
+            values: {simbol atau kunci besaran: angka}
+            target: Simbol atau kunci besaran yang dicari
+            use_defaults: Tambahkan nilai default katalog (misalnya g = 9.8)
+                untuk besaran yang tidak diberikan
+
+        Returns:
+            ChainResult
+
+        Raises:
+            NoSolutionError: Jika tidak ada rantai rumus menuju target
+            FormulaError: Error mesin rumus saat menghitung (misalnya pembagian nol)
+        """
+        known = {self.resolve(name): value for name, value in values.items()}
+        target = self.resolve(target)
+        if use_defaults:
+            for key, value in self.defaults.items():
+                if key != target:
+                    known.setdefault(key, value)
+
+        path = self.find_path(known, target)
+        if path is None:
+            raise NoSolutionError(f"Cannot calculate {target} from {', '.join(values) or 'nothing'}")
+
+        steps = []
+        for derivation in path:
+            inputs = {symbol: known[key] for symbol, key in derivation.inputs}
+            compiled = get_compiled_formula(derivation.formula_id)
+            value = compiled.evaluate(inputs, derivation.target)
+            known[derivation.quantity] = value
+            steps.append(SolutionStep(
+                derivation.formula_id, derivation.target, derivation.quantity, value,
+                compiled.solved_text(derivation.target, inputs)
+            ))
+
+        return ChainResult(target, known[target], tuple(steps), known)
+
+
+_graph = None
+
+
+def get_formula_graph():
+    """Graf rumus katalog, dibangun sekali"""
+    global _graph
+    if _graph is None:
+        _graph = FormulaGraph()
+    return _graph
+
+
+def find_path(knowns, target):
+    """Rantai derivasi terpendek pada graf katalog (lihat FormulaGraph.find_path)"""
+    return get_formula_graph().find_path(knowns, target)
+
+
+def solve_chain(values, target, use_defaults=True):
+    """Menghitung target lewat rantai rumus katalog (lihat FormulaGraph.solve_chain)"""
+    return get_formula_graph().solve_chain(values, target, use_defaults)
@@ -0,0 +1,86 @@
+"""
+Registry rumus fisika yang dibangun sekali lalu dibekukan
+Menyediakan index O(1) berdasarkan ID materi, kategori, nama rumus, dan simbol variabel
+"""
+
+from types import MappingProxyType
+
+
+def freeze(value):
+    """Membekukan dict/list secara rekursif menjadi mapping read-only dan tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def split_symbols(symbol):
+    """Memecah simbol gabungan seperti 'F₁, F₂' menjadi simbol tunggal"""
+    return [part.strip() for part in symbol.split(',') if part.strip()]
+
+
+class FormulaRegistry:
+    """Registry materi dan rumus yang tidak bisa diubah setelah dibangun"""
+
+    def __init__(self, topics):
+        """
+        Args:
+            topics: Dictionary materi {topic_id: {'category', 'formulas', ...}}
+        """
+        self._topics = freeze(topics)
+
+        by_category = {}
+        by_name = {}
+        by_symbol = {}
+
+        for topic_id, topic in self._topics.items():
+            by_category.setdefault(topic['category'], []).append(topic)
+
+            for formula in topic['formulas']:
+                entry = (topic_id, formula)
+                by_name.setdefault(formula['title'], entry)
+
+                for variable in formula['variables']:
+                    for symbol in split_symbols(variable['symbol']):
+                        by_symbol.setdefault(symbol, []).append(entry)
+
+        self._by_category = freeze(by_category)
+        self._by_name = MappingProxyType(by_name)
+        self._by_symbol = freeze(by_symbol)
+        self._categories = tuple(self._by_category.keys())
+
+    @property
+    def topics(self):
+        """Semua materi dalam bentuk mapping read-only"""
+        return self._topics
+
+    @property
+    def categories(self):
+        """Daftar kategori sesuai urutan kemunculan"""
+        return self._categories
+
+    def get_topic(self, topic_id):
+        """Mengembalikan materi berdasarkan ID atau None"""
+        return self._topics.get(topic_id)
+
+    def get_topics_by_category(self, category):
+        """Mengembalikan tuple materi dalam satu kategori"""
+        return self._by_category.get(category, ())
+
+    def get_formula_by_name(self, name):
+        """Mengembalikan pasangan (topic_id, rumus) berdasarkan nama rumus atau None"""
+        return self._by_name.get(name)
+
+    def get_formulas_by_symbol(self, symbol):
+        """Mengembalikan tuple (topic_id, rumus) yang memakai simbol variabel tertentu"""
+        return self._by_symbol.get(symbol, ())
+
+    def __len__(self):
+        return len(self._topics)
+
+    def __contains__(self, topic_id):
+        return topic_id in self._topics
+
+    def __iter__(self):
+        return iter(self._topics)
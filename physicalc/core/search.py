@@ -0,0 +1,466 @@
+"""
+Pencarian rumus: inverted index + prefix trie, dibangun sekali dari katalog
+
+Setiap rumus diindeks dari judul, teks rumus, deskripsi, nama dan simbol
+variabel, kategori, contoh, dan catatan, dalam semua bahasa katalog. Setiap
+kata query dicocokkan sebagai awalan (prefix) kata di index, sehingga hasil
+bisa diperbarui di setiap ketikan; kata yang cocok penuh diberi skor lebih
+tinggi. Semua kata query harus cocok (AND).
+
+SearchSession menyimpan hasil query sebelumnya: jika query baru hanya
+menambah karakter, hasilnya disaring dari kandidat sebelumnya tanpa
+memindai ulang index, dan backspace kembali ke hasil yang sudah ada.
+
+Kata query yang tidak menjadi awalan kata mana pun dicari secara fuzzy
+('presure' -> 'pressure', 'kecepatn' -> 'kecepatan'): index trigram memilih
+kandidat kosakata, lalu jarak edit (bit-parallel, dibatasi max_edits) dihitung
+hanya untuk kandidat tersebut. Huruf Yunani juga diindeks dengan namanya,
+sehingga 'rho' menemukan 'ρ'.
+
+Contoh:
+    session = SearchSession()
+    session.search('kec')         # ['linear_motion', ...]
+    session.search('kecepatan')   # disaring dari hasil 'kec'
+"""
+
+import heapq
+import re
+import unicodedata
+from collections import Counter, namedtuple
+
+from .catalog import LANGUAGES, get_formulas
+from .registry import split_symbols
+
+# Bobot per field; satu kata di beberapa field memakai bobot tertinggi
+FIELD_WEIGHTS = {
+    'title': 10,
+    'symbol': 8,
+    'variable': 6,
+    'formula': 5,
+    'category': 4,
+    'formula_display': 3,
+    'description': 2,
+    'notes': 1,
+    'example': 1,
+}
+
+# Pengali skor jika kata query hanya awalan dari kata di index
+PREFIX_FACTOR = 0.5
+
+# Pengali skor untuk kata yang cocok secara fuzzy, dibagi (jarak edit + 1)
+FUZZY_FACTOR = 0.6
+
+# Jumlah kandidat fuzzy (trigram bersama terbanyak) yang diverifikasi jarak editnya
+MAX_FUZZY_CANDIDATES = 200
+
+# Jumlah fungsi skor per kata yang disimpan SearchSession
+MAX_CACHED_TERMS = 256
+
+# Nama huruf Yunani, diindeks sebagai alias simbol ('ρ' juga dicari lewat 'rho')
+GREEK_NAMES = str.maketrans({
+    'α': 'alpha', 'β': 'beta', 'γ': 'gamma', 'δ': 'delta', 'ε': 'epsilon',
+    'ζ': 'zeta', 'η': 'eta', 'θ': 'theta', 'ι': 'iota', 'κ': 'kappa',
+    'λ': 'lambda', 'μ': 'mu', 'ν': 'nu', 'ξ': 'xi', 'ο': 'omicron',
+    'π': 'pi', 'ρ': 'rho', 'σ': 'sigma', 'ς': 'sigma', 'τ': 'tau',
+    'υ': 'upsilon', 'φ': 'phi', 'ϕ': 'phi', 'χ': 'chi', 'ψ': 'psi', 'ω': 'omega',
+})
+
+# Kecocokan satu kata query: score(doc_id), {id: bobot} kandidat, dan apakah fuzzy
+TermMatch = namedtuple('TermMatch', 'score ids fuzzy')
+NO_MATCH = TermMatch(None, None, False)
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def fold(text):
+    """Huruf kecil tanpa aksen; subscript/superscript menjadi angka biasa ('F₁' -> 'f1')"""
+    text = unicodedata.normalize('NFKD', text).lower()
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+def tokenize(text):
+    """Memecah teks menjadi kata-kata yang sudah di-fold"""
+    return _WORD_RE.findall(fold(text))
+
+
+def max_edits(term):
+    """Jarak edit maksimum yang ditoleransi untuk kata sepanjang term"""
+    if len(term) < 4:
+        return 0
+    return 1 if len(term) < 8 else 2
+
+
+def prefix_edit_distance(pattern, text, limit):
+    """
+    Jarak edit terkecil antara pattern dan awalan mana pun dari text
+
+    Memakai algoritma bit-parallel Myers/Hyyrö: satu kolom matriks jarak
+    disimpan sebagai dua bitmask, sehingga setiap karakter text diproses
+    dengan beberapa operasi bit. Mengembalikan limit + 1 jika jaraknya
+    melebihi limit.
+    """
+    length = len(pattern)
+    if not length:
+        return 0
+
+    peq = {}
+    for position, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << position)
+
+    mask = (1 << length) - 1
+    high = 1 << (length - 1)
+    positive = mask
+    negative = 0
+    score = best = length
+
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | negative
+        xh = (((eq & positive) + positive) ^ positive) | eq
+        ph = negative | ~(xh | positive)
+        mh = positive & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        positive = (mh | ~(xv | ph)) & mask
+        negative = ph & xv & mask
+        if score < best:
+            best = score
+            if best == 0:
+                break
+
+    return best if best <= limit else limit + 1
+
+
+def _trigrams(term):
+    """Trigram awalan kata ('$$' menandai awal kata)"""
+    padded = '$$' + term
+    return {padded[i:i + 3] for i in range(len(term))}
+
+
+def formula_fields(formula):
+    """Pasangan (teks, bobot) yang diindeks untuk satu rumus hasil get_formulas(lang)"""
+    for field in ('title', 'formula', 'category', 'formula_display', 'description', 'notes', 'example'):
+        text = formula.get(field)
+        if text:
+            yield text, FIELD_WEIGHTS[field]
+
+    for variable in formula['variables']:
+        yield variable['name'], FIELD_WEIGHTS['variable']
+        for symbol in split_symbols(variable['symbol']):
+            yield symbol, FIELD_WEIGHTS['symbol']
+
+
+def formula_documents(langs=LANGUAGES):
+    """Dokumen (formula_id, fields) untuk semua rumus katalog dalam semua bahasa"""
+    views = [get_formulas(lang) for lang in langs]
+    for formula_id in views[0]:
+        fields = []
+        for formulas in views:
+            fields.extend(formula_fields(formulas[formula_id]))
+        yield formula_id, fields
+
+
+class _TrieNode:
+    """Simpul trie; ids (semua dokumen di bawah simpul) dihitung saat pertama dipakai"""
+
+    __slots__ = ('children', 'exact', 'ids')
+
+    def __init__(self):
+        self.children = {}
+        self.exact = None
+        self.ids = None
+
+
+class SearchIndex:
+    """
+    Inverted index {kata: {id: bobot}} dan prefix trie di atas kosakatanya
+
+    Args:
+        documents: Iterable (doc_id, [(teks, bobot), ...]); urutan dokumen
+            menjadi urutan hasil untuk skor yang sama
+    """
+
+    def __init__(self, documents):
+        self.postings = {}
+        self.order = {}
+
+        for doc_id, fields in documents:
+            self.order[doc_id] = len(self.order)
+            for text, weight in fields:
+                for term in tokenize(text):
+                    ids = self.postings.setdefault(term, {})
+                    if ids.get(doc_id, 0) < weight:
+                        ids[doc_id] = weight
+
+        # Alias nama huruf Yunani ('ρ' -> 'rho', 'δv' -> 'deltav')
+        for term in [term for term in self.postings if term != term.translate(GREEK_NAMES)]:
+            alias = self.postings.setdefault(term.translate(GREEK_NAMES), {})
+            for doc_id, weight in self.postings[term].items():
+                if alias.get(doc_id, 0) < weight:
+                    alias[doc_id] = weight
+
+        self.vocabulary = tuple(self.postings)
+        self._trigram_index = None
+
+        self.root = _TrieNode()
+        for term, ids in self.postings.items():
+            node = self.root
+            for char in term:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _TrieNode()
+                node = child
+            node.exact = ids
+
+    def __len__(self):
+        return len(self.order)
+
+    def prefix_ids(self, prefix):
+        """{id: bobot tertinggi} untuk semua kata yang diawali prefix (None jika tidak ada)"""
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return self._collect(node)
+
+    def _collect(self, node):
+        if node.ids is None:
+            ids = dict(node.exact) if node.exact else {}
+            for child in node.children.values():
+                for doc_id, weight in self._collect(child).items():
+                    if ids.get(doc_id, 0) < weight:
+                        ids[doc_id] = weight
+            node.ids = ids
+        return node.ids
+
+    def trigram_index(self):
+        """{trigram: tuple posisi kata di vocabulary}, dibangun saat pertama dipakai"""
+        if self._trigram_index is None:
+            grams = {}
+            for position, term in enumerate(self.vocabulary):
+                for gram in _trigrams(term):
+                    grams.setdefault(gram, []).append(position)
+            self._trigram_index = {gram: tuple(terms) for gram, terms in grams.items()}
+        return self._trigram_index
+
+    def fuzzy_terms(self, term, limit=None):
+        """
+        Kata di index yang awalannya berjarak edit paling banyak limit dari term
+
+        Kandidat dipilih dengan index trigram (setiap edit merusak paling
+        banyak tiga trigram); paling banyak MAX_FUZZY_CANDIDATES kandidat
+        dengan trigram bersama terbanyak diverifikasi dengan prefix_edit_distance.
+
+        Returns:
+            List (kata, jarak) terurut dari jarak terkecil
+        """
+        limit = max_edits(term) if limit is None else limit
+        if limit <= 0:
+            return []
+
+        grams = _trigrams(term)
+        required = max(len(grams) - 3 * limit, 1)
+        index = self.trigram_index()
+        counts = Counter()
+        for gram in grams:
+            counts.update(index.get(gram, ()))
+
+        vocabulary = self.vocabulary
+        shortest = len(term) - limit
+        shortlist = [
+            (count, position) for position, count in counts.items()
+            if count >= required and len(vocabulary[position]) >= shortest
+        ]
+        if len(shortlist) > MAX_FUZZY_CANDIDATES:
+            shortlist = heapq.nlargest(MAX_FUZZY_CANDIDATES, shortlist)
+
+        matches = []
+        for count, position in shortlist:
+            candidate = vocabulary[position]
+            distance = prefix_edit_distance(term, candidate, limit)
+            if distance <= limit:
+                matches.append((candidate, distance))
+
+        matches.sort(key=lambda match: match[1])
+        return matches
+
+    def term_scorer(self, term):
+        """
+        Kecocokan satu kata query sebagai TermMatch
+
+        Kata yang menjadi awalan kata di index dinilai dari trie; jika tidak
+        ada, dicoba secara fuzzy. NO_MATCH jika keduanya tidak menemukan apa pun.
+        """
+        ids = self.prefix_ids(term)
+        if not ids:
+            return self.fuzzy_scorer(term)
+        exact = self.postings.get(term, {})
+
+        def score(doc_id):
+            prefix = ids.get(doc_id, 0) * PREFIX_FACTOR
+            return max(exact.get(doc_id, 0), prefix)
+
+        return TermMatch(score, ids, False)
+
+    def fuzzy_scorer(self, term):
+        """TermMatch dari kata-kata yang cocok secara fuzzy (jarak kecil lebih tinggi)"""
+        scores = {}
+        for candidate, distance in self.fuzzy_terms(term):
+            factor = FUZZY_FACTOR / (distance + 1)
+            for doc_id, weight in self.prefix_ids(candidate).items():
+                if scores.get(doc_id, 0) < weight * factor:
+                    scores[doc_id] = weight * factor
+        if not scores:
+            return NO_MATCH
+        return TermMatch(scores.get, scores, True)
+
+    def rank(self, scores):
+        """Mengurutkan {id: skor} dari skor tertinggi, lalu sesuai urutan dokumen"""
+        order = self.order
+        return sorted(scores, key=lambda doc_id: (-scores[doc_id], order[doc_id]))
+
+    def search(self, query):
+        """Mencari tanpa state; mengembalikan list id terurut"""
+        return SearchSession(self).search(query)
+
+
+class _SearchState:
+    """Hasil satu query: base = skor kata selain kata terakhir, scores = skor total"""
+
+    __slots__ = ('query', 'terms', 'base', 'scores', 'results')
+
+    def __init__(self, query, terms, base, scores, results):
+        self.query = query
+        self.terms = terms
+        self.base = base
+        self.scores = scores
+        self.results = results
+
+
+class SearchSession:
+    """
+    Pencarian bertahap untuk kotak pencarian
+
+    Menyimpan tumpukan hasil query yang saling memperpanjang. Query yang
+    memperpanjang query sebelumnya hanya menyaring kandidat lama; menghapus
+    karakter (backspace) mengambil hasil yang sudah ada di tumpukan.
+
+    Args:
+        index: SearchIndex (default index katalog dari get_search_index())
+    """
+
+    def __init__(self, index=None):
+        self.index = get_search_index() if index is None else index
+        self.refined = 0
+        self.rebuilt = 0
+        self._stack = []
+        self._scorers = {}
+
+    def reset(self):
+        """Melupakan query sebelumnya"""
+        self._stack = []
+
+    def _scorer(self, term):
+        scorer = self._scorers.get(term)
+        if scorer is None:
+            if len(self._scorers) >= MAX_CACHED_TERMS:
+                self._scorers.clear()
+            scorer = self._scorers[term] = self.index.term_scorer(term)
+        return scorer
+
+    def search(self, query):
+        """
+        Mencari rumus untuk query
+
+        Returns:
+            List formula_id terurut dari yang paling relevan; query kosong
+            mengembalikan list kosong
+        """
+        stack = self._stack
+        while stack and not query.startswith(stack[-1].query):
+            stack.pop()
+        if stack and stack[-1].query == query:
+            return stack[-1].results
+
+        terms = tokenize(query)
+        if not terms:
+            state = _SearchState(query, terms, {}, {}, [])
+        elif stack and stack[-1].terms:
+            state = self._refine(stack[-1], query, terms)
+        else:
+            state = self._full(query, terms)
+
+        if state is None:
+            state = self._full(query, terms)
+        stack.append(state)
+        return state.results
+
+    def _score(self, query, terms, candidates, base, start):
+        """Menilai kandidat untuk terms[start:], kandidat yang tidak cocok dibuang"""
+        scorers = []
+        for term in terms[start:]:
+            match = self._scorer(term)
+            if match.ids is None:
+                return _SearchState(query, terms, {}, {}, [])
+            scorers.append((match.score, match.ids))
+
+        last = len(scorers) - 1
+        new_base = {}
+        scores = {}
+        for doc_id in candidates:
+            total = base.get(doc_id, 0)
+            for position, (score, ids) in enumerate(scorers):
+                if doc_id not in ids:
+                    break
+                if position == last:
+                    new_base[doc_id] = total
+                total += score(doc_id)
+            else:
+                scores[doc_id] = total
+
+        return _SearchState(query, terms, new_base, scores, self.index.rank(scores))
+
+    def _full(self, query, terms):
+        """Mencari dari index, mulai dari kata dengan kandidat paling sedikit"""
+        self.rebuilt += 1
+        smallest = None
+        for term in terms:
+            ids = self._scorer(term).ids
+            if ids is None:
+                return _SearchState(query, terms, {}, {}, [])
+            if smallest is None or len(ids) < len(smallest):
+                smallest = ids
+        return self._score(query, terms, smallest, {}, 0)
+
+    def _refine(self, previous, query, terms):
+        """Menyaring hasil query sebelumnya yang merupakan awalan query ini"""
+        keep = len(previous.terms) - 1
+        if terms[:keep] != previous.terms[:keep]:
+            return None
+        # Hasil fuzzy tidak selalu lebih sempit (toleransi naik untuk kata lebih panjang)
+        if any(self._scorer(term).fuzzy for term in terms[keep:]):
+            return None
+        self.refined += 1
+        # Kata terakhir query sebelumnya bisa saja masih diperpanjang, jadi dinilai ulang
+        return self._score(query, terms, previous.scores, previous.base, keep)
+
+
+_index = None
+
+
+def get_search_index():
+    """Index pencarian katalog (semua bahasa), dibangun sekali"""
+    global _index
+    if _index is None:
+        _index = SearchIndex(formula_documents())
+    return _index
+
+
+def search_formulas(query):
+    """Mencari rumus katalog tanpa state, mengembalikan list formula_id terurut"""
+    return get_search_index().search(query)
@@ -0,0 +1,343 @@
+"""
+Sistem satuan dengan analisis dimensi
+
+Setiap satuan diparse menjadi faktor skala terhadap SI dan vektor pangkat
+dimensi dasar (m, kg, s, A, K, mol, cd). Dua satuan hanya bisa dikonversi
+jika vektor dimensinya sama; selain itu UnitError.
+
+Contoh:
+    parse_unit('m/s²')           # Unit(1.0, (1, 0, -2, 0, 0, 0, 0))
+    convert_units(72, 'km/h', 'm/s')   # 20.0
+    convert_units(values, 'g/cm³', 'kg/m³')  # array NumPy dikonversi sekaligus
+
+Hasil parse dan faktor konversi di-cache, jadi konversi berulang hanya
+berupa satu perkalian.
+"""
+
+import math
+import re
+
+BASE_DIMENSIONS = ('m', 'kg', 's', 'A', 'K', 'mol', 'cd')
+DIMENSIONLESS = (0, 0, 0, 0, 0, 0, 0)
+
+
+class UnitError(ValueError):
+    """Satuan tidak dikenal atau tidak bisa dikonversi"""
+
+
+class Unit:
+    """Satuan: faktor skala terhadap SI dan pangkat dimensi dasar"""
+
+    __slots__ = ('scale', 'dims')
+
+    def __init__(self, scale, dims):
+        self.scale = scale
+        self.dims = tuple(dims)
+
+    def __mul__(self, other):
+        return Unit(self.scale * other.scale, [a + b for a, b in zip(self.dims, other.dims)])
+
+    def __pow__(self, power):
+        return Unit(self.scale ** power, [a * power for a in self.dims])
+
+    def __eq__(self, other):
+        return isinstance(other, Unit) and self.scale == other.scale and self.dims == other.dims
+
+    def __hash__(self):
+        return hash((self.scale, self.dims))
+
+    def __repr__(self):
+        return f"Unit({self.scale!r}, {self.dims!r})"
+
+    @property
+    def dimension(self):
+        """Dimensi dalam bentuk teks, misalnya 'm·s⁻²'"""
+        return format_dimension(self.dims)
+
+
+def _dims(m=0, kg=0, s=0, A=0, K=0, mol=0, cd=0):
+    return (m, kg, s, A, K, mol, cd)
+
+
+# Satuan bernama (tanpa prefiks): simbol -> (skala SI, dimensi)
+NAMED_UNITS = {
+    # Dasar
+    'm': (1.0, _dims(m=1)),
+    'g': (1e-3, _dims(kg=1)),
+    's': (1.0, _dims(s=1)),
+    'A': (1.0, _dims(A=1)),
+    'K': (1.0, _dims(K=1)),
+    'mol': (1.0, _dims(mol=1)),
+    'cd': (1.0, _dims(cd=1)),
+    # Turunan
+    'N': (1.0, _dims(m=1, kg=1, s=-2)),
+    'Pa': (1.0, _dims(m=-1, kg=1, s=-2)),
+    'J': (1.0, _dims(m=2, kg=1, s=-2)),
+    'W': (1.0, _dims(m=2, kg=1, s=-3)),
+    'Hz': (1.0, _dims(s=-1)),
+    # Non-SI yang umum di soal SMP
+    'min': (60.0, _dims(s=1)),
+    'h': (3600.0, _dims(s=1)),
+    'jam': (3600.0, _dims(s=1)),
+    'menit': (60.0, _dims(s=1)),
+    'L': (1e-3, _dims(m=3)),
+    'l': (1e-3, _dims(m=3)),
+    'ton': (1000.0, _dims(kg=1)),
+    't': (1000.0, _dims(kg=1)),
+    'cal': (4.184, _dims(m=2, kg=1, s=-2)),
+    'kal': (4.184, _dims(m=2, kg=1, s=-2)),
+    'atm': (101325.0, _dims(m=-1, kg=1, s=-2)),
+    'bar': (1e5, _dims(m=-1, kg=1, s=-2)),
+    'mmHg': (133.322387415, _dims(m=-1, kg=1, s=-2)),
+    'cmHg': (1333.22387415, _dims(m=-1, kg=1, s=-2)),
+    'hp': (745.699872, _dims(m=2, kg=1, s=-3)),
+    # Tanpa dimensi
+    'rad': (1.0, DIMENSIONLESS),
+    '°': (math.pi / 180, DIMENSIONLESS),
+    'deg': (math.pi / 180, DIMENSIONLESS),
+    '-': (1.0, DIMENSIONLESS),
+    '1': (1.0, DIMENSIONLESS),
+    '%': (0.01, DIMENSIONLESS),
+}
+
+PREFIXES = {
+    'G': 1e9, 'M': 1e6, 'k': 1e3, 'h': 1e2, 'da': 1e1,
+    'd': 1e-1, 'c': 1e-2, 'm': 1e-3, 'µ': 1e-6, 'μ': 1e-6, 'u': 1e-6, 'n': 1e-9,
+}
+
+# Hanya satuan SI yang boleh diberi prefiks (hindari 'min' = milli-inch dst.)
+PREFIXABLE = ('m', 'g', 's', 'A', 'K', 'mol', 'N', 'Pa', 'J', 'W', 'Hz', 'L', 'l', 'cal', 'kal')
+
+# Pilihan satuan yang ditawarkan di UI, dikelompokkan otomatis per dimensi
+COMMON_UNITS = (
+    'm', 'cm', 'mm', 'km',
+    'kg', 'g', 'mg', 'ton',
+    's', 'ms', 'min', 'h',
+    'm/s', 'km/h', 'cm/s',
+    'm/s²', 'cm/s²',
+    'N', 'kN',
+    'Pa', 'kPa', 'atm', 'bar', 'cmHg',
+    'J', 'kJ', 'cal', 'kcal',
+    'W', 'kW', 'hp',
+    'kg/m³', 'g/cm³', 'g/mL',
+    'm²', 'cm²', 'mm²',
+    'm³', 'cm³', 'L', 'mL',
+    'N/m', 'N/cm',
+    '°', 'rad',
+)
+
+# Satuan sudut; satuan tak berdimensi lain ('-', '%') tidak ditawarkan sebagai sudut
+ANGLE_UNITS = ('°', 'rad', 'deg')
+
+_SUPERSCRIPTS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻', '0123456789-')
+_TO_SUPERSCRIPT = str.maketrans('0123456789-', '⁰¹²³⁴⁵⁶⁷⁸⁹⁻')
+
+_TOKEN_RE = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<sup>⁻?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)
+  | (?P<pow>\^\s*-?\d+)
+  | (?P<op>[·*./()])
+  | (?P<name>[A-Za-zµμ°%]+|-|1)
+''', re.VERBOSE)
+
+_unit_cache = {}
+_factor_cache = {}
+_choices_cache = {}
+
+
+def short_unit(unit):
+    """Mengambil simbol satuan dari teks katalog, misalnya 'N (Newton)' -> 'N'"""
+    return unit.split(' (')[0].strip()
+
+
+def format_dimension(dims):
+    """Menampilkan vektor dimensi, misalnya (1, 0, -2, ...) -> 'm·s⁻²'"""
+    parts = []
+    for name, power in zip(BASE_DIMENSIONS, dims):
+        if power == 1:
+            parts.append(name)
+        elif power:
+            parts.append(name + str(power).translate(_TO_SUPERSCRIPT))
+    return '·'.join(parts) or '1'
+
+
+def _lookup(name):
+    """Mencari satuan bernama, dengan atau tanpa prefiks"""
+    if name in NAMED_UNITS:
+        scale, dims = NAMED_UNITS[name]
+        return Unit(scale, dims)
+
+    for prefix, factor in PREFIXES.items():
+        base = name[len(prefix):]
+        if name.startswith(prefix) and base in PREFIXABLE:
+            scale, dims = NAMED_UNITS[base]
+            return Unit(scale * factor, dims)
+
+    raise UnitError(f"Unknown unit: {name}")
+
+
+def _tokenize(text):
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            raise UnitError(f"Invalid character {text[pos]!r} in unit {text!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == 'sup':
+            tokens.append(('pow', int(match.group().translate(_SUPERSCRIPTS))))
+        elif kind == 'pow':
+            tokens.append(('pow', int(match.group()[1:].strip())))
+        elif kind != 'space':
+            tokens.append((kind, match.group()))
+    return tokens
+
+
+def _parse_product(tokens, pos, text):
+    """product := factor (('·' | '*' | '.' | '/' | implisit) factor)*"""
+    unit = Unit(1.0, DIMENSIONLESS)
+    invert = False
+
+    while pos < len(tokens):
+        kind, value = tokens[pos]
+
+        if kind == 'op' and value == ')':
+            break
+        if kind == 'op' and value in '·*.':
+            pos += 1
+            continue
+        if kind == 'op' and value == '/':
+            # a/b·c dibaca a/(b·c), seperti penulisan satuan pada umumnya
+            invert = True
+            pos += 1
+            continue
+
+        if kind == 'op' and value == '(':
+            factor, pos = _parse_product(tokens, pos + 1, text)
+            if pos >= len(tokens) or tokens[pos] != ('op', ')'):
+                raise UnitError(f"Unbalanced parentheses in unit {text!r}")
+            pos += 1
+        elif kind == 'name':
+            factor = _lookup(value)
+            pos += 1
+        else:
+            raise UnitError(f"Unexpected {value!r} in unit {text!r}")
+
+        if pos < len(tokens) and tokens[pos][0] == 'pow':
+            factor = factor ** tokens[pos][1]
+            pos += 1
+
+        unit = unit * (factor ** -1 if invert else factor)
+
+    return unit, pos
+
+
+def parse_unit(text):
+    """
+    Parse teks satuan menjadi Unit (hasil di-cache)
+
+    Menerima format katalog seperti 'm/s²', 'kg/m³', 'N (Newton)' atau '-'.
+
+    Raises:
+        UnitError: Jika satuan tidak dikenal
+    """
+    unit = _unit_cache.get(text)
+    if unit is None:
+        cleaned = short_unit(text)
+        if cleaned in ('', '-'):
+            unit = Unit(1.0, DIMENSIONLESS)
+        else:
+            tokens = _tokenize(cleaned)
+            unit, pos = _parse_product(tokens, 0, text)
+            if pos != len(tokens):
+                raise UnitError(f"Unbalanced parentheses in unit {text!r}")
+        _unit_cache[text] = unit
+    return unit
+
+
+def is_compatible(from_unit, to_unit):
+    """Mengecek apakah dua satuan punya dimensi yang sama"""
+    try:
+        return parse_unit(from_unit).dims == parse_unit(to_unit).dims
+    except UnitError:
+        return False
+
+
+# Nama lama tetap tersedia
+can_convert = is_compatible
+
+
+def conversion_factor(from_unit, to_unit):
+    """
+    Faktor pengali dari satuan asal ke satuan tujuan (hasil di-cache)
+
+    Raises:
+        UnitError: Jika dimensi kedua satuan berbeda
+    """
+    key = (from_unit, to_unit)
+    factor = _factor_cache.get(key)
+    if factor is None:
+        source = parse_unit(from_unit)
+        target = parse_unit(to_unit)
+        if source.dims != target.dims:
+            raise UnitError(
+                f"Cannot convert {short_unit(from_unit)} ({source.dimension}) "
+                f"to {short_unit(to_unit)} ({target.dimension})"
+            )
+        factor = source.scale / target.scale
+        _factor_cache[key] = factor
+    return factor
+
+
+def conversion_table(units):
+    """Menghitung semua faktor antar satuan sekaligus {(asal, tujuan): faktor}"""
+    return {
+        (source, target): conversion_factor(source, target)
+        for source in units
+        for target in units
+        if is_compatible(source, target)
+    }
+
+
+def convert_units(value, from_unit, to_unit):
+    """
+    Konversi nilai (angka atau array NumPy) antar satuan
+
+    Args:
+        value: Nilai dalam satuan asal; array dikonversi sekaligus
+        from_unit: Satuan asal
+        to_unit: Satuan tujuan
+
+    Raises:
+        UnitError: Jika satuan tidak dikenal atau dimensinya berbeda
+    """
+    if from_unit == to_unit:
+        return value
+    factor = conversion_factor(from_unit, to_unit)
+    if isinstance(value, (list, tuple)):
+        return type(value)(item * factor for item in value)
+    return value * factor
+
+
+def to_si(value, unit):
+    """Konversi nilai ke satuan SI dasar"""
+    return value * parse_unit(unit).scale
+
+
+def unit_choices(unit):
+    """Daftar satuan umum yang sedimensi dengan unit (satuan itu sendiri di depan)"""
+    choices = _choices_cache.get(unit)
+    if choices is None:
+        base = short_unit(unit)
+        try:
+            dims = parse_unit(base).dims
+        except UnitError:
+            choices = (base,)
+        else:
+            compatible = [u for u in COMMON_UNITS if u != base and parse_unit(u).dims == dims]
+            if dims == DIMENSIONLESS and base not in ANGLE_UNITS:
+                compatible = []
+            choices = tuple([base] + compatible)
+        _choices_cache[unit] = choices
+    return choices
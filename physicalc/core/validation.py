@@ -0,0 +1,212 @@
+"""
+Parsing dan validasi input angka untuk perhitungan fisika
+
+parse_number_result() mem-parse teks satu kali dan mengembalikan nilai
+beserta kode error (PARSE_OK jika valid), sehingga pemanggil tidak perlu
+memanggil float() lagi. Format yang diterima selain float() biasa:
+    '9,8'          koma desimal (Indonesia)
+    '1.234,5'      titik sebagai pemisah ribuan, koma desimal
+    '1,234.5'      koma sebagai pemisah ribuan, titik desimal
+    '1 234'        spasi sebagai pemisah ribuan
+    '−5'           tanda minus unicode
+    '1,5×10⁻³'     eksponen dengan pangkat superscript (juga '1.5x10^-3', '1.5e-3')
+
+Satu koma atau satu titik saja selalu dianggap pemisah desimal
+('1,234' = 1.234); pemisah yang muncul lebih dari sekali dianggap pemisah
+ribuan dan harus mengelompokkan tiga digit.
+"""
+
+import math
+import re
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, parse_numbers mengembalikan list tanpa NumPy
+    np = None
+
+PARSE_OK = 0
+PARSE_EMPTY = 1
+PARSE_INVALID = 2
+PARSE_NOT_FINITE = 3
+PARSE_NEGATIVE = 4
+PARSE_ZERO = 5
+
+PARSE_ERROR_MESSAGES = {
+    PARSE_OK: "",
+    PARSE_EMPTY: "Please enter a value",
+    PARSE_INVALID: "Invalid number format",
+    PARSE_NOT_FINITE: "Value is too large",
+    PARSE_NEGATIVE: "Value cannot be negative",
+    PARSE_ZERO: "Value cannot be zero",
+}
+
+
+class NumberInputError(ValueError):
+    """Teks tidak bisa dipakai sebagai angka; code adalah salah satu PARSE_*"""
+
+    def __init__(self, code):
+        self.code = code
+        super().__init__(PARSE_ERROR_MESSAGES[code])
+
+
+# Spasi (termasuk non-breaking/thin space) dihapus, minus unicode diganti '-'
+_NORMALIZE = str.maketrans({
+    ' ': None, '\u00a0': None, '\u2009': None, '\u202f': None, "'": None,
+    '\u2212': '-', '\u2013': '-',
+})
+_SUPERSCRIPTS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺', '0123456789-+')
+
+_NUMBER_RE = re.compile(r'''
+    (?P<sign>[-+])?
+    (?P<mantissa>[0-9][0-9.,]*|[.,][0-9]+)
+    (?:
+        [eE](?P<exp>[-+]?[0-9]+)
+      | [×xX·*]10(?:\^(?P<power>[-+]?[0-9]+)|(?P<sup>[⁻⁺]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+))
+    )?
+''', re.VERBOSE)
+
+
+def _plain_mantissa(mantissa):
+    """Mengubah mantissa dengan pemisah lokal menjadi 'digit.digit', atau None jika tidak valid"""
+    dots = mantissa.count('.')
+    commas = mantissa.count(',')
+
+    if dots and commas:
+        decimal = '.' if mantissa.rfind('.') > mantissa.rfind(',') else ','
+    elif dots == 1 or commas == 1:
+        decimal = '.' if dots else ','
+    else:
+        decimal = None  # tanpa pemisah, atau pemisah ribuan saja
+
+    if decimal is not None:
+        integer, _, fraction = mantissa.partition(decimal)
+        if not fraction.isdigit() and fraction:
+            return None
+    else:
+        integer, fraction = mantissa, ''
+
+    if decimal is None:
+        separator = ',' if commas else '.'
+    else:
+        separator = ',' if decimal == '.' else '.'
+    if separator in integer:
+        groups = integer.split(separator)
+        if not groups[0] or len(groups[0]) > 3 or any(len(group) != 3 for group in groups[1:]):
+            return None
+        integer = ''.join(groups)
+    if not integer.isdigit() and integer:
+        return None
+
+    return f"{integer or '0'}.{fraction or '0'}"
+
+
+def parse_number_result(text, allow_negative=True, allow_zero=True):
+    """
+    Mem-parse dan memvalidasi satu input dalam satu langkah
+
+    Args:
+        text: Teks input (angka int/float juga diterima apa adanya)
+        allow_negative: Izinkan nilai negatif
+        allow_zero: Izinkan nol
+
+    Returns:
+        (nilai, kode): nilai float dan PARSE_OK, atau (None, PARSE_*) jika tidak valid
+    """
+    if isinstance(text, (int, float)) and not isinstance(text, bool):
+        try:
+            value = float(text)
+        except OverflowError:
+            return None, PARSE_NOT_FINITE
+    else:
+        if text is None:
+            return None, PARSE_EMPTY
+        text = str(text).strip().translate(_NORMALIZE)
+        if not text:
+            return None, PARSE_EMPTY
+
+        match = _NUMBER_RE.fullmatch(text)
+        if match is None:
+            return None, PARSE_INVALID
+        mantissa = _plain_mantissa(match.group('mantissa'))
+        if mantissa is None:
+            return None, PARSE_INVALID
+
+        exponent = match.group('exp') or match.group('power')
+        if exponent is None and match.group('sup'):
+            exponent = match.group('sup').translate(_SUPERSCRIPTS)
+        value = float(f"{match.group('sign') or ''}{mantissa}e{exponent or 0}")
+
+    if not math.isfinite(value):
+        return None, PARSE_INVALID if math.isnan(value) else PARSE_NOT_FINITE
+    if not allow_negative and value < 0:
+        return None, PARSE_NEGATIVE
+    if not allow_zero and value == 0:
+        return None, PARSE_ZERO
+    return value, PARSE_OK
+
+
+def parse_number(text, allow_negative=True, allow_zero=True):
+    """
+    Mem-parse input menjadi float
+
+    Raises:
+        NumberInputError: Jika teks kosong atau tidak valid (turunan ValueError)
+    """
+    value, code = parse_number_result(text, allow_negative, allow_zero)
+    if code != PARSE_OK:
+        raise NumberInputError(code)
+    return value
+
+
+def parse_numbers(texts, allow_negative=True, allow_zero=True):
+    """
+    Versi batch dari parse_number_result untuk list/array teks (misalnya kolom CSV)
+
+    Teks yang sama hanya di-parse sekali. Mengembalikan (values, valid, errors)
+    seperti fungsi *_batch: values float64 (NaN jika tidak valid), mask valid,
+    dan kode PARSE_* per elemen. Tanpa NumPy ketiganya berupa list.
+    """
+    parsed = {}
+    values = []
+    errors = []
+    for text in texts:
+        key = text if isinstance(text, str) else (type(text), text)
+        result = parsed.get(key)
+        if result is None:
+            result = parsed[key] = parse_number_result(text, allow_negative, allow_zero)
+        values.append(math.nan if result[0] is None else result[0])
+        errors.append(result[1])
+
+    if np is None:
+        return values, [code == PARSE_OK for code in errors], errors
+
+    errors = np.array(errors, dtype=np.uint8)
+    return np.array(values, dtype=np.float64), errors == PARSE_OK, errors
+
+
+def validate_number_input(text, allow_negative=False, allow_zero=True, allow_empty=False):
+    """Validasi input angka dengan berbagai kondisi, mengembalikan (valid, pesan)"""
+    value, code = parse_number_result(text, allow_negative, allow_zero)
+    if code == PARSE_EMPTY and allow_empty:
+        return True, ""
+    return code == PARSE_OK, PARSE_ERROR_MESSAGES[code]
+
+def validate_physics_inputs(inputs_dict):
+    """
+    Validasi multiple inputs untuk perhitungan fisika
+
+    Args:
+        inputs_dict: Dictionary berisi nama input dan nilainya
+    """
+    errors = []
+    validated = {}
+
+    for name, value in inputs_dict.items():
+        number, code = parse_number_result(value)
+
+        if code != PARSE_OK:
+            errors.append(f"{name}: {PARSE_ERROR_MESSAGES[code]}")
+        else:
+            validated[name] = number
+
+    return validated, errors
@@ -0,0 +1,318 @@
+"""
+Lembar kerja: rumus-rumus katalog yang hasilnya saling terhubung
+
+Setiap sel adalah satu rumus katalog dengan satu target. Input sel berupa
+angka tetap atau tautan ke hasil sel lain (misalnya F pada sel tekanan
+diambil dari hasil sel gaya). Tautan membentuk DAG; tautan yang akan
+membuat siklus ditolak dengan CycleError.
+
+Mengubah input hanya menandai sel itu kotor. recompute() menghitung sel
+kotor sesuai urutan topologis dan meneruskan ke sel turunan hanya jika
+hasilnya berubah. Setiap sel menyimpan nilai input terakhir beserta
+hasilnya, sehingga sel dengan input yang sama tidak dihitung ulang.
+
+Contoh:
+    sheet = Worksheet()
+    force = sheet.add_cell('force', values={'m': 2, 'a': 3})
+    pressure = sheet.add_cell('pressure', values={'A': 0.5})
+    sheet.link(pressure.id, 'F', force.id)
+    sheet.value(pressure.id)          # 12.0
+    sheet.set_input(force.id, 'a', 4)
+    sheet.recompute()                 # ['c1', 'c2']
+"""
+
+import heapq
+
+from .engine import FormulaError, MissingInputError, get_compiled_formula
+
+
+class WorksheetError(FormulaError):
+    """Operasi lembar kerja tidak valid (sel atau input tidak dikenal)"""
+
+
+class CycleError(WorksheetError):
+    """Tautan akan membuat siklus antar sel"""
+
+
+def _same_error(first, second):
+    """Dua error dianggap sama jika jenis dan pesannya sama"""
+    if first is None or second is None:
+        return first is second
+    return type(first) is type(second) and first.args == second.args
+
+
+class Cell:
+    """
+    Satu rumus di lembar kerja
+
+    Attributes:
+        inputs: {simbol: angka} untuk input yang diisi langsung
+        links: {simbol: id sel sumber} untuk input yang ditautkan
+        value: Hasil terakhir (None jika belum bisa dihitung)
+        error: Exception perhitungan terakhir (misalnya ZeroInputError), atau None
+    """
+
+    __slots__ = ('id', 'formula_id', 'target', 'symbols', 'inputs', 'links',
+                 'value', 'error', '_signature')
+
+    def __init__(self, cell_id, formula_id, target=None):
+        compiled = get_compiled_formula(formula_id)
+        self.id = cell_id
+        self.formula_id = formula_id
+        self.target = target or compiled.default_target
+        self.symbols = compiled.inputs_for(self.target)
+        self.inputs = {}
+        self.links = {}
+        self.value = None
+        self.error = None
+        self._signature = None
+
+    def __repr__(self):
+        return f"Cell({self.id!r}, {self.formula_id!r}, {self.target}={self.value!r})"
+
+
+class Worksheet:
+    """Kumpulan sel dengan tautan hasil -> input dan perhitungan ulang bertahap"""
+
+    def __init__(self):
+        self.cells = {}
+        self.dependents = {}     # id sel sumber -> set id sel yang memakai hasilnya
+        self.evaluations = 0
+        self.cache_hits = 0
+        self._dirty = set()
+        self._positions = None   # urutan topologis {id sel: posisi}, None jika perlu disusun ulang
+        self._next_id = 1
+
+    def __contains__(self, cell_id):
+        return cell_id in self.cells
+
+    def __len__(self):
+        return len(self.cells)
+
+    def cell(self, cell_id):
+        """Mengambil sel, WorksheetError jika tidak ada"""
+        cell = self.cells.get(cell_id)
+        if cell is None:
+            raise WorksheetError(f"Unknown cell: {cell_id}")
+        return cell
+
+    def _input_cell(self, cell_id, symbol):
+        cell = self.cell(cell_id)
+        if symbol not in cell.symbols:
+            raise WorksheetError(f"{symbol} is not an input of {cell.formula_id}")
+        return cell
+
+    # ===== Struktur =====
+
+    def add_cell(self, formula_id, target=None, cell_id=None, values=None):
+        """
+        Menambah sel untuk rumus katalog
+
+        Args:
+            formula_id: ID rumus katalog
+            target: Variabel yang dihitung (default ruas kiri rumus)
+            cell_id: ID sel (default 'c1', 'c2', ...)
+            values: {simbol: angka} input awal
+        """
+        if cell_id is None:
+            while f"c{self._next_id}" in self.cells:
+                self._next_id += 1
+            cell_id = f"c{self._next_id}"
+        elif cell_id in self.cells:
+            raise WorksheetError(f"Cell {cell_id} already exists")
+
+        cell = Cell(cell_id, formula_id, target)
+        self.cells[cell_id] = cell
+        self.dependents[cell_id] = set()
+        self._positions = None
+        self._dirty.add(cell_id)
+
+        for symbol, value in (values or {}).items():
+            self.set_input(cell_id, symbol, value)
+        return cell
+
+    def remove_cell(self, cell_id):
+        """Menghapus sel; input sel lain yang ditautkan ke sel ini menjadi kosong"""
+        cell = self.cell(cell_id)
+        for dependent_id in list(self.dependents[cell_id]):
+            dependent = self.cells[dependent_id]
+            for symbol, source_id in list(dependent.links.items()):
+                if source_id == cell_id:
+                    del dependent.links[symbol]
+            self._dirty.add(dependent_id)
+        for source_id in cell.links.values():
+            self.dependents[source_id].discard(cell_id)
+
+        del self.cells[cell_id]
+        del self.dependents[cell_id]
+        self._dirty.discard(cell_id)
+        self._positions = None
+
+    def set_input(self, cell_id, symbol, value):
+        """Mengisi input dengan angka (None mengosongkan); tautan pada input itu dilepas"""
+        cell = self._input_cell(cell_id, symbol)
+        if symbol in cell.links:
+            self.unlink(cell_id, symbol)
+        if value is None:
+            cell.inputs.pop(symbol, None)
+        else:
+            cell.inputs[symbol] = float(value)
+        self._dirty.add(cell_id)
+
+    def link(self, cell_id, symbol, source_id):
+        """
+        Memakai hasil sel source_id sebagai input symbol pada sel cell_id
+
+        Raises:
+            CycleError: Jika cell_id sudah (langsung atau tidak) menjadi sumber source_id
+        """
+        cell = self._input_cell(cell_id, symbol)
+        self.cell(source_id)
+        if source_id == cell_id or cell_id in self.upstream(source_id):
+            raise CycleError(f"Linking {source_id} into {cell_id} would create a cycle")
+
+        previous = cell.links.get(symbol)
+        if previous == source_id:
+            return
+        if previous is not None:
+            self.unlink(cell_id, symbol)
+
+        cell.links[symbol] = source_id
+        cell.inputs.pop(symbol, None)
+        self.dependents[source_id].add(cell_id)
+        self._positions = None
+        self._dirty.add(cell_id)
+
+    def unlink(self, cell_id, symbol):
+        """Melepas tautan input; input menjadi kosong"""
+        cell = self._input_cell(cell_id, symbol)
+        source_id = cell.links.pop(symbol, None)
+        if source_id is None:
+            return
+        if source_id not in cell.links.values():
+            self.dependents[source_id].discard(cell_id)
+        self._positions = None
+        self._dirty.add(cell_id)
+
+    def upstream(self, cell_id):
+        """Semua sel yang hasilnya (langsung atau tidak) dipakai cell_id"""
+        found = set()
+        stack = [cell_id]
+        while stack:
+            for source_id in self.cells[stack.pop()].links.values():
+                if source_id not in found:
+                    found.add(source_id)
+                    stack.append(source_id)
+        return found
+
+    def downstream(self, cell_id):
+        """Semua sel yang (langsung atau tidak) memakai hasil cell_id"""
+        found = set()
+        stack = [cell_id]
+        while stack:
+            for dependent_id in self.dependents[stack.pop()]:
+                if dependent_id not in found:
+                    found.add(dependent_id)
+                    stack.append(dependent_id)
+        return found
+
+    def order(self):
+        """Id sel dalam urutan topologis (sumber sebelum pemakainya)"""
+        positions = self._topological_positions()
+        return sorted(positions, key=positions.get)
+
+    def _topological_positions(self):
+        """Urutan topologis (Kahn), disusun ulang hanya setelah tautan berubah"""
+        if self._positions is None:
+            pending = {cell_id: len(set(cell.links.values())) for cell_id, cell in self.cells.items()}
+            ready = [cell_id for cell_id, count in pending.items() if count == 0]
+            positions = {}
+            while ready:
+                cell_id = ready.pop()
+                positions[cell_id] = len(positions)
+                for dependent_id in self.dependents[cell_id]:
+                    pending[dependent_id] -= 1
+                    if pending[dependent_id] == 0:
+                        ready.append(dependent_id)
+            if len(positions) != len(self.cells):
+                raise CycleError("Worksheet links contain a cycle")
+            self._positions = positions
+        return self._positions
+
+    # ===== Perhitungan =====
+
+    def recompute(self):
+        """
+        Menghitung ulang sel kotor dan turunannya yang terpengaruh
+
+        Sel diproses sesuai urutan topologis; sel turunan hanya ikut dihitung
+        jika hasil (atau error) sel sumbernya berubah.
+
+        Returns:
+            List id sel yang dievaluasi, sesuai urutan perhitungan
+        """
+        if not self._dirty:
+            return []
+
+        positions = self._topological_positions()
+        queue = [(positions[cell_id], cell_id) for cell_id in self._dirty]
+        heapq.heapify(queue)
+        queued = set(self._dirty)
+        self._dirty.clear()
+
+        evaluated = []
+        while queue:
+            _, cell_id = heapq.heappop(queue)
+            queued.discard(cell_id)
+            cell = self.cells[cell_id]
+            if not self._evaluate(cell):
+                continue
+            evaluated.append(cell_id)
+            for dependent_id in self.dependents[cell_id]:
+                if dependent_id not in queued:
+                    queued.add(dependent_id)
+                    heapq.heappush(queue, (positions[dependent_id], dependent_id))
+        return evaluated
+
+    def input_values(self, cell_id):
+        """{simbol: angka} input sel saat ini; input kosong atau sumber yang belum punya hasil bernilai None"""
+        cell = self.cell(cell_id)
+        values = {}
+        for symbol in cell.symbols:
+            source_id = cell.links.get(symbol)
+            if source_id is not None:
+                values[symbol] = self.cells[source_id].value
+            else:
+                values[symbol] = cell.inputs.get(symbol)
+        return values
+
+    def _evaluate(self, cell):
+        """Menghitung satu sel; True jika hasil atau error-nya berubah"""
+        values = self.input_values(cell.id)
+        missing = [symbol for symbol, value in values.items() if value is None]
+        error = MissingInputError(missing) if missing else None
+
+        signature = None if error else tuple(values[symbol] for symbol in cell.symbols)
+        if signature is not None and signature == cell._signature:
+            self.cache_hits += 1
+            return False
+
+        value = None
+        if error is None:
+            self.evaluations += 1
+            try:
+                value = get_compiled_formula(cell.formula_id).evaluate(values, cell.target)
+            except (FormulaError, ArithmeticError, ValueError) as e:
+                error = e
+                signature = None
+
+        changed = value != cell.value or not _same_error(error, cell.error)
+        cell.value = value
+        cell.error = error
+        cell._signature = signature
+        return changed
+
+    def value(self, cell_id):
+        """Hasil sel setelah sel kotor dihitung ulang (None jika belum bisa dihitung)"""
+        self.recompute()
+        return self.cell(cell_id).value
@@ -0,0 +1,158 @@
+"""
+Load generator untuk physicalc.server
+
+Membuka beberapa koneksi keep-alive sekaligus, mengirim POST /calculate
+dengan input acak, lalu melaporkan latensi p50/p99 dan throughput.
+
+Contoh:
+    python -m physicalc.server &
+    python -m physicalc.loadgen --concurrency 32 --requests 20000 --batch 1
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from .core.catalog import get_formulas
+from .core.engine import get_compiled_formula
+from .server import DEFAULT_HOST, DEFAULT_PORT
+
+
+def make_record(rng, formula_ids, distinct):
+    """Membuat satu record acak; distinct membatasi variasi input (untuk uji cache)"""
+    formula_id = rng.choice(formula_ids)
+    compiled = get_compiled_formula(formula_id)
+    inputs = {}
+    for symbol in compiled.inputs_for():
+        if distinct:
+            inputs[symbol] = float(rng.randrange(1, distinct + 1))
+        else:
+            inputs[symbol] = round(rng.uniform(0.5, 100.0), 3)
+    return {'formula': formula_id, 'inputs': inputs}
+
+
+def percentile(sorted_values, fraction):
+    """Persentil dari list yang sudah diurutkan (nearest rank)"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def read_response(reader):
+    """Membaca satu response HTTP dan mengembalikan (status, body)"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Server closed the connection")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    body = await reader.readexactly(length) if length else b''
+    return status, body
+
+
+async def worker(host, port, counter, total, batch, rng, formula_ids, distinct, latencies, failures):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < total:
+            counter[0] += 1
+            if batch > 1:
+                payload = {'requests': [make_record(rng, formula_ids, distinct) for _ in range(batch)]}
+            else:
+                payload = make_record(rng, formula_ids, distinct)
+            body = json.dumps(payload).encode('utf-8')
+            request = (
+                f"POST /calculate HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+            ).encode('latin-1') + body
+
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, _ = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures[0] += 1
+    finally:
+        writer.close()
+
+
+async def fetch_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode('latin-1'))
+        await writer.drain()
+        _, body = await read_response(reader)
+        return json.loads(body)
+    finally:
+        writer.close()
+
+
+async def run(host, port, concurrency, total, batch, distinct, seed):
+    """Menjalankan load test dan mengembalikan laporan dalam dictionary"""
+    formula_ids = list(get_formulas().keys())
+    counter = [0]
+    failures = [0]
+    latencies = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(host, port, counter, total, batch, random.Random(seed + i), formula_ids, distinct, latencies, failures)
+        for i in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'rows': len(latencies) * batch,
+        'failures': failures[0],
+        'elapsed_s': elapsed,
+        'requests_per_s': len(latencies) / elapsed if elapsed else None,
+        'rows_per_s': len(latencies) * batch / elapsed if elapsed else None,
+        'p50_ms': percentile(latencies, 0.50) * 1000 if latencies else None,
+        'p99_ms': percentile(latencies, 0.99) * 1000 if latencies else None,
+        'server_stats': await fetch_json(host, port, '/stats'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m physicalc.loadgen',
+                                     description='Measure latency and throughput of physicalc.server.')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('-c', '--concurrency', type=int, default=16, help="open connections (default: 16)")
+    parser.add_argument('-n', '--requests', type=int, default=10000, help="total requests (default: 10000)")
+    parser.add_argument('-b', '--batch', type=int, default=1, help="records per request (default: 1)")
+    parser.add_argument('--distinct', type=int, default=0,
+                        help="limit each input to N distinct values to exercise the cache (default: off)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args.host, args.port, args.concurrency, args.requests,
+                             args.batch, args.distinct, args.seed))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        stats = report['server_stats']
+        print(f"Requests:    {report['requests']} ({report['failures']} failed), {report['rows']} rows")
+        print(f"Elapsed:     {report['elapsed_s']:.2f} s")
+        print(f"Throughput:  {report['requests_per_s']:.0f} req/s, {report['rows_per_s']:.0f} rows/s")
+        print(f"Latency:     p50 {report['p50_ms']:.2f} ms, p99 {report['p99_ms']:.2f} ms")
+        print(f"Server:      {stats['batches']} batches for {stats['rows']} rows, "
+              f"cache hits {stats['cache']['hits']} / misses {stats['cache']['misses']}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,525 @@
+"""
+Layanan HTTP/JSON lokal untuk perhitungan fisika (hanya stdlib asyncio)
+
+Endpoint:
+    GET  /health              status server
+    GET  /formulas?lang=en    katalog rumus
+    GET  /formulas/<id>       satu rumus
+    POST /calculate           satu record, list record, atau {"requests": [...]}
+    GET  /stats               statistik cache dan batching
+    GET  /latency             histogram latensi request
+
+Record memakai format yang sama dengan CLI (lihat physicalc.cli), misalnya
+{"formula": "force", "inputs": {"m": 2, "a": 3}}.
+
+Request kecil yang datang bersamaan digabung: semua record yang masuk dalam
+satu putaran event loop dihitung sekaligus, dan record dengan rumus/target
+yang sama dihitung dalam satu panggilan NumPy. Hasil disimpan di
+CalculationCache sehingga input berulang tidak dihitung ulang.
+
+Contoh:
+    python -m physicalc.server --port 8765
+"""
+
+import argparse
+import asyncio
+import bisect
+import ipaddress
+import json
+import math
+import time
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from .cli import RowError, check_record, evaluate_record
+from .core.cache import CalculationCache
+from .core.catalog import DEFAULT_LANGUAGE, LANGUAGES, get_formulas
+from .core.engine import get_compiled_formula
+from .core.formatting import get_formatter
+from .core.units import short_unit
+
+try:
+    import numpy as np
+except ImportError:  # Tanpa NumPy setiap record dihitung satu per satu
+    np = None
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_BODY_SIZE = 8 * 1024 * 1024
+
+# Error dari record yang strukturnya salah (misalnya inputs berupa list),
+# dijawab 400; error lain dijawab 500
+RECORD_ERRORS = (ValueError, TypeError, AttributeError, KeyError)
+
+_MISSING = object()
+
+
+# ===== Utilitas =====
+
+def to_plain(value):
+    """Mengubah mapping read-only/tuple dari katalog menjadi dict/list untuk JSON"""
+    if hasattr(value, 'items'):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    return value
+
+
+def is_loopback(host):
+    """Mengecek apakah host adalah alamat loopback"""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class LatencyHistogram:
+    """Histogram latensi dengan bucket skala log (milidetik)"""
+
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds):
+        """Mencatat satu durasi dalam detik"""
+        ms = seconds * 1000.0
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, fraction):
+        """Perkiraan persentil (batas atas bucket yang memuat persentil, paling besar max_ms)"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self):
+        buckets = [{'le': bound, 'count': count} for bound, count in zip(self.BUCKETS_MS, self.counts)]
+        buckets.append({'le': 'inf', 'count': self.counts[-1]})
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else None,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(0.50),
+            'p90_ms': self.percentile(0.90),
+            'p99_ms': self.percentile(0.99),
+            'buckets': buckets,
+        }
+
+
+# ===== Evaluasi batch =====
+
+def _vector_group(record, formulas):
+    """
+    Mengembalikan key grup (formula, target) jika record bisa dihitung sebagai vektor
+
+    Syarat: field record bertipe benar, rumus katalog, tanpa konversi satuan,
+    dan semua input berupa angka float tepat sesuai variabel yang dibutuhkan
+    solver. Record lain dihitung lewat evaluate_record, yang melaporkan
+    error per baris.
+    """
+    if not isinstance(record, dict) or record.get('units'):
+        return None
+    try:
+        check_record(record)
+    except RowError:
+        return None
+
+    formula_id = record.get('formula')
+    if formula_id not in formulas:
+        return None
+
+    compiled = get_compiled_formula(formula_id)
+    target = record.get('target') or compiled.default_target
+    if target not in compiled.symbols:
+        return None
+
+    inputs = record.get('inputs')
+    solver = compiled.solver(target)
+    if not isinstance(inputs, dict) or len(inputs) != len(solver.inputs):
+        return None
+    for symbol in solver.inputs:
+        value = inputs.get(symbol)
+        if type(value) is int:
+            try:
+                float(value)
+            except OverflowError:
+                return None
+        elif type(value) is not float or not math.isfinite(value):
+            return None
+
+    unit = short_unit(next(v['unit'] for v in formulas[formula_id]['variables'] if v['symbol'] == target))
+    if record.get('unit') not in (None, '', unit):
+        return None
+
+    return formula_id, target, unit
+
+
+def _evaluate_vector(records, indices, formula_id, target, unit, precision, results):
+    """Menghitung satu grup record dengan solver versi NumPy"""
+    solver = get_compiled_formula(formula_id).solver(target)
+    count = len(indices)
+    columns = {
+        symbol: np.fromiter((records[i]['inputs'][symbol] for i in indices), dtype=np.float64, count=count)
+        for symbol in solver.inputs
+    }
+
+    with np.errstate(all='ignore'):
+        values = solver.vectorized(*(columns[symbol] for symbol in solver.inputs))
+        values = np.broadcast_to(np.asarray(values, dtype=np.float64), (count,))
+
+    # Elemen tidak valid dihitung ulang versi skalar agar pesan error sama persis
+    bad = ~np.isfinite(values)
+    for symbol in solver.denominators:
+        if symbol in columns:
+            bad |= columns[symbol] == 0
+
+    formatted = get_formatter(precision).format_batch(values, unit)
+
+    for position, index in enumerate(indices):
+        if bad[position]:
+            results[index] = evaluate_record(index, records[index], precision)
+            continue
+        value = float(values[position])
+        results[index] = {
+            'line': index,
+            'id': None,
+            'formula': formula_id,
+            'target': target,
+            'value': value,
+            'unit': unit,
+            'result': formatted[position].strip(),
+            'error': None,
+        }
+
+
+def evaluate_batch(records, cache=None, precision=2):
+    """
+    Menghitung list record sekaligus
+
+    Record yang ada di cache langsung dipakai, record sejenis dihitung sebagai
+    vektor NumPy, sisanya lewat evaluate_record. Urutan hasil sama dengan input.
+    """
+    formulas = get_formulas()
+    results = [None] * len(records)
+    keys = [None] * len(records)
+    hits = set()
+    groups = {}
+
+    for index, record in enumerate(records):
+        if cache is not None and isinstance(record, dict):
+            try:
+                key = cache.make_key('calculate', (record.get('formula'), record.get('target'), record.get('unit')),
+                                     {'inputs': record.get('inputs'), 'units': record.get('units')})
+                hash(key)
+            except TypeError:
+                key = None
+            if key is not None:
+                keys[index] = key
+                cached = cache.get(key, _MISSING)
+                if cached is not _MISSING:
+                    results[index] = cached
+                    hits.add(index)
+                    continue
+
+        group = _vector_group(record, formulas) if np is not None else None
+        if group is None:
+            results[index] = evaluate_record(index, record, precision)
+        else:
+            groups.setdefault(group, []).append(index)
+
+    for (formula_id, target, unit), indices in groups.items():
+        if len(indices) == 1:
+            index = indices[0]
+            results[index] = evaluate_record(index, records[index], precision)
+        else:
+            _evaluate_vector(records, indices, formula_id, target, unit, precision, results)
+
+    output = []
+    for index, (record, result) in enumerate(zip(records, results)):
+        if keys[index] is not None and index not in hits:
+            cache.set(keys[index], result)
+        result = dict(result, line=index)
+        if isinstance(record, dict):
+            result['id'] = record.get('id')
+        output.append(result)
+    return output
+
+
+class RequestBatcher:
+    """Menggabungkan record dari request yang datang pada putaran event loop yang sama"""
+
+    def __init__(self, cache, precision=2):
+        self.cache = cache
+        self.precision = precision
+        self.batches = 0
+        self.rows = 0
+        self._pending = []
+        self._scheduled = False
+
+    def submit(self, records):
+        """Mendaftarkan list record; hasilnya tersedia lewat future"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((records, future))
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        self._scheduled = False
+
+        flat = [record for records, _ in pending for record in records]
+        try:
+            results = evaluate_batch(flat, self.cache, self.precision)
+        except Exception:
+            # Ada record rusak: hitung ulang per request agar hanya future
+            # miliknya yang gagal, request lain di putaran ini tetap dijawab
+            self._flush_each(pending)
+            return
+
+        self.batches += 1
+        self.rows += len(flat)
+
+        start = 0
+        for records, future in pending:
+            part = results[start:start + len(records)]
+            start += len(records)
+            for line, result in enumerate(part):
+                result['line'] = line
+            if not future.done():
+                future.set_result(part)
+
+    def _flush_each(self, pending):
+        for records, future in pending:
+            try:
+                part = evaluate_batch(records, self.cache, self.precision)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.rows += len(records)
+            if not future.done():
+                future.set_result(part)
+
+
+# ===== Server HTTP =====
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class CalculationServer:
+    """Server HTTP/1.1 minimal dengan keep-alive"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, cache_size=65536, precision=2):
+        if not is_loopback(host):
+            raise ValueError(f"Server only binds to loopback addresses, got {host!r}")
+        self.host = host
+        self.port = port
+        self.cache = CalculationCache(maxsize=cache_size)
+        self.batcher = RequestBatcher(self.cache, precision)
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self._catalog_json = {}
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                start = time.perf_counter()
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    self.write_response(writer, HTTPStatus.BAD_REQUEST, {'error': 'Malformed request line'}, False)
+                    break
+
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    self.write_response(writer, HTTPStatus.BAD_REQUEST, {'error': 'Invalid Content-Length'}, False)
+                    break
+                if length > MAX_BODY_SIZE:
+                    self.write_response(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': 'Body too large'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version != 'HTTP/1.0'
+
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {'error': e.message}
+                except Exception as e:
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"Internal error: {e}"}
+
+                self.write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                self.requests += 1
+                self.latency.observe(time.perf_counter() - start)
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def write_response(self, writer, status, payload, keep_alive):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        query = parse_qs(url.query)
+
+        if path == '/calculate':
+            if method != 'POST':
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, 'Use POST')
+            return HTTPStatus.OK, await self.calculate(body)
+
+        if method != 'GET':
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, 'Use GET')
+
+        if path == '/health':
+            return HTTPStatus.OK, {'status': 'ok'}
+        if path == '/formulas':
+            return HTTPStatus.OK, self.catalog_json(query.get('lang', [DEFAULT_LANGUAGE])[0])
+        if path.startswith('/formulas/'):
+            lang = query.get('lang', [DEFAULT_LANGUAGE])[0]
+            formula = get_formulas(self.check_language(lang)).get(path[len('/formulas/'):])
+            if formula is None:
+                raise HttpError(HTTPStatus.NOT_FOUND, 'Unknown formula')
+            return HTTPStatus.OK, to_plain(formula)
+        if path == '/stats':
+            return HTTPStatus.OK, {
+                'requests': self.requests,
+                'batches': self.batcher.batches,
+                'rows': self.batcher.rows,
+                'cache': self.cache.stats(),
+            }
+        if path == '/latency':
+            return HTTPStatus.OK, self.latency.to_dict()
+
+        raise HttpError(HTTPStatus.NOT_FOUND, 'Not found')
+
+    def check_language(self, lang):
+        if lang not in LANGUAGES:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Unsupported language: {lang}")
+        return lang
+
+    def catalog_json(self, lang):
+        """Katalog dalam bentuk JSON, di-encode sekali per bahasa"""
+        lang = self.check_language(lang)
+        if lang not in self._catalog_json:
+            payload = {'formulas': [to_plain(formula) for formula in get_formulas(lang).values()]}
+            self._catalog_json[lang] = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        return self._catalog_json[lang]
+
+    async def calculate(self, body):
+        try:
+            data = json.loads(body or b'null')
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, 'Invalid JSON')
+
+        if isinstance(data, dict) and 'requests' in data:
+            records = data['requests']
+        else:
+            records = data
+
+        if isinstance(records, dict):
+            records = [records]
+            single = True
+        elif isinstance(records, list):
+            single = False
+        else:
+            raise HttpError(HTTPStatus.BAD_REQUEST, 'Expected an object or a list of objects')
+
+        try:
+            results = await self.batcher.submit(records)
+        except RECORD_ERRORS as e:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid record: {e}")
+        return results[0] if single else {'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m physicalc.server',
+                                     description='Serve physics calculations over HTTP/JSON on loopback.')
+    parser.add_argument('--host', default=DEFAULT_HOST, help="loopback address (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="port (default: 8765)")
+    parser.add_argument('--cache-size', type=int, default=65536, help="result cache entries (default: 65536)")
+    parser.add_argument('--precision', type=int, default=2, help="decimal places in results (default: 2)")
+    args = parser.parse_args(argv)
+
+    server = CalculationServer(args.host, args.port, args.cache_size, args.precision)
+
+    async def run():
+        await server.start()
+        print(f"PhysiCalc server listening on http://{server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,35 @@
+"""
+Helper tampilan untuk aplikasi Kivy
+
+Kivy diimpor di dalam fungsi agar modul ini (dan physicalc.core) bisa diimpor
+tanpa membuka window.
+"""
+
+
+def get_category_color(category):
+    """Mengembalikan warna berdasarkan kategori rumus"""
+    from kivy.utils import get_color_from_hex
+    from app_ui import Colors
+    
+    color_map = {
+        'Kinematics': Colors.PRIMARY,
+        'Dynamics': Colors.SECONDARY,
+        'Energy': get_color_from_hex('#2ecc71'),
+        'Fluid Mechanics': get_color_from_hex('#3498db'),
+        'Properties of Matter': get_color_from_hex('#9b59b6'),
+        'Mechanics': get_color_from_hex('#e74c3c'),
+        'Thermodynamics': get_color_from_hex('#f39c12')
+    }
+    
+    return color_map.get(category, Colors.GRAY)
+
+
+# Karakter yang boleh diketik di input angka: koma/titik desimal, pemisah
+# ribuan, minus unicode, dan eksponen (1,5e-3, 1,5×10⁻³); lihat
+# physicalc.core.validation.parse_number
+NUMBER_INPUT_CHARS = frozenset('0123456789.,+-−eE ×^⁰¹²³⁴⁵⁶⁷⁸⁹⁻')
+
+
+def number_input_filter(substring, from_undo):
+    """input_filter untuk TextInput angka (pengganti input_filter='float')"""
+    return ''.join(char for char in substring if char in NUMBER_INPUT_CHARS)
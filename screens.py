@@ -18,6 +18,7 @@ from kivy.metrics import dp, sp
 from kivy.utils import get_color_from_hex
 from kivy.properties import StringProperty, ListProperty, NumericProperty
 from kivy.clock import Clock
+from kivy.app import App
 
 # Impor data rumus
 from rumus_data import physics_formulas, formula_categories
@@ -331,7 +332,7 @@ class FormulaDetailScreen(Screen):
         self.content_layout.clear_widgets()
         
         # Ambil data rumus
-        formula_data = App.get_running_app().formula_data.get(formula_key, {})
+        formula_data = physics_formulas.get(formula_key, {})
         
         # Atur judul
         self.title_label.text = formula_data.get('title', 'Formula Detail')
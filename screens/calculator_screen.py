@@ -12,18 +12,25 @@ from kivy.uix.textinput import TextInput
 from kivy.uix.dropdown import DropDown
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.graphics import Color, RoundedRectangle, Line
 from kivy.metrics import dp, sp
 from kivy.app import App
 
 from app_ui import Colors, Fonts, Spacing
 from components.buttons import PrimaryButton, OutlineButton
+from components.backgrounds import RoundedBackground
 from components.cards import Card, InfoCard
-from utils import (
-    calculate_velocity, calculate_force, calculate_pressure,
-    calculate_work, calculate_kinetic_energy, calculate_potential_energy,
-    calculate_density, calculate_power, format_result
-)
+from components.live import LiveCalculation
+from physicalc.core.formatting import get_formatter
+from physicalc.core.calculator import get_calculator, get_calculators
+from physicalc.core.engine import DomainError, ResultTooLargeError, ZeroInputError
+from physicalc.core.validation import parse_number
+from physicalc.ui import number_input_filter
+
+# Rumus yang dipilih saat kalkulator dibuka / di-reset
+DEFAULT_FORMULA = 'linear_motion'
+
+# Tinggi satu baris input
+INPUT_ROW_HEIGHT = dp(50)
 
 class CalculatorScreen(Screen):
     """Screen untuk kalkulator rumus fisika"""
@@ -31,6 +38,14 @@ class CalculatorScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'calculator'
+        self.current_formula = DEFAULT_FORMULA
+        
+        # Pool baris input: dipakai ulang (label diganti) saat rumus berganti
+        self.input_rows = []
+        
+        # Hasil dihitung ulang otomatis saat pengguna mengetik
+        self.live = LiveCalculation(self.read_inputs, self.show_live_result, self.clear_result)
+        self.showing_error = False
         
         # Layout utama
         main_layout = BoxLayout(
@@ -49,9 +64,10 @@ class CalculatorScreen(Screen):
         self.add_widget(main_layout)
         
         # State
-        self.current_formula = 'velocity'
+        self.formula_dropdown = None
         self.input_values = {}
         self.result = None
+        self.select_calculator(DEFAULT_FORMULA)
         
         # Animasi saat screen muncul
         Clock.schedule_once(self.animate_entrance, 0.1)
@@ -148,38 +164,24 @@ class CalculatorScreen(Screen):
         
         # Tombol dropdown
         self.formula_btn = Button(
-            text='Velocity (v = s/t)',
+            text='',
             font_size=Fonts.BODY,
             background_color=Colors.WHITE,
             color=Colors.DARK,
             background_normal=''
         )
         
-        # Background untuk tombol dropdown
-        with self.formula_btn.canvas.before:
-            Color(*Colors.GRAY_LIGHT)
-            self.formula_btn.rect = RoundedRectangle(
-                pos=self.formula_btn.pos,
-                size=self.formula_btn.size,
-                radius=[Spacing.RADIUS_MD]
-            )
-        
-        # Border untuk tombol dropdown
-        with self.formula_btn.canvas:
-            Color(*Colors.GRAY)
-            self.formula_btn._border_line = Line(
-                rounded_rectangle=(self.formula_btn.x, self.formula_btn.y,
-                                  self.formula_btn.width, self.formula_btn.height,
-                                  Spacing.RADIUS_MD),
-                width=1
-            )
-        
-        self.formula_btn.bind(
-            pos=self.update_formula_btn_bg,
-            size=self.update_formula_btn_bg,
-            on_press=self.show_formula_dropdown
+        # Background dan border tombol dropdown
+        self.formula_btn.background = RoundedBackground(
+            self.formula_btn,
+            bg_color=Colors.GRAY_LIGHT,
+            border_color=Colors.GRAY,
+            radius=Spacing.RADIUS_MD,
+            border_on_top=True
         )
         
+        self.formula_btn.bind(on_press=self.show_formula_dropdown)
+        
         dropdown_container.add_widget(self.formula_btn)
         picker_layout.add_widget(label)
         picker_layout.add_widget(dropdown_container)
@@ -197,7 +199,7 @@ class CalculatorScreen(Screen):
         
         # Rumus besar
         self.formula_display = Label(
-            text='v = s / t',
+            text='',
             font_size=Fonts.H3,
             bold=True,
             color=Colors.PRIMARY,
@@ -207,7 +209,7 @@ class CalculatorScreen(Screen):
         
         # Deskripsi
         self.formula_desc = Label(
-            text='Velocity = Displacement ÷ Time',
+            text='',
             font_size=Fonts.BODY_SMALL,
             color=Colors.GRAY_DARK,
             size_hint_y=None,
@@ -272,16 +274,16 @@ class CalculatorScreen(Screen):
             height=dp(30)
         )
         
-        # Input fields container
+        # Input fields container (diisi update_input_fields)
         self.input_container = GridLayout(
             cols=2,
             spacing=Spacing.MD,
             size_hint_y=None,
-            height=dp(140)
+            row_default_height=INPUT_ROW_HEIGHT,
+            row_force_default=True
         )
-        
-        # Input fields untuk velocity (default)
-        self.create_velocity_inputs()
+        self.input_container.bind(minimum_height=self.input_container.setter('height'))
+        self.input_container.bind(height=self.update_input_section_height)
         
         section.add_widget(title)
         section.add_widget(self.input_container)
@@ -366,289 +368,30 @@ class CalculatorScreen(Screen):
         """Membuat section informasi"""
         section = InfoCard(
             title='How to Use',
-            content='1. Select a formula from the dropdown\n2. Enter values in the input fields\n3. Click Calculate to get the result',
+            content='1. Select a formula from the dropdown\n2. Enter values in the input fields\n3. The result updates as you type (or click Calculate)',
             icon='💡'
         )
         
         return section
     
-    def create_velocity_inputs(self):
-        """Membuat input fields untuk rumus kecepatan"""
-        self.input_container.clear_widgets()
-        
-        # Displacement
-        displacement_label = Label(
-            text='Displacement (s):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        displacement_label.bind(size=displacement_label.setter('text_size'))
-        
-        self.displacement_input = self.create_number_input('0', 'm')
-        
-        # Time
-        time_label = Label(
-            text='Time (t):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        time_label.bind(size=time_label.setter('text_size'))
-        
-        self.time_input = self.create_number_input('0', 's')
-        
-        self.input_container.add_widget(displacement_label)
-        self.input_container.add_widget(self.displacement_input)
-        self.input_container.add_widget(time_label)
-        self.input_container.add_widget(self.time_input)
-    
-    def create_force_inputs(self):
-        """Membuat input fields untuk rumus gaya"""
-        self.input_container.clear_widgets()
-        
-        # Mass
-        mass_label = Label(
-            text='Mass (m):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        mass_label.bind(size=mass_label.setter('text_size'))
-        
-        self.mass_input = self.create_number_input('0', 'kg')
-        
-        # Acceleration
-        accel_label = Label(
-            text='Acceleration (a):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        accel_label.bind(size=accel_label.setter('text_size'))
-        
-        self.accel_input = self.create_number_input('0', 'm/s²')
-        
-        self.input_container.add_widget(mass_label)
-        self.input_container.add_widget(self.mass_input)
-        self.input_container.add_widget(accel_label)
-        self.input_container.add_widget(self.accel_input)
-    
-    def create_pressure_inputs(self):
-        """Membuat input fields untuk rumus tekanan"""
-        self.input_container.clear_widgets()
-        
-        # Force
-        force_label = Label(
-            text='Force (F):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        force_label.bind(size=force_label.setter('text_size'))
-        
-        self.force_input = self.create_number_input('0', 'N')
-        
-        # Area
-        area_label = Label(
-            text='Area (A):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        area_label.bind(size=area_label.setter('text_size'))
-        
-        self.area_input = self.create_number_input('0', 'm²')
-        
-        self.input_container.add_widget(force_label)
-        self.input_container.add_widget(self.force_input)
-        self.input_container.add_widget(area_label)
-        self.input_container.add_widget(self.area_input)
-    
-    def create_work_inputs(self):
-        """Membuat input fields untuk rumus kerja"""
-        self.input_container.clear_widgets()
-        
-        # Force
-        force_label = Label(
-            text='Force (F):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        force_label.bind(size=force_label.setter('text_size'))
-        
-        self.force_input = self.create_number_input('0', 'N')
-        
-        # Displacement
-        displacement_label = Label(
-            text='Displacement (s):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        displacement_label.bind(size=displacement_label.setter('text_size'))
-        
-        self.displacement_input = self.create_number_input('0', 'm')
-        
-        self.input_container.add_widget(force_label)
-        self.input_container.add_widget(self.force_input)
-        self.input_container.add_widget(displacement_label)
-        self.input_container.add_widget(self.displacement_input)
-    
-    def create_kinetic_energy_inputs(self):
-        """Membuat input fields untuk rumus energi kinetik"""
-        self.input_container.clear_widgets()
-        
-        # Mass
-        mass_label = Label(
-            text='Mass (m):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        mass_label.bind(size=mass_label.setter('text_size'))
-        
-        self.mass_input = self.create_number_input('0', 'kg')
-        
-        # Velocity
-        velocity_label = Label(
-            text='Velocity (v):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        velocity_label.bind(size=velocity_label.setter('text_size'))
-        
-        self.velocity_input = self.create_number_input('0', 'm/s')
-        
-        self.input_container.add_widget(mass_label)
-        self.input_container.add_widget(self.mass_input)
-        self.input_container.add_widget(velocity_label)
-        self.input_container.add_widget(self.velocity_input)
-    
-    def create_potential_energy_inputs(self):
-        """Membuat input fields untuk rumus energi potensial"""
-        self.input_container.clear_widgets()
-        
-        # Mass
-        mass_label = Label(
-            text='Mass (m):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        mass_label.bind(size=mass_label.setter('text_size'))
-        
-        self.mass_input = self.create_number_input('0', 'kg')
-        
-        # Height
-        height_label = Label(
-            text='Height (h):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        height_label.bind(size=height_label.setter('text_size'))
-        
-        self.height_input = self.create_number_input('0', 'm')
-        
-        # Gravity (konstan, 9.8 m/s²)
-        gravity_label = Label(
-            text='Gravity (g):',
+    def create_input_row(self):
+        """Membuat satu baris input (label + input angka) untuk pool"""
+        label = Label(
             font_size=Fonts.BODY,
             color=Colors.DARK,
             halign='right',
             size_hint_x=0.6
         )
-        gravity_label.bind(size=gravity_label.setter('text_size'))
+        label.bind(size=label.setter('text_size'))
         
-        self.gravity_input = self.create_number_input('9.8', 'm/s²')
+        number_input = self.create_number_input('0', '')
+        self.live.watch(number_input.input_field)
         
-        self.input_container.add_widget(mass_label)
-        self.input_container.add_widget(self.mass_input)
-        self.input_container.add_widget(height_label)
-        self.input_container.add_widget(self.height_input)
-        self.input_container.add_widget(gravity_label)
-        self.input_container.add_widget(self.gravity_input)
+        return label, number_input
     
-    def create_density_inputs(self):
-        """Membuat input fields untuk rumus massa jenis"""
-        self.input_container.clear_widgets()
-        
-        # Mass
-        mass_label = Label(
-            text='Mass (m):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        mass_label.bind(size=mass_label.setter('text_size'))
-        
-        self.mass_input = self.create_number_input('0', 'kg')
-        
-        # Volume
-        volume_label = Label(
-            text='Volume (V):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        volume_label.bind(size=volume_label.setter('text_size'))
-        
-        self.volume_input = self.create_number_input('0', 'm³')
-        
-        self.input_container.add_widget(mass_label)
-        self.input_container.add_widget(self.mass_input)
-        self.input_container.add_widget(volume_label)
-        self.input_container.add_widget(self.volume_input)
-    
-    def create_power_inputs(self):
-        """Membuat input fields untuk rumus daya"""
-        self.input_container.clear_widgets()
-        
-        # Work
-        work_label = Label(
-            text='Work (W):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        work_label.bind(size=work_label.setter('text_size'))
-        
-        self.work_input = self.create_number_input('0', 'J')
-        
-        # Time
-        time_label = Label(
-            text='Time (t):',
-            font_size=Fonts.BODY,
-            color=Colors.DARK,
-            halign='right',
-            size_hint_x=0.6
-        )
-        time_label.bind(size=time_label.setter('text_size'))
-        
-        self.time_input = self.create_number_input('0', 's')
-        
-        self.input_container.add_widget(work_label)
-        self.input_container.add_widget(self.work_input)
-        self.input_container.add_widget(time_label)
-        self.input_container.add_widget(self.time_input)
+    def update_input_section_height(self, instance, height):
+        """Menyesuaikan tinggi kartu input dengan jumlah baris"""
+        self.input_section.height = height + dp(30) + Spacing.MD * 3
     
     def create_number_input(self, text, unit):
         """Membuat input field untuk angka"""
@@ -662,33 +405,20 @@ class CalculatorScreen(Screen):
             text=text,
             font_size=Fonts.BODY,
             multiline=False,
-            input_filter='float',
+            input_filter=number_input_filter,
             halign='right',
             size_hint_x=0.7,
             background_normal='',
             background_color=(0, 0, 0, 0)
         )
         
-        # Background
-        with input_field.canvas.before:
-            Color(*Colors.WHITE)
-            input_field.rect = RoundedRectangle(
-                pos=input_field.pos,
-                size=input_field.size,
-                radius=[Spacing.RADIUS_SM]
-            )
-        
-        # Border di canvas yang sama
-        with input_field.canvas.before:
-            Color(*Colors.GRAY_LIGHT)
-            input_field._border_line = Line(
-                rounded_rectangle=(input_field.x, input_field.y,
-                                  input_field.width, input_field.height,
-                                  Spacing.RADIUS_SM),
-                width=1
-            )
-        
-        input_field.bind(pos=self.update_input_bg, size=self.update_input_bg)
+        # Background dan border
+        input_field.background = RoundedBackground(
+            input_field,
+            bg_color=Colors.WHITE,
+            border_color=Colors.GRAY_LIGHT,
+            radius=Spacing.RADIUS_SM
+        )
         
         unit_label = Label(
             text=unit,
@@ -699,27 +429,25 @@ class CalculatorScreen(Screen):
         
         container.add_widget(input_field)
         container.add_widget(unit_label)
+        container.input_field = input_field
+        container.unit_label = unit_label
         
         return container
     
     def show_formula_dropdown(self, instance):
-        """Menampilkan dropdown pemilih rumus"""
+        """Menampilkan dropdown pemilih rumus (dibuat sekali, lalu dipakai ulang)"""
+        if self.formula_dropdown is None:
+            self.formula_dropdown = self.create_formula_dropdown()
+        if self.formula_dropdown.parent is None:  # belum terbuka / sudah selesai ditutup
+            self.formula_dropdown.open(instance)
+    
+    def create_formula_dropdown(self):
+        """Membuat dropdown pemilih rumus dari semua rumus di katalog"""
         dropdown = DropDown()
         
-        formulas = [
-            ('Velocity (v = s/t)', 'velocity'),
-            ('Force (F = m×a)', 'force'),
-            ('Pressure (P = F/A)', 'pressure'),
-            ('Work (W = F×s)', 'work'),
-            ('Kinetic Energy (Ek = ½mv²)', 'kinetic_energy'),
-            ('Potential Energy (Ep = mgh)', 'potential_energy'),
-            ('Density (ρ = m/V)', 'density'),
-            ('Power (P = W/t)', 'power')
-        ]
-        
-        for text, key in formulas:
+        for spec in get_calculators():
             btn = Button(
-                text=text,
+                text=spec.label,
                 size_hint_y=None,
                 height=dp(44),
                 background_color=Colors.WHITE,
@@ -727,235 +455,152 @@ class CalculatorScreen(Screen):
             )
             
             btn.bind(
-                on_release=lambda btn=btn, k=key: self.select_formula(btn.text, k, dropdown)
+                on_release=lambda btn, k=spec.formula_id: self.select_formula(btn.text, k, dropdown)
             )
             
             dropdown.add_widget(btn)
         
-        dropdown.open(instance)
+        return dropdown
     
     def select_formula(self, text, key, dropdown):
         """Memilih rumus dari dropdown"""
-        self.formula_btn.text = text
-        self.current_formula = key
         dropdown.dismiss()
+        self.select_calculator(key)
+    
+    def select_calculator(self, formula_id):
+        """Mengaktifkan kalkulator untuk rumus katalog"""
+        self.current_formula = formula_id
+        self.formula_btn.text = get_calculator(formula_id).label
         
         # Update tampilan berdasarkan rumus
         self.update_formula_display()
         self.update_input_fields()
         self.clear_result()
+        
+        # Nilai default yang baru diisi tidak perlu langsung dihitung
+        self.live.reset(self.read_inputs())
     
     def update_formula_display(self):
         """Update tampilan rumus berdasarkan pilihan"""
-        formulas = {
-            'velocity': ('v = s / t', 'Velocity = Displacement ÷ Time'),
-            'force': ('F = m × a', 'Force = Mass × Acceleration'),
-            'pressure': ('P = F / A', 'Pressure = Force ÷ Area'),
-            'work': ('W = F × s', 'Work = Force × Displacement'),
-            'kinetic_energy': ('Ek = ½ × m × v²', 'Kinetic Energy = ½ × Mass × Velocity²'),
-            'potential_energy': ('Ep = m × g × h', 'Potential Energy = Mass × Gravity × Height'),
-            'density': ('ρ = m / V', 'Density = Mass ÷ Volume'),
-            'power': ('P = W / t', 'Power = Work ÷ Time')
-        }
-        
-        formula, desc = formulas.get(self.current_formula, ('', ''))
-        self.formula_display.text = formula
-        self.formula_desc.text = desc
+        spec = get_calculator(self.current_formula)
+        
+        self.formula_display.text = spec.formula
+        self.formula_desc.text = spec.description
     
     def update_input_fields(self):
-        """Update input fields berdasarkan rumus"""
-        if self.current_formula == 'velocity':
-            self.create_velocity_inputs()
-            self.input_section.height = dp(200)
-        elif self.current_formula == 'force':
-            self.create_force_inputs()
-            self.input_section.height = dp(200)
-        elif self.current_formula == 'pressure':
-            self.create_pressure_inputs()
-            self.input_section.height = dp(200)
-        elif self.current_formula == 'work':
-            self.create_work_inputs()
-            self.input_section.height = dp(200)
-        elif self.current_formula == 'kinetic_energy':
-            self.create_kinetic_energy_inputs()
-            self.input_section.height = dp(200)
-        elif self.current_formula == 'potential_energy':
-            self.create_potential_energy_inputs()
-            self.input_section.height = dp(250)  # Lebih tinggi karena 3 input
-        elif self.current_formula == 'density':
-            self.create_density_inputs()
-            self.input_section.height = dp(200)
-        elif self.current_formula == 'power':
-            self.create_power_inputs()
-            self.input_section.height = dp(200)
+        """
+        Menampilkan satu baris input untuk setiap variabel masukan rumus
+        
+        Baris diambil dari pool self.input_rows dan hanya diganti label,
+        satuan, dan nilainya; baris baru dibuat hanya jika pool kurang.
+        """
+        fields = get_calculator(self.current_formula).fields
+        
+        while len(self.input_rows) < len(fields):
+            self.input_rows.append(self.create_input_row())
+        
+        for (label, number_input), field in zip(self.input_rows, fields):
+            label.text = f"{field.name} ({field.symbol}):"
+            number_input.unit_label.text = field.unit
+            number_input.input_field.text = field.default
+        
+        # Pasang hanya baris yang dipakai, sesuai urutan variabel
+        visible = self.input_rows[:len(fields)]
+        shown = [widget for row in visible for widget in row]
+        if list(reversed(self.input_container.children)) != shown:
+            self.input_container.clear_widgets()
+            for widget in shown:
+                self.input_container.add_widget(widget)
     
     def calculate(self, instance):
         """Melakukan perhitungan berdasarkan rumus"""
+        spec = get_calculator(self.current_formula)
+
         try:
-            if self.current_formula == 'velocity':
-                # Dapatkan nilai dari input fields
-                s_text = self.displacement_input.children[0].text
-                t_text = self.time_input.children[0].text
-                
-                # Validasi input
-                if not s_text or not t_text:
-                    self.show_error("Please enter both values")
-                    return
-                
-                s = float(s_text)
-                t = float(t_text)
-                
-                if t == 0:
-                    self.show_error("Time cannot be zero")
-                    return
-                
-                result, _ = calculate_velocity(s, t)
-                self.show_result(result, 'm/s')
-                
-            elif self.current_formula == 'force':
-                # Dapatkan nilai dari input fields
-                m_text = self.mass_input.children[0].text
-                a_text = self.accel_input.children[0].text
-                
-                if not m_text or not a_text:
-                    self.show_error("Please enter both values")
-                    return
-                
-                m = float(m_text)
-                a = float(a_text)
-                
-                result, _ = calculate_force(m, a)
-                self.show_result(result, 'N')
-            
-            elif self.current_formula == 'pressure':
-                f_text = self.force_input.children[0].text
-                a_text = self.area_input.children[0].text
-                
-                if not f_text or not a_text:
-                    self.show_error("Please enter both values")
-                    return
-                
-                f = float(f_text)
-                a = float(a_text)
-                
-                if a == 0:
-                    self.show_error("Area cannot be zero")
-                    return
-                
-                result, _ = calculate_pressure(f, a)
-                self.show_result(result, 'Pa')
-            
-            elif self.current_formula == 'work':
-                f_text = self.force_input.children[0].text
-                s_text = self.displacement_input.children[0].text
-                
-                if not f_text or not s_text:
-                    self.show_error("Please enter both values")
-                    return
-                
-                f = float(f_text)
-                s = float(s_text)
-                
-                result, _ = calculate_work(f, s)
-                self.show_result(result, 'J')
-            
-            elif self.current_formula == 'kinetic_energy':
-                m_text = self.mass_input.children[0].text
-                v_text = self.velocity_input.children[0].text
-                
-                if not m_text or not v_text:
-                    self.show_error("Please enter both values")
-                    return
-                
-                m = float(m_text)
-                v = float(v_text)
-                
-                result, _ = calculate_kinetic_energy(m, v)
-                self.show_result(result, 'J')
-            
-            elif self.current_formula == 'potential_energy':
-                m_text = self.mass_input.children[0].text
-                h_text = self.height_input.children[0].text
-                g_text = self.gravity_input.children[0].text
-                
-                if not m_text or not h_text or not g_text:
-                    self.show_error("Please enter all values")
-                    return
-                
-                m = float(m_text)
-                h = float(h_text)
-                g = float(g_text)
-                
-                result, _ = calculate_potential_energy(m, g, h)
-                self.show_result(result, 'J')
-            
-            elif self.current_formula == 'density':
-                m_text = self.mass_input.children[0].text
-                v_text = self.volume_input.children[0].text
-                
-                if not m_text or not v_text:
-                    self.show_error("Please enter both values")
-                    return
-                
-                m = float(m_text)
-                v = float(v_text)
-                
-                if v == 0:
-                    self.show_error("Volume cannot be zero")
-                    return
-                
-                result, _ = calculate_density(m, v)
-                self.show_result(result, 'kg/m³')
-            
-            elif self.current_formula == 'power':
-                w_text = self.work_input.children[0].text
-                t_text = self.time_input.children[0].text
-                
-                if not w_text or not t_text:
-                    self.show_error("Please enter both values")
-                    return
-                
-                w = float(w_text)
-                t = float(t_text)
-                
-                if t == 0:
-                    self.show_error("Time cannot be zero")
-                    return
-                
-                result, _ = calculate_power(w, t)
-                self.show_result(result, 'W')
-            
+            texts = {
+                field.symbol: number_input.input_field.text
+                for (label, number_input), field in zip(self.input_rows, spec.fields)
+            }
+
+            if not all(texts.values()):
+                self.show_error("Please enter both values" if len(texts) == 2 else "Please enter all values")
+                return
+
+            values = {symbol: parse_number(text) for symbol, text in texts.items()}
+            self.live.reset(values)
+            result = spec.evaluate(values)
+            self.show_result(result, spec.unit)
+
+        except ZeroInputError as e:
+            self.show_error(f"{spec.name_of(e.symbol, 'Divisor')} cannot be zero")
+        except DomainError:
+            self.show_error("No real result for these values")
+        except ResultTooLargeError:
+            self.show_error("Result is too large")
         except ValueError:
             self.show_error("Please enter valid numbers")
         except Exception as e:
             self.show_error(f"Calculation error: {str(e)}")
     
-    def show_result(self, value, unit):
-        """Menampilkan hasil perhitungan"""
+    def read_inputs(self):
+        """Nilai input rumus aktif {simbol: angka}, atau None jika ada yang kosong/tidak valid"""
+        values = {}
+        fields = get_calculator(self.current_formula).fields
+        for (label, number_input), field in zip(self.input_rows, fields):
+            try:
+                values[field.symbol] = parse_number(number_input.input_field.text)
+            except ValueError:
+                return None
+        return values
+    
+    def show_live_result(self, values):
+        """Menampilkan hasil perhitungan otomatis (tanpa animasi)"""
+        spec = get_calculator(self.current_formula)
+        try:
+            self.show_result(spec.evaluate(values), spec.unit, animate=False)
+        except ZeroInputError as e:
+            self.show_error(f"{spec.name_of(e.symbol, 'Divisor')} cannot be zero", animate=False)
+        except DomainError:
+            self.show_error("No real result for these values", animate=False)
+        except ResultTooLargeError:
+            self.show_error("Result is too large", animate=False)
+        except (ValueError, ArithmeticError) as e:
+            self.show_error(f"Calculation error: {str(e)}", animate=False)
+    
+    def show_result(self, value, unit, animate=True):
+        """
+        Menampilkan hasil perhitungan
+        
+        Tanpa animate (hasil otomatis saat mengetik) hanya teks yang diganti,
+        agar animasi warna tidak diulang di setiap ketikan.
+        """
         if value is None:
-            self.show_error("Calculation error")
+            self.show_error("Calculation error", animate)
             return
         
-        formatted = format_result(value, unit, 2)
-        # Pisahkan angka dan unit
-        parts = formatted.split()
-        if len(parts) >= 2:
-            self.result_label.text = parts[0]
-            self.unit_label.text = ' '.join(parts[1:])
-        else:
-            self.result_label.text = formatted
-            self.unit_label.text = unit
+        formatted = get_formatter(2).parts(value, unit)
+        self.result_label.text = formatted.number
+        self.unit_label.text = formatted.unit
         
         # Animasi
-        self.result_label.color = Colors.SUCCESS
-        anim = Animation(color=Colors.PRIMARY, duration=1.5)
-        anim.start(self.result_label)
+        if animate:
+            self.result_label.color = Colors.SUCCESS
+            anim = Animation(color=Colors.PRIMARY, duration=1.5)
+            anim.start(self.result_label)
+        elif self.showing_error:
+            self.result_label.color = Colors.PRIMARY
+        self.showing_error = False
     
-    def show_error(self, message):
+    def show_error(self, message, animate=True):
         """Menampilkan error"""
         self.result_label.text = 'Error'
         self.unit_label.text = message
+        Animation.cancel_all(self.result_label, 'color')
         self.result_label.color = Colors.DANGER
+        self.showing_error = True
+        
+        if not animate:
+            return
         
         # Animasi
         anim = Animation(opacity=0.5, duration=0.1) + Animation(opacity=1, duration=0.1)
@@ -968,62 +613,20 @@ class CalculatorScreen(Screen):
         self.result_label.text = '--'
         self.unit_label.text = ''
         self.result_label.color = Colors.PRIMARY
+        self.showing_error = False
     
     def clear_inputs(self, instance):
-        """Membersihkan semua input"""
-        # Clear berdasarkan rumus yang aktif
-        if self.current_formula == 'velocity':
-            if hasattr(self, 'displacement_input'):
-                self.displacement_input.children[0].text = '0'
-            if hasattr(self, 'time_input'):
-                self.time_input.children[0].text = '0'
-        elif self.current_formula == 'force':
-            if hasattr(self, 'mass_input'):
-                self.mass_input.children[0].text = '0'
-            if hasattr(self, 'accel_input'):
-                self.accel_input.children[0].text = '0'
-        elif self.current_formula == 'pressure':
-            if hasattr(self, 'force_input'):
-                self.force_input.children[0].text = '0'
-            if hasattr(self, 'area_input'):
-                self.area_input.children[0].text = '0'
-        elif self.current_formula == 'work':
-            if hasattr(self, 'force_input'):
-                self.force_input.children[0].text = '0'
-            if hasattr(self, 'displacement_input'):
-                self.displacement_input.children[0].text = '0'
-        elif self.current_formula == 'kinetic_energy':
-            if hasattr(self, 'mass_input'):
-                self.mass_input.children[0].text = '0'
-            if hasattr(self, 'velocity_input'):
-                self.velocity_input.children[0].text = '0'
-        elif self.current_formula == 'potential_energy':
-            if hasattr(self, 'mass_input'):
-                self.mass_input.children[0].text = '0'
-            if hasattr(self, 'height_input'):
-                self.height_input.children[0].text = '0'
-            if hasattr(self, 'gravity_input'):
-                self.gravity_input.children[0].text = '9.8'
-        elif self.current_formula == 'density':
-            if hasattr(self, 'mass_input'):
-                self.mass_input.children[0].text = '0'
-            if hasattr(self, 'volume_input'):
-                self.volume_input.children[0].text = '0'
-        elif self.current_formula == 'power':
-            if hasattr(self, 'work_input'):
-                self.work_input.children[0].text = '0'
-            if hasattr(self, 'time_input'):
-                self.time_input.children[0].text = '0'
+        """Mengembalikan semua input ke nilai default rumus (misalnya g = 9.8)"""
+        fields = get_calculator(self.current_formula).fields
+        for (label, number_input), field in zip(self.input_rows, fields):
+            number_input.input_field.text = field.default
         
         self.clear_result()
+        self.live.reset(self.read_inputs())
     
     def reset_calculator(self, instance):
         """Reset kalkulator ke default"""
-        self.current_formula = 'velocity'
-        self.formula_btn.text = 'Velocity (v = s/t)'
-        self.update_formula_display()
-        self.update_input_fields()
-        self.clear_inputs(instance)
+        self.select_calculator(DEFAULT_FORMULA)
     
     def go_back(self, instance):
         """Kembali ke home screen"""
@@ -1042,24 +645,3 @@ class CalculatorScreen(Screen):
             lambda dt, a=anim, c=child: a.start(c),
             i * 0.08   # jeda antar widget
         )
-
-    # Update background functions
-    def update_formula_btn_bg(self, instance, value):
-        """Update background formula button"""
-        if hasattr(instance, 'rect'):
-            instance.rect.pos = instance.pos
-            instance.rect.size = instance.size
-        if hasattr(instance, '_border_line'):
-            instance._border_line.rounded_rectangle = (instance.x, instance.y,
-                                                instance.width, instance.height,
-                                                Spacing.RADIUS_MD)
-    
-    def update_input_bg(self, instance, value):
-        """Update background input field"""
-        if hasattr(instance, 'rect'):
-            instance.rect.pos = instance.pos
-            instance.rect.size = instance.size
-        if hasattr(instance, '_border_line'):
-            instance._border_line.rounded_rectangle = (instance.x, instance.y,
-                                                instance.width, instance.height,
-                                                Spacing.RADIUS_SM)
\ No newline at end of file
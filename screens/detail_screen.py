@@ -4,7 +4,6 @@ Screen untuk menampilkan detail rumus fisika
 
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.scrollview import ScrollView
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.image import Image
@@ -16,10 +15,16 @@ from kivy.metrics import dp, sp
 from app_ui import Colors, Fonts, Spacing
 from components.buttons import PrimaryButton, OutlineButton, IconButton
 from components.cards import Card, InfoCard
+from components.scroll import StableScrollView
+from components.view_cache import ViewCache
+from data.formulas import physics_formulas
 
 class DetailScreen(Screen):
     """Screen untuk menampilkan detail lengkap rumus"""
     
+    # Jumlah rumus yang kartunya disimpan untuk dibuka ulang
+    VIEW_CACHE_SIZE = 8
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'detail'
@@ -34,21 +39,14 @@ class DetailScreen(Screen):
         self.header = self.create_header()
         self.main_layout.add_widget(self.header)
         
-        # Konten (akan diisi dinamis)
-        self.content_scroll = ScrollView(
+        # Konten (diisi container per rumus dari view_cache)
+        self.content_scroll = StableScrollView(
             do_scroll_x=False,
             bar_width=dp(4)
         )
+        self.view_cache = ViewCache(maxsize=self.VIEW_CACHE_SIZE)
+        self.content_container = None
         
-        self.content_container = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            padding=[Spacing.MD, Spacing.MD, Spacing.MD, Spacing.XL],
-            spacing=Spacing.MD
-        )
-        self.content_container.bind(minimum_height=self.content_container.setter('height'))
-        
-        self.content_scroll.add_widget(self.content_container)
         self.main_layout.add_widget(self.content_scroll)
         
         self.add_widget(self.main_layout)
@@ -126,51 +124,67 @@ class DetailScreen(Screen):
     
     def display_formula(self, formula_key):
         """Menampilkan detail rumus berdasarkan kunci"""
-        # Hapus konten sebelumnya
-        self.content_container.clear_widgets()
-        
-        # Dapatkan data rumus
-        app = self.manager.app
-        formula_data = app.formula_data.get(formula_key, {})
+        # Dapatkan data rumus dari katalog terpadu
+        formula_data = physics_formulas.get(formula_key, {})
         self.current_formula = formula_data
         
         # Update header
         self.title_label.text = formula_data.get('title', 'Formula Detail')
         self.subtitle_label.text = formula_data.get('category', '')
         
+        # Kartu rumus yang pernah dibuka diambil dari cache, bukan dibangun ulang
+        container = self.view_cache.get_or_build(formula_key, self.create_content)
+        if container is not self.content_container:
+            self.content_scroll.clear_widgets()
+            self.content_scroll.add_widget(container)
+            self.content_container = container
+        
         # Animasi fade in
-        self.content_container.opacity = 0
+        Animation.cancel_all(container, 'opacity')
+        container.opacity = 0
+        anim = Animation(opacity=1, duration=0.5)
+        anim.start(container)
+        
+        # Scroll ke atas
+        Clock.schedule_once(lambda dt: setattr(self.content_scroll, 'scroll_y', 1), 0.1)
+    
+    def create_content(self, formula_key):
+        """Membuat container berisi semua kartu untuk satu rumus"""
+        formula_data = physics_formulas.get(formula_key, {})
+        
+        container = BoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            padding=[Spacing.MD, Spacing.MD, Spacing.MD, Spacing.XL],
+            spacing=Spacing.MD
+        )
+        container.bind(minimum_height=container.setter('height'))
         
         # 1. Kartu rumus utama
         formula_card = self.create_formula_card(formula_data)
-        self.content_container.add_widget(formula_card)
+        container.add_widget(formula_card)
         
         # 2. Kartu deskripsi
         desc_card = self.create_description_card(formula_data)
-        self.content_container.add_widget(desc_card)
+        container.add_widget(desc_card)
         
         # 3. Kartu variabel
         variables_card = self.create_variables_card(formula_data)
-        self.content_container.add_widget(variables_card)
+        container.add_widget(variables_card)
         
         # 4. Kartu contoh
         example_card = self.create_example_card(formula_data)
-        self.content_container.add_widget(example_card)
+        container.add_widget(example_card)
         
         # 5. Kartu info tambahan
         info_card = self.create_info_card(formula_data)
-        self.content_container.add_widget(info_card)
+        container.add_widget(info_card)
         
         # 6. Tombol aksi
         action_buttons = self.create_action_buttons(formula_key)
-        self.content_container.add_widget(action_buttons)
-        
-        # Animasi fade in
-        anim = Animation(opacity=1, duration=0.5)
-        anim.start(self.content_container)
+        container.add_widget(action_buttons)
         
-        # Scroll ke atas
-        Clock.schedule_once(lambda dt: self.content_scroll.scroll_y(1), 0.1)
+        return container
     
     def create_formula_card(self, formula_data):
         """Membuat kartu untuk menampilkan rumus utama"""
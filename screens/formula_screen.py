@@ -2,32 +2,54 @@
 Screen untuk menampilkan daftar rumus fisika
 """
 
+from time import perf_counter
+
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.textinput import TextInput
-from kivy.uix.widget import Widget
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.graphics import Color, RoundedRectangle, Line
+from kivy.graphics import Color, RoundedRectangle
 from kivy.metrics import dp
 from kivy.app import App
+from kivy.logger import Logger
 
 from app_ui import Colors, Fonts, Spacing
-from components.cards import FormulaCard, InfoCard
+from components.backgrounds import RoundedBackground
+from components.cards import InfoCard
+from components.lists import CardList
 from data.formulas import physics_formulas, formula_categories
+from physicalc.core.search import SearchSession
 
 
 class FormulaScreen(Screen):
-    """Screen untuk menampilkan daftar semua rumus"""
+    """
+    Screen untuk menampilkan daftar semua rumus
+
+    Baris daftar setiap kategori dibangun sekali lalu disimpan; tab "All"
+    disusun dari baris kategori yang sama. Mengganti tab hanya menukar data
+    daftar. Event on_tab_switch(category, swap_ms, frame_ms) dikirim setelah
+    frame berikutnya, untuk mengukur latensi pergantian tab.
+    """
+
+    __events__ = ('on_tab_switch',)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'formulas'
 
+        # Cache baris daftar: per rumus, per kategori, dan gabungan "all"
+        self.formula_rows = {}
+        self.category_rows = {}
+        self.active_category = 'all'
+        self.tab_buttons = {}
+
+        # Pencarian bertahap: hasil query sebelumnya disaring di setiap ketikan
+        self.search = SearchSession()
+
         # Layout utama
         main_layout = BoxLayout(
             orientation='vertical',
@@ -92,6 +114,7 @@ class FormulaScreen(Screen):
             background_color=(0, 0, 0, 0),
             color=Colors.DARK
         )
+        search_btn.bind(on_press=self.focus_search)
 
         top_bar.add_widget(back_btn)
         top_bar.add_widget(title_label)
@@ -104,7 +127,7 @@ class FormulaScreen(Screen):
             spacing=Spacing.SM
         )
 
-        search_input = TextInput(
+        self.search_input = search_input = TextInput(
             hint_text='Search formulas...',
             font_size=Fonts.BODY,
             multiline=False,
@@ -116,30 +139,15 @@ class FormulaScreen(Screen):
             foreground_color=Colors.DARK
         )
 
-        # Background search box
-        with search_input.canvas.before:
-            Color(*Colors.WHITE)
-            search_input.rect = RoundedRectangle(
-                pos=search_input.pos,
-                size=search_input.size,
-                radius=[Spacing.RADIUS_MD]
-            )
-
-        # Border search box
-        with search_input.canvas.after:
-            Color(*Colors.GRAY_LIGHT)
-            search_input._border_line = Line(
-                rounded_rectangle=(
-                    search_input.x,
-                    search_input.y,
-                    search_input.width,
-                    search_input.height,
-                    Spacing.RADIUS_MD
-                ),
-                width=1
-            )
-
-        search_input.bind(pos=self.update_search_bg, size=self.update_search_bg)
+        # Background dan border search box
+        search_input.background = RoundedBackground(
+            search_input,
+            bg_color=Colors.WHITE,
+            border_color=Colors.GRAY_LIGHT,
+            radius=Spacing.RADIUS_MD,
+            border_on_top=True
+        )
+        search_input.bind(text=self.on_search_text)
 
         # ---------- Filter Button ----------
         filter_btn = Button(
@@ -194,11 +202,13 @@ class FormulaScreen(Screen):
         all_tab = self.create_tab_button("All", True)
         all_tab.bind(on_press=lambda x: self.filter_formulas("all"))
         inner.add_widget(all_tab)
+        self.tab_buttons['all'] = all_tab
 
         for cat in formula_categories.keys():
             tab = self.create_tab_button(cat, False)
             tab.bind(on_press=lambda x, c=cat: self.filter_formulas(c))
             inner.add_widget(tab)
+            self.tab_buttons[cat] = tab
 
         scroll.add_widget(inner)
         return scroll
@@ -222,7 +232,7 @@ class FormulaScreen(Screen):
             btn.color = Colors.GRAY_DARK
 
         with btn.canvas.before:
-            Color(*bg)
+            btn.bg_color = Color(*bg)
             btn.rect = RoundedRectangle(
                 pos=btn.pos,
                 size=btn.size,
@@ -232,95 +242,140 @@ class FormulaScreen(Screen):
         btn.bind(pos=self.update_tab_bg, size=self.update_tab_bg)
         return btn
 
+    def set_active_tab(self, category):
+        """Mewarnai tab aktif, tab lain kembali abu-abu"""
+        for key, btn in self.tab_buttons.items():
+            active = key == category
+            btn.bg_color.rgba = Colors.PRIMARY if active else Colors.GRAY_LIGHT
+            btn.color = Colors.WHITE if active else Colors.GRAY_DARK
+
     # ========================= CONTENT ==============================
 
     def create_content(self):
-        scroll = ScrollView(do_scroll_x=False, bar_width=dp(4))
-
-        self.formulas_container = GridLayout(
-            cols=1,
-            spacing=Spacing.MD,
-            size_hint_y=None,
-            padding=[Spacing.MD, Spacing.MD, Spacing.MD, Spacing.XL]
-        )
-        self.formulas_container.bind(
-            minimum_height=self.formulas_container.setter("height")
+        content = BoxLayout(
+            orientation='vertical',
+            spacing=Spacing.SM,
+            padding=[Spacing.MD, Spacing.SM, Spacing.MD, 0]
         )
 
         info = InfoCard(
             title=f"Total {len(physics_formulas)} Formulas",
             content="Tap on any formula to see detailed explanation",
-            icon="📚"
+            icon="📚",
+            size_hint_y=None,
+            height=dp(80)
         )
-        self.formulas_container.add_widget(info)
+        content.add_widget(info)
 
-        self.display_all_formulas()
+        # Daftar tervirtualisasi: hanya kartu yang terlihat yang dibuat
+        self.formula_list = CardList(
+            viewclass='FormulaCardView',
+            item_height=dp(120),
+            padding=[0, Spacing.SM, 0, Spacing.XL]
+        )
+        self.formula_list.bind(on_item_press=self.on_formula_press)
+        content.add_widget(self.formula_list)
+
+        self.show_rows()
+
+        return content
+
+    def rows_for(self, category):
+        """
+        Baris daftar untuk satu kategori (atau 'all'), dibangun sekali
+
+        Baris kategori berisi judul kategori diikuti rumus-rumusnya; 'all'
+        menggabungkan baris semua kategori yang sudah ada di cache.
+        """
+        rows = self.category_rows.get(category)
+        if rows is None:
+            if category == 'all':
+                rows = [row for key in formula_categories for row in self.rows_for(key)]
+            else:
+                formula_keys = formula_categories.get(category, ())
+                rows = [CardList.row(
+                    'SectionHeaderView', dp(50),
+                    title=category,
+                    count=f"{len(formula_keys)}"
+                )]
+                rows.extend(self.formula_row(key) for key in formula_keys)
+            self.category_rows[category] = rows
+        return rows
+
+    def formula_row(self, key):
+        """Satu baris kartu rumus (dibangun sekali, dipakai bersama semua daftar)"""
+        row = self.formula_rows.get(key)
+        if row is None:
+            data = physics_formulas.get(key, {})
+            row = self.formula_rows[key] = CardList.row(
+                'FormulaCardView', dp(120),
+                title=data.get("title", ""),
+                formula=data.get("formula", ""),
+                category=data.get("category", ""),
+                formula_key=key
+            )
+        return row
 
-        scroll.add_widget(self.formulas_container)
-        return scroll
+    def build_search_rows(self, formula_keys):
+        """Baris hasil pencarian, terurut dari yang paling relevan"""
+        title = "Search Results" if formula_keys else "No formulas found"
+        rows = [CardList.row('SectionHeaderView', dp(50), title=title, count=f"{len(formula_keys)}")]
+        rows.extend(self.formula_row(key) for key in formula_keys if key in physics_formulas)
+        return rows
 
     def display_all_formulas(self):
-        # Hapus selain info card
-        if len(self.formulas_container.children) > 1:
-            for child in self.formulas_container.children[1:]:
-                self.formulas_container.remove_widget(child)
-
-        for category, formula_keys in formula_categories.items():
-            header = BoxLayout(
-                size_hint_y=None,
-                height=dp(50),
-                spacing=Spacing.SM
-            )
+        self.filter_formulas('all')
 
-            line = Widget(size_hint_x=None, width=dp(4))
-            with line.canvas:
-                Color(*Colors.PRIMARY)
-                line.rect = RoundedRectangle(
-                    pos=line.pos,
-                    size=line.size,
-                    radius=[dp(2)]
-                )
-            line.bind(pos=self.update_line_bg, size=self.update_line_bg)
-
-            label = Label(
-                text=category,
-                font_size=Fonts.H4,
-                bold=True,
-                color=Colors.DARK,
-                size_hint_x=1,
-                halign='left'
-            )
-            label.bind(size=label.setter("text_size"))
-
-            count = Label(
-                text=f"{len(formula_keys)}",
-                font_size=Fonts.BODY_SMALL,
-                color=Colors.GRAY,
-                size_hint_x=None,
-                width=dp(40)
-            )
+    def show_rows(self):
+        """Menampilkan kategori aktif, atau hasil pencarian di kategori itu"""
+        query = self.search_input.text
+        if not query.strip():
+            self.formula_list.data = self.rows_for(self.active_category)
+            return
+
+        formula_keys = self.search.search(query)
+        if self.active_category != 'all':
+            in_category = set(formula_categories.get(self.active_category, ()))
+            formula_keys = [key for key in formula_keys if key in in_category]
+        self.formula_list.data = self.build_search_rows(formula_keys)
 
-            header.add_widget(line)
-            header.add_widget(label)
-            header.add_widget(count)
+    def on_formula_press(self, instance, index, data):
+        if 'formula_key' in data:
+            self.show_formula_detail(data['formula_key'])
 
-            self.formulas_container.add_widget(header)
+    # ========================= SEARCH ==============================
 
-            for key in formula_keys:
-                data = physics_formulas.get(key, {})
-                card = FormulaCard(
-                    title=data.get("title", ""),
-                    formula=data.get("formula", ""),
-                    category=data.get("category", ""),
-                    on_press=lambda x, k=key: self.show_formula_detail(k)
-                )
-                self.formulas_container.add_widget(card)
+    def on_search_text(self, instance, text):
+        """Memperbarui daftar di setiap ketikan"""
+        if not text.strip():
+            self.search.reset()
+        self.show_rows()
+
+    def focus_search(self, instance):
+        self.search_input.focus = True
 
     # ========================= ACTIONS ==============================
 
     def filter_formulas(self, category):
-        print("Filter:", category)
-        self.display_all_formulas()
+        """Berpindah tab kategori; data daftar diambil dari cache"""
+        started = perf_counter()
+        self.active_category = category
+        self.set_active_tab(category)
+        self.show_rows()
+        self.formula_list.scroll_y = 1
+        swapped = perf_counter()
+
+        # Frame berikutnya sudah memuat layout daftar yang baru
+        Clock.schedule_once(lambda dt: self.report_tab_switch(category, started, swapped), 0)
+
+    def report_tab_switch(self, category, started, swapped):
+        frame_ms = (perf_counter() - started) * 1000
+        swap_ms = (swapped - started) * 1000
+        Logger.debug(f"FormulaScreen: tab '{category}' swap {swap_ms:.2f} ms, next frame {frame_ms:.2f} ms")
+        self.dispatch('on_tab_switch', category, swap_ms, frame_ms)
+
+    def on_tab_switch(self, category, swap_ms, frame_ms):
+        pass
 
     def show_formula_detail(self, key):
         App.get_running_app().show_formula_detail(key)
@@ -329,35 +384,12 @@ class FormulaScreen(Screen):
         self.manager.current = 'home'
 
     def animate_entrance(self, dt):
-    # Set semua widget jadi transparan dulu
-     for child in self.formulas_container.children:
-        if hasattr(child, "opacity"):
-            child.opacity = 0
-
-    # Lalu animasikan satu-satu dengan jeda
-     for i, child in enumerate(reversed(self.formulas_container.children)):
-        anim = Animation(opacity=1, duration=0.3)
-
-        Clock.schedule_once(
-            lambda t, a=anim, c=child: a.start(c),
-            i * 0.05
-        )
-
+        # Kartu dibuat ulang oleh RecycleView, jadi yang dianimasikan daftarnya
+        self.formula_list.opacity = 0
+        Animation(opacity=1, duration=0.3).start(self.formula_list)
 
     # ========================= UPDATE BACKGROUND ==============================
 
-    def update_search_bg(self, instance, value):
-      instance.rect.pos = instance.pos
-      instance.rect.size = instance.size
-      instance._border_line.rounded_rectangle = (
-          instance.x,
-           instance.y,
-         instance.width,
-           instance.height,
-          Spacing.RADIUS_MD
-        )
-
-
     def update_filter_bg(self, instance, value):
         instance.rect.pos = instance.pos
         instance.rect.size = instance.size
@@ -366,6 +398,3 @@ class FormulaScreen(Screen):
         instance.rect.pos = instance.pos
         instance.rect.size = instance.size
 
-    def update_line_bg(self, instance, value):
-        instance.rect.pos = instance.pos
-        instance.rect.size = instance.size